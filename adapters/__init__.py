@@ -14,8 +14,7 @@ Available adapters:
 - bandwidth: Bandwidth Communications
 """
 
-# Import all adapters for convenient access
-from . import asterisk, bandwidth, freeswitch, telnyx, twilio
+import importlib
 
 __all__ = [
     "twilio",
@@ -24,3 +23,14 @@ __all__ = [
     "telnyx",
     "bandwidth",
 ]
+
+
+def __getattr__(name: str):
+    """Import adapters on first access.
+
+    Loading one adapter (e.g. ``adapters.twilio``) then does not pull in
+    every other platform's dependencies.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 """Asterisk adapter for vCon telephony adapters."""
 
 from .builder import AsteriskRecordingData, AsteriskVconBuilder
-from .config import AsteriskConfig
+from .config import AsteriskConfig, get_config
 from .webhook import create_app
 
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "AsteriskRecordingData",
     "AsteriskVconBuilder",
     "create_app",
+    "get_config",
 ]
@@ -1,17 +1,26 @@
 """vCon builder for Asterisk recordings."""
 
 import logging
+import mmap
 import os
+import re
 from datetime import datetime, timezone
 from typing import Any
 
 import requests
 from requests.auth import HTTPBasicAuth
 
-from core.base_builder import BaseRecordingData, BaseVconBuilder
+from core.base_builder import AudioData, BaseRecordingData, BaseVconBuilder, parse_iso_timestamp
+from core.http import DOWNLOAD_TIMEOUT, get_session, read_content
 
 logger = logging.getLogger(__name__)
 
+# Dialplan contexts that indicate an outbound call
+_OUTBOUND_CONTEXT_RE = re.compile(r"outbound|from-internal", re.IGNORECASE)
+
+# Process-wide session shared with the conserver poster
+_SESSION = get_session()
+
 
 class AsteriskRecordingData(BaseRecordingData):
     """Recording data from Asterisk ARI/AMI event.
@@ -34,33 +43,85 @@ class AsteriskRecordingData(BaseRecordingData):
     - timestamp: Event timestamp
     """
 
+    __slots__ = (
+        "_data",
+        "_recording_id",
+        "_from_number",
+        "_to_number",
+        "_direction",
+        "_recording_url",
+        "_recording_file_path",
+        "_platform_tags",
+        "_start_time",
+    )
+
     def __init__(self, event_data: dict[str, Any]):
         """Initialize from Asterisk event data.
 
+        Fields with ARI/AMI fallbacks and the platform tags are
+        resolved once here rather than on every property access.
+
         Args:
             event_data: Dictionary of Asterisk ARI/AMI event data
         """
-        self._data = event_data
+        data = event_data
+        self._data = data
+
+        self._recording_id = data.get("recording_name", data.get("name", data.get("Uniqueid", "")))
+        self._from_number = data.get("caller_id_num", data.get("CallerIDNum", ""))
+        self._to_number = data.get(
+            "connected_line_num", data.get("ConnectedLineNum", data.get("extension", ""))
+        )
+
+        # Events may carry null or non-string values; treat those as missing
+        direction = data.get("direction")
+        context = data.get("context")
+        if isinstance(direction, str) and direction:
+            self._direction = direction.lower()
+        elif isinstance(context, str) and _OUTBOUND_CONTEXT_RE.search(context):
+            # Infer from channel context
+            self._direction = "outbound"
+        else:
+            self._direction = "inbound"
+
+        self._recording_url = data.get("target_uri") or data.get("recording_url") or ""
+
+        target_uri = data.get("target_uri")
+        if isinstance(target_uri, str) and target_uri.startswith("file:"):
+            self._recording_file_path = target_uri.replace("file:", "")
+        else:
+            self._recording_file_path = self._recording_id or None
+
+        tags = {
+            "asterisk_recording_name": self._recording_id,
+        }
+        if data.get("channel_id"):
+            tags["asterisk_channel_id"] = data["channel_id"]
+        if data.get("Uniqueid"):
+            tags["asterisk_unique_id"] = data["Uniqueid"]
+        if data.get("caller_id_name"):
+            tags["caller_name"] = data["caller_id_name"]
+        if data.get("context"):
+            tags["asterisk_context"] = data["context"]
+        if data.get("application"):
+            tags["asterisk_application"] = data["application"]
+        self._platform_tags = tags
+        self._start_time = self._parse_start_time()
 
     @property
     def recording_id(self) -> str:
         """Asterisk recording name/ID."""
-        return self._data.get(
-            "recording_name", self._data.get("name", self._data.get("Uniqueid", ""))
-        )
+        return self._recording_id
 
     @property
     def from_number(self) -> str:
         """Caller's phone number."""
-        return self._data.get("caller_id_num", self._data.get("CallerIDNum", ""))
+        return self._from_number
 
     @property
     def to_number(self) -> str:
         """Called phone number."""
-        return self._data.get(
-            "connected_line_num",
-            self._data.get("ConnectedLineNum", self._data.get("extension", "")),
-        )
+        return self._to_number
 
     @property
     def direction(self) -> str:
@@ -69,33 +130,17 @@ class AsteriskRecordingData(BaseRecordingData):
         Asterisk doesn't always provide direction directly,
         so we infer from context if needed.
         """
-        direction = self._data.get("direction", "")
-        if direction:
-            return direction.lower()
-
-        # Infer from channel context
-        context = self._data.get("context", "")
-        if "outbound" in context.lower() or "from-internal" in context.lower():
-            return "outbound"
-        return "inbound"
+        return self._direction
 
     @property
     def recording_url(self) -> str:
         """URL or path to the recording."""
-        return self._data.get("target_uri", self._data.get("recording_url", ""))
+        return self._recording_url
 
     @property
     def recording_file_path(self) -> str | None:
         """Local file path to the recording."""
-        target_uri = self._data.get("target_uri", "")
-        if target_uri.startswith("file:"):
-            return target_uri.replace("file:", "")
-
-        recording_name = self.recording_id
-        if recording_name:
-            return recording_name
-
-        return None
+        return self._recording_file_path
 
     @property
     def recording_format(self) -> str:
@@ -113,15 +158,14 @@ class AsteriskRecordingData(BaseRecordingData):
                 return None
         return None
 
-    @property
-    def start_time(self) -> datetime:
-        """Recording start time."""
+    def _parse_start_time(self) -> datetime:
+        """Parse the recording start time."""
         # Try timestamp field
         timestamp = self._data.get("timestamp")
         if timestamp:
             try:
-                return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
+                return parse_iso_timestamp(timestamp)
+            except (ValueError, TypeError):
                 pass
 
         # Try Unix timestamp
@@ -134,29 +178,15 @@ class AsteriskRecordingData(BaseRecordingData):
 
         return datetime.now(timezone.utc)
 
+    @property
+    def start_time(self) -> datetime:
+        """Recording start time."""
+        return self._start_time
+
     @property
     def platform_tags(self) -> dict[str, str]:
         """Asterisk-specific metadata tags."""
-        tags = {
-            "asterisk_recording_name": self.recording_id,
-        }
-
-        if self._data.get("channel_id"):
-            tags["asterisk_channel_id"] = self._data["channel_id"]
-
-        if self._data.get("Uniqueid"):
-            tags["asterisk_unique_id"] = self._data["Uniqueid"]
-
-        if self._data.get("caller_id_name"):
-            tags["caller_name"] = self._data["caller_id_name"]
-
-        if self._data.get("context"):
-            tags["asterisk_context"] = self._data["context"]
-
-        if self._data.get("application"):
-            tags["asterisk_application"] = self._data["application"]
-
-        return tags
+        return self._platform_tags
 
 
 class AsteriskVconBuilder(BaseVconBuilder):
@@ -191,8 +221,10 @@ class AsteriskVconBuilder(BaseVconBuilder):
         self.recordings_path = recordings_path or "/var/spool/asterisk/recording"
         self.ari_url = ari_url
         self.ari_auth = ari_auth
+        self._auth = HTTPBasicAuth(*ari_auth) if ari_auth else None
+        self._ari_prefix = f"{ari_url.rstrip('/')}/recordings/stored/" if ari_url else None
 
-    def _download_recording(self, recording_data: BaseRecordingData) -> bytes | None:
+    def _download_recording(self, recording_data: BaseRecordingData) -> AudioData | None:
         """Download or read recording from Asterisk.
 
         Args:
@@ -207,28 +239,29 @@ class AsteriskVconBuilder(BaseVconBuilder):
             return None
 
         # Try ARI endpoint first
-        if self.ari_url and ast_data.recording_id:
+        if self._ari_prefix and ast_data.recording_id:
             try:
-                url = f"{self.ari_url}/recordings/stored/{ast_data.recording_id}/file"
-                logger.debug(f"Downloading recording from ARI: {url}")
-
-                auth = HTTPBasicAuth(*self.ari_auth) if self.ari_auth else None
-                response = requests.get(url, auth=auth, timeout=60)
-                response.raise_for_status()
-                return response.content
+                url = self._ari_prefix + ast_data.recording_id + "/file"
+                logger.debug("Downloading recording from ARI: %s", url)
+
+                with _SESSION.get(
+                    url, auth=self._auth, timeout=DOWNLOAD_TIMEOUT, stream=True
+                ) as response:
+                    response.raise_for_status()
+                    return read_content(response)
             except requests.RequestException as e:
-                logger.warning(f"Failed to download from ARI: {e}")
+                logger.warning("Failed to download from ARI: %s", e)
 
         # Try HTTP URL if provided
         recording_url = ast_data.recording_url
         if recording_url.startswith(("http://", "https://")):
             try:
-                logger.debug(f"Downloading recording from URL: {recording_url}")
-                response = requests.get(recording_url, timeout=60)
-                response.raise_for_status()
-                return response.content
+                logger.debug("Downloading recording from URL: %s", recording_url)
+                with _SESSION.get(recording_url, timeout=DOWNLOAD_TIMEOUT, stream=True) as response:
+                    response.raise_for_status()
+                    return read_content(response)
             except requests.RequestException as e:
-                logger.warning(f"Failed to download from URL: {e}")
+                logger.warning("Failed to download from URL: %s", e)
 
         # Try local file path
         file_path = ast_data.recording_file_path
@@ -238,17 +271,24 @@ class AsteriskVconBuilder(BaseVconBuilder):
                 file_path = os.path.join(self.recordings_path, file_path)
 
             # Ensure correct extension
-            recording_fmt = ast_data.recording_format or self.recording_format
-            if not file_path.endswith(f".{recording_fmt}"):
-                base_path = os.path.splitext(file_path)[0]
-                file_path = f"{base_path}.{recording_fmt}"
+            suffix = f".{ast_data.recording_format or self.recording_format}"
+            if not file_path.endswith(suffix):
+                head, dot, tail = file_path.rpartition(".")
+                # Only strip a dot in the file name, not one in a directory
+                if dot and os.sep not in tail:
+                    file_path = head
+                file_path += suffix
 
             try:
-                logger.debug(f"Reading recording from file: {file_path}")
+                logger.debug("Reading recording from file: %s", file_path)
                 with open(file_path, "rb") as f:
-                    return f.read()
-            except OSError as e:
-                logger.error(f"Failed to read recording file: {e}")
-
-        logger.error(f"Could not access recording for {ast_data.recording_id}")
+                    # mmap cannot map an empty file
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return b""
+                    # Let the kernel page the recording in instead of copying it
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.error("Failed to read recording file: %s", e)
+
+        logger.error("Could not access recording for %s", ast_data.recording_id)
         return None
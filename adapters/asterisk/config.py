@@ -1,8 +1,9 @@
 """Configuration management for Asterisk adapter."""
 
 import os
+from functools import lru_cache
 
-from core.base_config import BaseConfig
+from core.base_config import BaseConfig, env_bool
 
 
 class AsteriskConfig(BaseConfig):
@@ -44,11 +45,7 @@ class AsteriskConfig(BaseConfig):
         self.webhook_secret = os.getenv("ASTERISK_WEBHOOK_SECRET")
 
         # Whether to validate webhook signatures
-        self.validate_webhook = os.getenv("VALIDATE_ASTERISK_WEBHOOK", "false").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.validate_webhook = env_bool("VALIDATE_ASTERISK_WEBHOOK", False)
 
     def get_ari_auth(self) -> tuple:
         """Get ARI authentication tuple.
@@ -57,3 +54,16 @@ class AsteriskConfig(BaseConfig):
             Tuple of (username, password) for ARI requests
         """
         return (self.asterisk_ari_username, self.asterisk_ari_password)
+
+
+@lru_cache(maxsize=1)
+def get_config(env_file: str | None = None) -> AsteriskConfig:
+    """Load the Asterisk configuration once per process.
+
+    Args:
+        env_file: Optional path to .env file
+
+    Returns:
+        Cached AsteriskConfig instance
+    """
+    return AsteriskConfig(env_file)
@@ -1,20 +1,28 @@
 """FastAPI webhook receiver for Asterisk recording events."""
 
+import asyncio
 import hashlib
 import hmac
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 
+import orjson
 from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
 from core.poster import HttpPoster
-from core.tracker import StateTracker
+from core.responses import OrjsonResponse
+from core.tracker import create_tracker
 
 from .builder import AsteriskRecordingData, AsteriskVconBuilder
 from .config import AsteriskConfig
 
 logger = logging.getLogger(__name__)
 
+# Event types that carry a finished recording
+_RECORDING_EVENTS = frozenset({"RecordingFinished", "recording_finished", "StasisEnd"})
+
 
 def create_app(config: AsteriskConfig) -> FastAPI:
     """Create and configure the FastAPI application.
@@ -25,10 +33,28 @@ def create_app(config: AsteriskConfig) -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Size the default executor used for downloads, posts and state writes
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=config.worker_threads)
+        )
+        # Persist buffered state updates in the background
+        flusher = asyncio.create_task(tracker.run_flusher())
+        yield
+        flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher
+        await asyncio.to_thread(tracker.flush)
+        tracker.close()
+
     app = FastAPI(
         title="vCon Asterisk Adapter",
         description="Receives Asterisk recording events and creates vCons",
         version="0.1.0",
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan,
     )
 
     # Initialize components
@@ -40,7 +66,21 @@ def create_app(config: AsteriskConfig) -> FastAPI:
         ari_auth=config.get_ari_auth(),
     )
     poster = HttpPoster(config.conserver_url, config.get_headers(), config.ingress_lists)
-    tracker = StateTracker(config.state_file)
+    tracker = create_tracker(config.state_file)
+
+    # Caps recordings being downloaded and base64-encoded at once, so a
+    # burst of webhooks cannot hold that many full recordings in memory
+    downloads = asyncio.Semaphore(config.max_concurrent_downloads)
+
+    # Recordings currently being processed, keyed by recording ID
+    inflight: dict[str, asyncio.Event] = {}
+
+    # Key the HMAC once; each request copies the keyed state
+    hmac_template = (
+        hmac.new(config.webhook_secret.encode(), digestmod=hashlib.sha256)
+        if config.webhook_secret
+        else None
+    )
 
     def validate_signature(request_body: bytes, signature: str | None) -> bool:
         """Validate webhook signature.
@@ -55,19 +95,66 @@ def create_app(config: AsteriskConfig) -> FastAPI:
         if not config.validate_webhook:
             return True
 
-        if not config.webhook_secret:
+        if hmac_template is None:
             logger.warning("Webhook validation enabled but no secret configured")
             return True
 
         if not signature:
             return False
 
-        # Calculate expected signature
-        expected = hmac.new(
-            config.webhook_secret.encode(), request_body, hashlib.sha256
-        ).hexdigest()
+        # Compare raw digests rather than hex strings
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        mac = hmac_template.copy()
+        mac.update(request_body)
+        expected = mac.digest()
+
+        return hmac.compare_digest(provided, expected)
+
+    async def process_recording(recording_id: str, recording_data: AsteriskRecordingData) -> None:
+        """Build, post and record a single recording.
+
+        Args:
+            recording_id: Asterisk recording name
+            recording_data: Parsed recording data
+        """
+        # Build vCon off the event loop; downloading the recording blocks
+        async with downloads:
+            vcon = await asyncio.to_thread(builder.build, recording_data)
+        if not vcon:
+            logger.error("Failed to build vCon for recording %s", recording_id)
+            tracker.mark_processed_buffered(
+                recording_id,
+                "",
+                status="build_failed",
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            return
+
+        # Post to conserver
+        success = await asyncio.to_thread(poster.post, vcon)
 
-        return hmac.compare_digest(signature, expected)
+        if success:
+            tracker.mark_processed_buffered(
+                recording_id,
+                vcon.uuid,
+                status="success",
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            logger.info("Successfully processed recording %s -> vCon %s", recording_id, vcon.uuid)
+        else:
+            tracker.mark_processed_buffered(
+                recording_id,
+                vcon.uuid,
+                status="post_failed",
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            logger.error("Failed to post vCon %s for recording %s", vcon.uuid, recording_id)
 
     @app.get("/health")
     async def health_check():
@@ -85,7 +172,7 @@ def create_app(config: AsteriskConfig) -> FastAPI:
         are completed. Can be triggered via Stasis application
         or custom AGI scripts.
         """
-        # Get raw body for signature validation
+        # Get raw body for signature validation and parsing
         body = await request.body()
 
         # Validate signature
@@ -95,21 +182,20 @@ def create_app(config: AsteriskConfig) -> FastAPI:
 
         # Parse JSON body
         try:
-            event_data = await request.json()
-        except Exception as e:
-            logger.error(f"Failed to parse JSON body: {e}")
+            event_data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON body: %s", e)
             raise HTTPException(status_code=400, detail="Invalid JSON") from None
+        if not isinstance(event_data, dict):
+            logger.error("Webhook body is not a JSON object")
+            raise HTTPException(status_code=400, detail="Invalid event")
 
         # Check event type (ARI sends various events)
         event_type = event_data.get("type", event_data.get("event"))
 
         # Only process recording finished events
-        if event_type and event_type not in (
-            "RecordingFinished",
-            "recording_finished",
-            "StasisEnd",
-        ):
-            logger.debug(f"Ignoring Asterisk event type: {event_type}")
+        if event_type and event_type not in _RECORDING_EVENTS:
+            logger.debug("Ignoring Asterisk event type: %s", event_type)
             return "OK"
 
         # Extract recording ID
@@ -121,50 +207,26 @@ def create_app(config: AsteriskConfig) -> FastAPI:
             logger.warning("No recording ID in Asterisk event")
             return "OK"
 
-        logger.info(f"Received Asterisk recording event: name={recording_id}, type={event_type}")
+        logger.info("Received Asterisk recording event: name=%s, type=%s", recording_id, event_type)
 
         # Check if already processed
         if tracker.is_processed(recording_id):
-            logger.info(f"Recording {recording_id} already processed, skipping")
+            logger.info("Recording %s already processed, skipping", recording_id)
             return "OK"
 
-        # Parse recording data
-        recording_data = AsteriskRecordingData(event_data)
-
-        # Build vCon
-        vcon = builder.build(recording_data)
-        if not vcon:
-            logger.error(f"Failed to build vCon for recording {recording_id}")
-            tracker.mark_processed(
-                recording_id,
-                "",
-                status="build_failed",
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
+        # Coalesce concurrent deliveries of the same recording (webhook retries)
+        pending = inflight.get(recording_id)
+        if pending is not None:
+            logger.info("Recording %s already in progress, waiting", recording_id)
+            await pending.wait()
             return "OK"
 
-        # Post to conserver
-        success = poster.post(vcon)
-
-        if success:
-            tracker.mark_processed(
-                recording_id,
-                vcon.uuid,
-                status="success",
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            logger.info(f"Successfully processed recording {recording_id} -> vCon {vcon.uuid}")
-        else:
-            tracker.mark_processed(
-                recording_id,
-                vcon.uuid,
-                status="post_failed",
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            logger.error(f"Failed to post vCon {vcon.uuid} for recording {recording_id}")
+        inflight[recording_id] = done = asyncio.Event()
+        try:
+            await process_recording(recording_id, AsteriskRecordingData(event_data))
+        finally:
+            done.set()
+            del inflight[recording_id]
 
         return "OK"
 
@@ -1,7 +1,7 @@
 """Bandwidth adapter for vCon telephony adapters."""
 
 from .builder import BandwidthRecordingData, BandwidthVconBuilder
-from .config import BandwidthConfig
+from .config import BandwidthConfig, get_config
 from .webhook import create_app
 
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "BandwidthRecordingData",
     "BandwidthVconBuilder",
     "create_app",
+    "get_config",
 ]
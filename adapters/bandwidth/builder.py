@@ -1,16 +1,52 @@
 """vCon builder for Bandwidth recordings."""
 
 import logging
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 import requests
 from requests.auth import HTTPBasicAuth
 
-from core.base_builder import BaseRecordingData, BaseVconBuilder
+from core.base_builder import AudioData, BaseRecordingData, BaseVconBuilder, parse_iso_timestamp
+from core.http import DOWNLOAD_TIMEOUT, get_session, read_content
 
 logger = logging.getLogger(__name__)
 
+# Process-wide session shared with the conserver poster
+_SESSION = get_session()
+
+# ISO 8601 duration as used by Bandwidth: PT30S, PT1M30S, PT1H30M45S
+_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?")
+
+
+@lru_cache(maxsize=1024)
+def _parse_duration(duration_str: str) -> float | None:
+    """Parse an ISO 8601 duration such as "PT1M30S" into seconds.
+
+    Call lengths cluster around a small set of values, so results are
+    memoized per duration string.
+
+    Args:
+        duration_str: ISO 8601 duration
+
+    Returns:
+        Duration in seconds, or None if it cannot be parsed
+    """
+    # Fast path for the common seconds-only form, e.g. "PT30S"
+    seconds_str = duration_str[2:-1]
+    if duration_str.startswith("PT") and duration_str.endswith("S") and seconds_str.isdigit():
+        return float(seconds_str)
+
+    match = _DURATION_RE.match(duration_str)
+    if match:
+        hours = float(match.group(1) or 0)
+        minutes = float(match.group(2) or 0)
+        seconds = float(match.group(3) or 0)
+        return hours * 3600 + minutes * 60 + seconds
+    return None
+
 
 class BandwidthRecordingData(BaseRecordingData):
     """Recording data from Bandwidth webhook event.
@@ -38,33 +74,69 @@ class BandwidthRecordingData(BaseRecordingData):
     }
     """
 
+    __slots__ = (
+        "_data",
+        "_recording_id",
+        "_call_id",
+        "_from_number",
+        "_to_number",
+        "_recording_url",
+        "_platform_tags",
+        "_start_time",
+    )
+
     def __init__(self, event_data: dict[str, Any]):
         """Initialize from Bandwidth webhook event data.
 
+        Identifiers and platform tags are resolved once here rather
+        than on every property access.
+
         Args:
             event_data: Dictionary of Bandwidth webhook event
         """
         self._data = event_data
 
+        self._recording_id = event_data.get("recordingId", "")
+        self._call_id = event_data.get("callId", "")
+        self._from_number = event_data.get("from", "")
+        self._to_number = event_data.get("to", "")
+        self._recording_url = event_data.get("mediaUrl", "")
+
+        tags = {
+            "bandwidth_recording_id": self._recording_id,
+        }
+        if self._call_id:
+            tags["bandwidth_call_id"] = self._call_id
+        if event_data.get("accountId"):
+            tags["bandwidth_account_id"] = event_data["accountId"]
+        if event_data.get("applicationId"):
+            tags["bandwidth_application_id"] = event_data["applicationId"]
+        if event_data.get("channels"):
+            tags["recording_channels"] = str(event_data["channels"])
+        if event_data.get("transcription"):
+            tags["has_transcription"] = "true"
+        self._platform_tags = tags
+        self._start_time = self._parse_start_time()
+
     @property
     def recording_id(self) -> str:
         """Bandwidth recording ID."""
-        return self._data.get("recordingId", "")
+        return self._recording_id
 
     @property
     def call_id(self) -> str:
         """Bandwidth call ID."""
-        return self._data.get("callId", "")
+        return self._call_id
 
     @property
     def from_number(self) -> str:
         """Caller's phone number."""
-        return self._data.get("from", "")
+        return self._from_number
 
     @property
     def to_number(self) -> str:
         """Called phone number."""
-        return self._data.get("to", "")
+        return self._to_number
 
     @property
     def direction(self) -> str:
@@ -75,7 +147,7 @@ class BandwidthRecordingData(BaseRecordingData):
     @property
     def recording_url(self) -> str:
         """URL to download the recording."""
-        return self._data.get("mediaUrl", "")
+        return self._recording_url
 
     @property
     def file_format(self) -> str:
@@ -89,72 +161,41 @@ class BandwidthRecordingData(BaseRecordingData):
         Bandwidth uses ISO 8601 duration format (e.g., "PT30S").
         """
         duration_str = self._data.get("duration", "")
-        if not duration_str:
+        if not duration_str or not isinstance(duration_str, str):
             return None
+        return _parse_duration(duration_str)
 
-        # Parse ISO 8601 duration
-        try:
-            # Simple parser for common formats: PT30S, PT1M30S, PT1H30M45S
-            import re
-
-            pattern = r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?"
-            match = re.match(pattern, duration_str)
-            if match:
-                hours = float(match.group(1) or 0)
-                minutes = float(match.group(2) or 0)
-                seconds = float(match.group(3) or 0)
-                return hours * 3600 + minutes * 60 + seconds
-        except (ValueError, AttributeError):
-            pass
-
-        return None
-
-    @property
-    def start_time(self) -> datetime:
-        """Recording start time."""
+    def _parse_start_time(self) -> datetime:
+        """Parse the recording start time."""
         start_str = self._data.get("startTime")
         if start_str:
             try:
-                return datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
+                return parse_iso_timestamp(start_str)
+            except (ValueError, TypeError):
                 pass
 
         return datetime.now(timezone.utc)
 
+    @property
+    def start_time(self) -> datetime:
+        """Recording start time."""
+        return self._start_time
+
     @property
     def end_time(self) -> datetime | None:
         """Recording end time."""
         end_str = self._data.get("endTime")
         if end_str:
             try:
-                return datetime.fromisoformat(end_str.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
+                return parse_iso_timestamp(end_str)
+            except (ValueError, TypeError):
                 pass
         return None
 
     @property
     def platform_tags(self) -> dict[str, str]:
         """Bandwidth-specific metadata tags."""
-        tags = {
-            "bandwidth_recording_id": self.recording_id,
-        }
-
-        if self.call_id:
-            tags["bandwidth_call_id"] = self.call_id
-
-        if self._data.get("accountId"):
-            tags["bandwidth_account_id"] = self._data["accountId"]
-
-        if self._data.get("applicationId"):
-            tags["bandwidth_application_id"] = self._data["applicationId"]
-
-        if self._data.get("channels"):
-            tags["recording_channels"] = str(self._data["channels"])
-
-        if self._data.get("transcription"):
-            tags["has_transcription"] = "true"
-
-        return tags
+        return self._platform_tags
 
 
 class BandwidthVconBuilder(BaseVconBuilder):
@@ -177,8 +218,9 @@ class BandwidthVconBuilder(BaseVconBuilder):
         """
         super().__init__(download_recordings, recording_format)
         self.api_auth = api_auth
+        self._auth = HTTPBasicAuth(*api_auth) if api_auth else None
 
-    def _download_recording(self, recording_data: BaseRecordingData) -> bytes | None:
+    def _download_recording(self, recording_data: BaseRecordingData) -> AudioData | None:
         """Download recording from Bandwidth.
 
         Args:
@@ -194,17 +236,18 @@ class BandwidthVconBuilder(BaseVconBuilder):
 
         recording_url = bw_data.recording_url
         if not recording_url:
-            logger.error(f"No media URL for recording {bw_data.recording_id}")
+            logger.error("No media URL for recording %s", bw_data.recording_id)
             return None
 
         try:
-            logger.debug(f"Downloading recording from: {recording_url}")
+            logger.debug("Downloading recording from: %s", recording_url)
 
-            auth = HTTPBasicAuth(*self.api_auth) if self.api_auth else None
-            response = requests.get(recording_url, auth=auth, timeout=60)
-            response.raise_for_status()
-            return response.content
+            with _SESSION.get(
+                recording_url, auth=self._auth, timeout=DOWNLOAD_TIMEOUT, stream=True
+            ) as response:
+                response.raise_for_status()
+                return read_content(response)
 
         except requests.RequestException as e:
-            logger.error(f"Failed to download Bandwidth recording {bw_data.recording_id}: {e}")
+            logger.error("Failed to download Bandwidth recording %s: %s", bw_data.recording_id, e)
             return None
@@ -1,8 +1,9 @@
 """Configuration management for Bandwidth adapter."""
 
 import os
+from functools import lru_cache
 
-from core.base_config import BaseConfig
+from core.base_config import BaseConfig, env_bool
 
 
 class BandwidthConfig(BaseConfig):
@@ -41,11 +42,7 @@ class BandwidthConfig(BaseConfig):
         self.webhook_password = os.getenv("BANDWIDTH_WEBHOOK_PASSWORD")
 
         # Whether to validate webhook authentication
-        self.validate_webhook = os.getenv("VALIDATE_BANDWIDTH_WEBHOOK", "true").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.validate_webhook = env_bool("VALIDATE_BANDWIDTH_WEBHOOK", True)
 
     def get_api_auth(self) -> tuple:
         """Get API authentication tuple.
@@ -65,3 +62,16 @@ class BandwidthConfig(BaseConfig):
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+
+
+@lru_cache(maxsize=1)
+def get_config(env_file: str | None = None) -> BandwidthConfig:
+    """Load the Bandwidth configuration once per process.
+
+    Args:
+        env_file: Optional path to .env file
+
+    Returns:
+        Cached BandwidthConfig instance
+    """
+    return BandwidthConfig(env_file)
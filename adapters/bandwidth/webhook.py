@@ -1,20 +1,62 @@
 """FastAPI webhook receiver for Bandwidth recording events."""
 
+import asyncio
 import logging
+import re
 import secrets
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from typing import Any
 
-from fastapi import Depends, FastAPI, HTTPException, Request
+import orjson
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
 from core.poster import HttpPoster
-from core.tracker import StateTracker
+from core.responses import OrjsonResponse
+from core.tracker import create_tracker
 
 from .builder import BandwidthRecordingData, BandwidthVconBuilder
 from .config import BandwidthConfig
 
 logger = logging.getLogger(__name__)
 
+# Event types that carry a finished recording
+_RECORDING_EVENTS = frozenset({"recordingComplete", "recording", "transcriptionAvailable"})
+
+# Pull the recording ID and event type out of a raw body without parsing the JSON
+_RECORDING_ID_RE = re.compile(rb'"recordingId"\s*:\s*"([^"\\]+)"')
+_EVENT_TYPE_RE = re.compile(rb'"eventType"\s*:\s*"([^"\\]+)"')
+
+
+def _peek_recording_id(body: bytes) -> str | None:
+    """Get the recording ID of a raw recording event body, if unambiguous.
+
+    Only used to short-circuit retries of processed recordings, so any
+    doubt returns None and the caller parses the body. A key can only
+    appear unescaped where it is a real object key, so exactly one
+    ``recordingId`` and one ``eventType`` key in the body are taken as
+    the event's own. If either sits in a nested object instead, the
+    parsed event would be ignored or lack an ID, so skipping it is
+    equally a no-op.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        Recording ID, or None if the body must be parsed
+    """
+    if body.count(b'"recordingId"') != 1 or body.count(b'"eventType"') != 1:
+        return None
+
+    event_type = _EVENT_TYPE_RE.search(body)
+    if not event_type or event_type.group(1).decode("utf-8", "replace") not in _RECORDING_EVENTS:
+        return None
+
+    match = _RECORDING_ID_RE.search(body)
+    return match.group(1).decode("utf-8", "replace") if match else None
+
 
 def create_app(config: BandwidthConfig) -> FastAPI:
     """Create and configure the FastAPI application.
@@ -25,10 +67,28 @@ def create_app(config: BandwidthConfig) -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Size the default executor used for downloads, posts and state writes
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=config.worker_threads)
+        )
+        # Persist buffered state updates in the background
+        flusher = asyncio.create_task(tracker.run_flusher())
+        yield
+        flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher
+        await asyncio.to_thread(tracker.flush)
+        tracker.close()
+
     app = FastAPI(
         title="vCon Bandwidth Adapter",
         description="Receives Bandwidth recording events and creates vCons",
         version="0.1.0",
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan,
     )
 
     # Initialize components
@@ -38,11 +98,26 @@ def create_app(config: BandwidthConfig) -> FastAPI:
         api_auth=config.get_api_auth(),
     )
     poster = HttpPoster(config.conserver_url, config.get_headers(), config.ingress_lists)
-    tracker = StateTracker(config.state_file)
+    tracker = create_tracker(config.state_file)
+
+    # Caps recordings being downloaded and base64-encoded at once, so a
+    # burst of webhooks cannot hold that many full recordings in memory
+    downloads = asyncio.Semaphore(config.max_concurrent_downloads)
+
+    # Recordings currently being processed, keyed by recording ID
+    inflight: dict[str, asyncio.Event] = {}
+
+    # Bounds recordings processed at once, so queued background work
+    # waits here rather than piling up on the worker pool
+    processing = asyncio.Semaphore(config.worker_threads)
 
     # HTTP Basic Auth for webhook validation
     security = HTTPBasic(auto_error=False)
 
+    # Encode the configured credentials once rather than on every request
+    username_bytes = (config.webhook_username or "").encode("utf-8")
+    password_bytes = (config.webhook_password or "").encode("utf-8")
+
     def validate_basic_auth(credentials: HTTPBasicCredentials | None) -> bool:
         """Validate HTTP Basic authentication.
 
@@ -64,14 +139,114 @@ def create_app(config: BandwidthConfig) -> FastAPI:
 
         # Use secrets.compare_digest to prevent timing attacks
         username_correct = secrets.compare_digest(
-            credentials.username.encode("utf-8"), config.webhook_username.encode("utf-8")
+            credentials.username.encode("utf-8"), username_bytes
         )
         password_correct = secrets.compare_digest(
-            credentials.password.encode("utf-8"), config.webhook_password.encode("utf-8")
+            credentials.password.encode("utf-8"), password_bytes
         )
 
         return username_correct and password_correct
 
+    async def process_recording(recording_id: str, recording_data: BandwidthRecordingData) -> str:
+        """Build, post and record a single recording.
+
+        Args:
+            recording_id: Bandwidth recording ID
+            recording_data: Parsed recording data
+
+        Returns:
+            Processing status recorded in the tracker
+        """
+        # Build vCon off the event loop; downloading the recording blocks
+        async with downloads:
+            vcon = await asyncio.to_thread(builder.build, recording_data)
+        if not vcon:
+            logger.error("Failed to build vCon for recording %s", recording_id)
+            tracker.mark_processed_buffered(
+                recording_id,
+                "",
+                status="build_failed",
+                call_id=recording_data.call_id,
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            return "build_failed"
+
+        # Post to conserver
+        success = await asyncio.to_thread(poster.post, vcon)
+
+        if success:
+            tracker.mark_processed_buffered(
+                recording_id,
+                vcon.uuid,
+                status="success",
+                call_id=recording_data.call_id,
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            logger.info("Successfully processed recording %s -> vCon %s", recording_id, vcon.uuid)
+        else:
+            tracker.mark_processed_buffered(
+                recording_id,
+                vcon.uuid,
+                status="post_failed",
+                call_id=recording_data.call_id,
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            logger.error("Failed to post vCon %s for recording %s", vcon.uuid, recording_id)
+
+        return "success" if success else "post_failed"
+
+    async def handle_event(event_data: dict[str, Any]) -> str:
+        """Process a single Bandwidth webhook event.
+
+        Args:
+            event_data: Parsed webhook event
+
+        Returns:
+            Outcome for the event (ignored, missing_id, duplicate or the
+            tracker status)
+        """
+        # Check event type
+        event_type = event_data.get("eventType", "")
+
+        # Only process recording complete events
+        if event_type not in _RECORDING_EVENTS:
+            logger.debug("Ignoring Bandwidth event type: %s", event_type)
+            return "ignored"
+
+        # Extract recording ID
+        recording_id = event_data.get("recordingId", "")
+
+        if not recording_id:
+            logger.warning("No recording ID in Bandwidth event")
+            return "missing_id"
+
+        logger.info(
+            "Received Bandwidth recording event: recordingId=%s, type=%s", recording_id, event_type
+        )
+
+        # Check if already processed
+        if tracker.is_processed(recording_id):
+            logger.info("Recording %s already processed, skipping", recording_id)
+            return "duplicate"
+
+        # Coalesce concurrent deliveries of the same recording (webhook retries)
+        pending = inflight.get(recording_id)
+        if pending is not None:
+            logger.info("Recording %s already in progress, waiting", recording_id)
+            await pending.wait()
+            return "duplicate"
+
+        inflight[recording_id] = done = asyncio.Event()
+        try:
+            async with processing:
+                return await process_recording(recording_id, BandwidthRecordingData(event_data))
+        finally:
+            done.set()
+            del inflight[recording_id]
+
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
@@ -80,12 +255,15 @@ def create_app(config: BandwidthConfig) -> FastAPI:
     @app.post("/webhook/recording", response_class=PlainTextResponse)
     async def recording_event(
         request: Request,
+        background: BackgroundTasks,
         credentials: HTTPBasicCredentials | None = Depends(security),
     ):
         """Handle Bandwidth recording webhook event.
 
         This endpoint receives recordingComplete events from
-        Bandwidth when call recordings are finished.
+        Bandwidth when call recordings are finished. The event is
+        acknowledged once parsed; the vCon is built and posted in a
+        background task.
         """
         # Validate authentication
         if not validate_basic_auth(credentials):
@@ -96,79 +274,71 @@ def create_app(config: BandwidthConfig) -> FastAPI:
                 headers={"WWW-Authenticate": "Basic"},
             )
 
-        # Parse JSON body
-        try:
-            event_data = await request.json()
-        except Exception as e:
-            logger.error(f"Failed to parse JSON body: {e}")
-            raise HTTPException(status_code=400, detail="Invalid JSON") from None
+        body = await request.body()
 
-        # Check event type
-        event_type = event_data.get("eventType", "")
-
-        # Only process recording complete events
-        if event_type not in ("recordingComplete", "recording", "transcriptionAvailable"):
-            logger.debug(f"Ignoring Bandwidth event type: {event_type}")
+        # Retries of finished recordings are answered before parsing,
+        # which matters for large payloads such as inline transcripts
+        recording_id = _peek_recording_id(body)
+        if recording_id and tracker.is_processed(recording_id):
+            logger.info("Recording %s already processed, skipping", recording_id)
             return "OK"
 
-        # Extract recording ID
-        recording_id = event_data.get("recordingId", "")
-
-        if not recording_id:
-            logger.warning("No recording ID in Bandwidth event")
-            return "OK"
-
-        logger.info(
-            f"Received Bandwidth recording event: recordingId={recording_id}, " f"type={event_type}"
-        )
+        # Parse JSON body
+        try:
+            event_data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON body: %s", e)
+            raise HTTPException(status_code=400, detail="Invalid JSON") from None
+        if not isinstance(event_data, dict):
+            logger.error("Webhook body is not a JSON object")
+            raise HTTPException(status_code=400, detail="Invalid event")
 
-        # Check if already processed
-        if tracker.is_processed(recording_id):
-            logger.info(f"Recording {recording_id} already processed, skipping")
-            return "OK"
+        background.add_task(handle_event, event_data)
+        return "OK"
 
-        # Parse recording data
-        recording_data = BandwidthRecordingData(event_data)
+    @app.post("/webhook/recording/batch")
+    async def recording_event_batch(
+        request: Request,
+        credentials: HTTPBasicCredentials | None = Depends(security),
+    ):
+        """Handle a batch of Bandwidth webhook events.
 
-        # Build vCon
-        vcon = builder.build(recording_data)
-        if not vcon:
-            logger.error(f"Failed to build vCon for recording {recording_id}")
-            tracker.mark_processed(
-                recording_id,
-                "",
-                status="build_failed",
-                call_id=recording_data.call_id,
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
+        The body is newline-delimited JSON (one event per line). Events
+        are processed concurrently, the state file is written once for
+        the batch, and a status is returned per non-blank line, in order.
+        """
+        # Validate authentication
+        if not validate_basic_auth(credentials):
+            logger.warning("Invalid Bandwidth webhook authentication")
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid credentials",
+                headers={"WWW-Authenticate": "Basic"},
             )
-            return "OK"
 
-        # Post to conserver
-        success = poster.post(vcon)
+        lines = [line for line in (await request.body()).splitlines() if line.strip()]
+        results = ["invalid_json"] * len(lines)
+        tasks = {}
+        for index, line in enumerate(lines):
+            try:
+                event_data = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                logger.error("Failed to parse JSON line %s: %s", index, e)
+                continue
+            if not isinstance(event_data, dict):
+                logger.error("JSON line %s is not an event object", index)
+                results[index] = "invalid_event"
+                continue
+            tasks[index] = handle_event(event_data)
 
-        if success:
-            tracker.mark_processed(
-                recording_id,
-                vcon.uuid,
-                status="success",
-                call_id=recording_data.call_id,
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            logger.info(f"Successfully processed recording {recording_id} -> vCon {vcon.uuid}")
-        else:
-            tracker.mark_processed(
-                recording_id,
-                vcon.uuid,
-                status="post_failed",
-                call_id=recording_data.call_id,
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            logger.error(f"Failed to post vCon {vcon.uuid} for recording {recording_id}")
+        try:
+            statuses = await asyncio.gather(*tasks.values())
+        finally:
+            await asyncio.to_thread(tracker.flush)
+        for index, status in zip(tasks, statuses, strict=True):
+            results[index] = status
 
-        return "OK"
+        return {"results": results}
 
     @app.get("/status/{recording_id}")
     async def get_recording_status(recording_id: str):
@@ -1,7 +1,7 @@
 """FreeSWITCH adapter for vCon telephony adapters."""
 
 from .builder import FreeSwitchRecordingData, FreeSwitchVconBuilder
-from .config import FreeSwitchConfig
+from .config import FreeSwitchConfig, get_config
 from .webhook import create_app
 
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "FreeSwitchRecordingData",
     "FreeSwitchVconBuilder",
     "create_app",
+    "get_config",
 ]
@@ -7,10 +7,20 @@ from typing import Any
 
 import requests
 
-from core.base_builder import BaseRecordingData, BaseVconBuilder
+from core.base_builder import (
+    AudioData,
+    BaseRecordingData,
+    BaseVconBuilder,
+    first_value,
+    parse_iso_timestamp,
+)
+from core.http import DOWNLOAD_TIMEOUT, get_session, read_content
 
 logger = logging.getLogger(__name__)
 
+# Process-wide session shared with the conserver poster
+_SESSION = get_session()
+
 
 class FreeSwitchRecordingData(BaseRecordingData):
     """Recording data from FreeSWITCH webhook/event.
@@ -31,104 +41,126 @@ class FreeSwitchRecordingData(BaseRecordingData):
     - recording_url: URL to download recording (if using HTTP storage)
     """
 
+    __slots__ = (
+        "_data",
+        "_direction",
+        "_recording_url",
+        "_duration_seconds",
+        "_start_time",
+        "_platform_tags",
+    )
+
     def __init__(self, event_data: dict[str, Any]):
         """Initialize from FreeSWITCH event data.
 
+        Parsed fields and the platform tags are resolved once here
+        rather than on every property access.
+
         Args:
             event_data: Dictionary of FreeSWITCH event/webhook data
         """
-        self._data = event_data
+        data = event_data
+        self._data = data
+
+        direction = first_value(data, ("direction", "Caller-Direction"), "inbound")
+        self._direction = direction.lower()
+        self._recording_url = first_value(data, ("recording_url", "recording_file"))
+        self._duration_seconds = self._parse_duration()
+        self._start_time = self._parse_start_time()
+
+        tags = {
+            "freeswitch_uuid": self.recording_id,
+        }
+        if data.get("caller_id_name"):
+            tags["caller_name"] = data["caller_id_name"]
+        if data.get("accountcode"):
+            tags["account_code"] = data["accountcode"]
+        if data.get("context"):
+            tags["freeswitch_context"] = data["context"]
+        if data.get("sip_user_agent"):
+            tags["sip_user_agent"] = data["sip_user_agent"]
+        self._platform_tags = tags
+
+    def _parse_duration(self) -> float | None:
+        """Parse the recording duration in seconds."""
+        duration = first_value(
+            self._data, ("record_seconds", "duration", "variable_duration"), None
+        )
+        if duration is not None:
+            try:
+                return float(duration)
+            except (ValueError, TypeError):
+                return None
+        return None
+
+    def _parse_start_time(self) -> datetime:
+        """Parse the recording start time."""
+        # Try Unix timestamp first
+        start_epoch = first_value(self._data, ("start_epoch", "Caller-Channel-Created-Time"), None)
+        if start_epoch:
+            try:
+                # FreeSWITCH sometimes provides microseconds
+                timestamp = int(start_epoch)
+                if timestamp > 10**12:  # Microseconds
+                    timestamp = timestamp // 1000000
+                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+            except (ValueError, TypeError):
+                pass
+
+        # Try ISO format
+        start_str = self._data.get("start_time")
+        if start_str:
+            try:
+                return parse_iso_timestamp(start_str)
+            except (ValueError, TypeError):
+                pass
+
+        return datetime.now(timezone.utc)
 
     @property
     def recording_id(self) -> str:
         """FreeSWITCH call UUID."""
-        return self._data.get("uuid", self._data.get("call_uuid", ""))
+        return first_value(self._data, ("uuid", "call_uuid"))
 
     @property
     def from_number(self) -> str:
         """Caller's phone number."""
-        return self._data.get("caller_id_number", self._data.get("Caller-Caller-ID-Number", ""))
+        return first_value(self._data, ("caller_id_number", "Caller-Caller-ID-Number"))
 
     @property
     def to_number(self) -> str:
         """Called phone number."""
-        return self._data.get("destination_number", self._data.get("Caller-Destination-Number", ""))
+        return first_value(self._data, ("destination_number", "Caller-Destination-Number"))
 
     @property
     def direction(self) -> str:
         """Call direction."""
-        direction = self._data.get("direction", self._data.get("Caller-Direction", "inbound"))
-        return direction.lower()
+        return self._direction
 
     @property
     def recording_url(self) -> str:
         """URL or path to the recording."""
-        return self._data.get("recording_url", self._data.get("recording_file", ""))
+        return self._recording_url
 
     @property
     def recording_file_path(self) -> str | None:
         """Local file path to the recording (if available)."""
-        return self._data.get("recording_file", self._data.get("Record-File-Path"))
+        return first_value(self._data, ("recording_file", "Record-File-Path"), None)
 
     @property
     def duration_seconds(self) -> float | None:
         """Recording duration in seconds."""
-        duration = self._data.get(
-            "record_seconds", self._data.get("duration", self._data.get("variable_duration"))
-        )
-        if duration is not None:
-            try:
-                return float(duration)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._duration_seconds
 
     @property
     def start_time(self) -> datetime:
         """Recording start time."""
-        # Try Unix timestamp first
-        start_epoch = self._data.get("start_epoch", self._data.get("Caller-Channel-Created-Time"))
-        if start_epoch:
-            try:
-                # FreeSWITCH sometimes provides microseconds
-                timestamp = int(start_epoch)
-                if timestamp > 10**12:  # Microseconds
-                    timestamp = timestamp // 1000000
-                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            except (ValueError, TypeError):
-                pass
-
-        # Try ISO format
-        start_str = self._data.get("start_time")
-        if start_str:
-            try:
-                return datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                pass
-
-        return datetime.now(timezone.utc)
+        return self._start_time
 
     @property
     def platform_tags(self) -> dict[str, str]:
         """FreeSWITCH-specific metadata tags."""
-        tags = {
-            "freeswitch_uuid": self.recording_id,
-        }
-
-        # Add optional metadata
-        if self._data.get("caller_id_name"):
-            tags["caller_name"] = self._data["caller_id_name"]
-
-        if self._data.get("accountcode"):
-            tags["account_code"] = self._data["accountcode"]
-
-        if self._data.get("context"):
-            tags["freeswitch_context"] = self._data["context"]
-
-        if self._data.get("sip_user_agent"):
-            tags["sip_user_agent"] = self._data["sip_user_agent"]
-
-        return tags
+        return self._platform_tags
 
 
 class FreeSwitchVconBuilder(BaseVconBuilder):
@@ -158,7 +190,7 @@ class FreeSwitchVconBuilder(BaseVconBuilder):
         self.recordings_path = recordings_path or "/var/lib/freeswitch/recordings"
         self.recordings_url_base = recordings_url_base
 
-    def _download_recording(self, recording_data: BaseRecordingData) -> bytes | None:
+    def _download_recording(self, recording_data: BaseRecordingData) -> AudioData | None:
         """Download or read recording from FreeSWITCH.
 
         Args:
@@ -176,12 +208,12 @@ class FreeSwitchVconBuilder(BaseVconBuilder):
         recording_url = fs_data.recording_url
         if recording_url and recording_url.startswith(("http://", "https://")):
             try:
-                logger.debug(f"Downloading recording from URL: {recording_url}")
-                response = requests.get(recording_url, timeout=60)
-                response.raise_for_status()
-                return response.content
+                logger.debug("Downloading recording from URL: %s", recording_url)
+                with _SESSION.get(recording_url, timeout=DOWNLOAD_TIMEOUT, stream=True) as response:
+                    response.raise_for_status()
+                    return read_content(response)
             except requests.RequestException as e:
-                logger.warning(f"Failed to download from URL: {e}")
+                logger.warning("Failed to download from URL: %s", e)
 
         # Try local file path
         file_path = fs_data.recording_file_path
@@ -196,23 +228,23 @@ class FreeSwitchVconBuilder(BaseVconBuilder):
                 file_path = f"{base_path}.{self.recording_format}"
 
             try:
-                logger.debug(f"Reading recording from file: {file_path}")
+                logger.debug("Reading recording from file: %s", file_path)
                 with open(file_path, "rb") as f:
                     return f.read()
             except OSError as e:
-                logger.error(f"Failed to read recording file: {e}")
+                logger.error("Failed to read recording file: %s", e)
 
         # Try constructing URL from base
         if self.recordings_url_base and recording_url:
             filename = os.path.basename(recording_url)
             full_url = f"{self.recordings_url_base.rstrip('/')}/{filename}"
             try:
-                logger.debug(f"Trying constructed URL: {full_url}")
-                response = requests.get(full_url, timeout=60)
-                response.raise_for_status()
-                return response.content
+                logger.debug("Trying constructed URL: %s", full_url)
+                with _SESSION.get(full_url, timeout=DOWNLOAD_TIMEOUT, stream=True) as response:
+                    response.raise_for_status()
+                    return read_content(response)
             except requests.RequestException as e:
-                logger.warning(f"Failed to download from constructed URL: {e}")
+                logger.warning("Failed to download from constructed URL: %s", e)
 
-        logger.error(f"Could not access recording for {fs_data.recording_id}")
+        logger.error("Could not access recording for %s", fs_data.recording_id)
         return None
@@ -1,8 +1,9 @@
 """Configuration management for FreeSWITCH adapter."""
 
 import os
+from functools import lru_cache
 
-from core.base_config import BaseConfig
+from core.base_config import BaseConfig, env_bool
 
 
 class FreeSwitchConfig(BaseConfig):
@@ -40,8 +41,17 @@ class FreeSwitchConfig(BaseConfig):
         self.webhook_secret = os.getenv("FREESWITCH_WEBHOOK_SECRET")
 
         # Whether to validate webhook signatures
-        self.validate_webhook = os.getenv("VALIDATE_FREESWITCH_WEBHOOK", "false").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.validate_webhook = env_bool("VALIDATE_FREESWITCH_WEBHOOK", False)
+
+
+@lru_cache(maxsize=1)
+def get_config(env_file: str | None = None) -> FreeSwitchConfig:
+    """Load the FreeSWITCH configuration once per process.
+
+    Args:
+        env_file: Optional path to .env file
+
+    Returns:
+        Cached FreeSwitchConfig instance
+    """
+    return FreeSwitchConfig(env_file)
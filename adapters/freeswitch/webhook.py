@@ -1,14 +1,20 @@
 """FastAPI webhook receiver for FreeSWITCH recording events."""
 
+import asyncio
 import hashlib
 import hmac
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from typing import Any
 
-from fastapi import FastAPI, Header, HTTPException, Request
+import orjson
+from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
 from core.poster import HttpPoster
-from core.tracker import StateTracker
+from core.responses import OrjsonResponse
+from core.tracker import create_tracker
 
 from .builder import FreeSwitchRecordingData, FreeSwitchVconBuilder
 from .config import FreeSwitchConfig
@@ -25,10 +31,28 @@ def create_app(config: FreeSwitchConfig) -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Size the default executor used for downloads, posts and state writes
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=config.worker_threads)
+        )
+        # Persist buffered state updates in the background
+        flusher = asyncio.create_task(tracker.run_flusher())
+        yield
+        flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher
+        await asyncio.to_thread(tracker.flush)
+        tracker.close()
+
     app = FastAPI(
         title="vCon FreeSWITCH Adapter",
         description="Receives FreeSWITCH recording events and creates vCons",
         version="0.1.0",
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan,
     )
 
     # Initialize components
@@ -39,7 +63,25 @@ def create_app(config: FreeSwitchConfig) -> FastAPI:
         recordings_url_base=config.recordings_url_base,
     )
     poster = HttpPoster(config.conserver_url, config.get_headers(), config.ingress_lists)
-    tracker = StateTracker(config.state_file)
+    tracker = create_tracker(config.state_file)
+
+    # Caps recordings being downloaded and base64-encoded at once, so a
+    # burst of webhooks cannot hold that many full recordings in memory
+    downloads = asyncio.Semaphore(config.max_concurrent_downloads)
+
+    # Recordings currently being processed, keyed by recording ID
+    inflight: dict[str, asyncio.Event] = {}
+
+    # Bounds recordings processed at once, so queued background work
+    # waits here rather than piling up on the worker pool
+    processing = asyncio.Semaphore(config.worker_threads)
+
+    # Key the HMAC once; each request copies the keyed state
+    hmac_template = (
+        hmac.new(config.webhook_secret.encode(), digestmod=hashlib.sha256)
+        if config.webhook_secret
+        else None
+    )
 
     def validate_signature(request_body: bytes, signature: str | None) -> bool:
         """Validate webhook signature.
@@ -54,19 +96,113 @@ def create_app(config: FreeSwitchConfig) -> FastAPI:
         if not config.validate_webhook:
             return True
 
-        if not config.webhook_secret:
+        if hmac_template is None:
             logger.warning("Webhook validation enabled but no secret configured")
             return True
 
         if not signature:
             return False
 
-        # Calculate expected signature
-        expected = hmac.new(
-            config.webhook_secret.encode(), request_body, hashlib.sha256
-        ).hexdigest()
+        # Compare raw digests rather than hex strings
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        mac = hmac_template.copy()
+        mac.update(request_body)
+        expected = mac.digest()
+
+        return hmac.compare_digest(provided, expected)
+
+    async def process_recording(recording_id: str, recording_data: FreeSwitchRecordingData) -> str:
+        """Build, post and record a single recording.
+
+        Tracker updates are buffered; the lifespan flusher persists
+        them, and the batch endpoint flushes once per batch.
+
+        Args:
+            recording_id: FreeSWITCH call UUID
+            recording_data: Parsed recording data
+
+        Returns:
+            Processing status recorded in the tracker
+        """
+        # Build vCon off the event loop; downloading the recording blocks
+        async with downloads:
+            vcon = await asyncio.to_thread(builder.build, recording_data)
+        if not vcon:
+            logger.error("Failed to build vCon for recording %s", recording_id)
+            tracker.mark_processed_buffered(
+                recording_id,
+                "",
+                status="build_failed",
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            return "build_failed"
+
+        # Post to conserver
+        success = await asyncio.to_thread(poster.post, vcon)
+
+        if success:
+            tracker.mark_processed_buffered(
+                recording_id,
+                vcon.uuid,
+                status="success",
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            logger.info("Successfully processed recording %s -> vCon %s", recording_id, vcon.uuid)
+        else:
+            tracker.mark_processed_buffered(
+                recording_id,
+                vcon.uuid,
+                status="post_failed",
+                from_number=recording_data.from_number,
+                to_number=recording_data.to_number,
+            )
+            logger.error("Failed to post vCon %s for recording %s", vcon.uuid, recording_id)
+
+        return "success" if success else "post_failed"
+
+    async def handle_event(event_data: dict[str, Any]) -> str:
+        """Process a single FreeSWITCH recording event.
+
+        Args:
+            event_data: Parsed webhook event
+
+        Returns:
+            Outcome for the event (missing_id, duplicate or the tracker
+            status)
+        """
+        # Extract recording ID
+        recording_id = event_data.get("uuid", event_data.get("call_uuid", ""))
+
+        if not recording_id:
+            logger.warning("No recording ID in FreeSWITCH event")
+            return "missing_id"
+
+        logger.info("Received FreeSWITCH recording event: uuid=%s", recording_id)
+
+        # Check if already processed
+        if tracker.is_processed(recording_id):
+            logger.info("Recording %s already processed, skipping", recording_id)
+            return "duplicate"
 
-        return hmac.compare_digest(signature, expected)
+        # Coalesce concurrent deliveries of the same recording
+        pending = inflight.get(recording_id)
+        if pending is not None:
+            logger.info("Recording %s already in progress, waiting", recording_id)
+            await pending.wait()
+            return "duplicate"
+
+        inflight[recording_id] = done = asyncio.Event()
+        try:
+            async with processing:
+                return await process_recording(recording_id, FreeSwitchRecordingData(event_data))
+        finally:
+            done.set()
+            del inflight[recording_id]
 
     @app.get("/health")
     async def health_check():
@@ -76,15 +212,18 @@ def create_app(config: FreeSwitchConfig) -> FastAPI:
     @app.post("/webhook/recording", response_class=PlainTextResponse)
     async def recording_event(
         request: Request,
+        background: BackgroundTasks,
         x_freeswitch_signature: str | None = Header(default=None),
     ):
         """Handle FreeSWITCH recording event webhook.
 
         This endpoint receives events from FreeSWITCH when recordings
         are completed. Events can come from mod_http_cache, custom
-        Lua scripts, or dialplan HTTP requests.
+        Lua scripts, or dialplan HTTP requests. The event is
+        acknowledged once validated; the vCon is built and posted in a
+        background task.
         """
-        # Get raw body for signature validation
+        # Get raw body for signature validation and parsing
         body = await request.body()
 
         # Validate signature
@@ -94,64 +233,59 @@ def create_app(config: FreeSwitchConfig) -> FastAPI:
 
         # Parse JSON body
         try:
-            event_data = await request.json()
-        except Exception as e:
-            logger.error(f"Failed to parse JSON body: {e}")
+            event_data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON body: %s", e)
             raise HTTPException(status_code=400, detail="Invalid JSON") from None
+        if not isinstance(event_data, dict):
+            logger.error("Webhook body is not a JSON object")
+            raise HTTPException(status_code=400, detail="Invalid event")
 
-        # Extract recording ID
-        recording_id = event_data.get("uuid", event_data.get("call_uuid", ""))
-
-        if not recording_id:
-            logger.warning("No recording ID in FreeSWITCH event")
-            return "OK"
-
-        logger.info(f"Received FreeSWITCH recording event: uuid={recording_id}")
+        background.add_task(handle_event, event_data)
+        return "OK"
 
-        # Check if already processed
-        if tracker.is_processed(recording_id):
-            logger.info(f"Recording {recording_id} already processed, skipping")
-            return "OK"
+    @app.post("/webhook/recording/batch")
+    async def recording_event_batch(
+        request: Request,
+        x_freeswitch_signature: str | None = Header(default=None),
+    ):
+        """Handle a batch of FreeSWITCH recording events.
 
-        # Parse recording data
-        recording_data = FreeSwitchRecordingData(event_data)
+        The body is newline-delimited JSON (one event per line), signed
+        as a whole. Events are processed concurrently, the state file is
+        written once for the batch, and a status is returned per
+        non-blank line, in order.
+        """
+        body = await request.body()
 
-        # Build vCon
-        vcon = builder.build(recording_data)
-        if not vcon:
-            logger.error(f"Failed to build vCon for recording {recording_id}")
-            tracker.mark_processed(
-                recording_id,
-                "",
-                status="build_failed",
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            return "OK"
+        # Validate signature
+        if not validate_signature(body, x_freeswitch_signature):
+            logger.warning("Invalid FreeSWITCH webhook signature")
+            raise HTTPException(status_code=403, detail="Invalid signature")
 
-        # Post to conserver
-        success = poster.post(vcon)
+        lines = [line for line in body.splitlines() if line.strip()]
+        results = ["invalid_json"] * len(lines)
+        tasks = {}
+        for index, line in enumerate(lines):
+            try:
+                event_data = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                logger.error("Failed to parse JSON line %s: %s", index, e)
+                continue
+            if not isinstance(event_data, dict):
+                logger.error("JSON line %s is not an event object", index)
+                results[index] = "invalid_event"
+                continue
+            tasks[index] = handle_event(event_data)
 
-        if success:
-            tracker.mark_processed(
-                recording_id,
-                vcon.uuid,
-                status="success",
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            logger.info(f"Successfully processed recording {recording_id} -> vCon {vcon.uuid}")
-        else:
-            tracker.mark_processed(
-                recording_id,
-                vcon.uuid,
-                status="post_failed",
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            logger.error(f"Failed to post vCon {vcon.uuid} for recording {recording_id}")
+        try:
+            statuses = await asyncio.gather(*tasks.values())
+        finally:
+            await asyncio.to_thread(tracker.flush)
+        for index, status in zip(tasks, statuses, strict=True):
+            results[index] = status
 
-        return "OK"
+        return {"results": results}
 
     @app.get("/status/{recording_id}")
     async def get_recording_status(recording_id: str):
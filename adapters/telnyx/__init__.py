@@ -1,7 +1,7 @@
 """Telnyx adapter for vCon telephony adapters."""
 
 from .builder import TelnyxRecordingData, TelnyxVconBuilder
-from .config import TelnyxConfig
+from .config import TelnyxConfig, get_config
 from .webhook import create_app
 
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "TelnyxRecordingData",
     "TelnyxVconBuilder",
     "create_app",
+    "get_config",
 ]
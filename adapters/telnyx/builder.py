@@ -1,15 +1,27 @@
 """vCon builder for Telnyx recordings."""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
 import requests
 
-from core.base_builder import BaseRecordingData, BaseVconBuilder
+from core.base_builder import (
+    AudioData,
+    BaseRecordingData,
+    BaseVconBuilder,
+    first_value,
+    parse_iso_timestamp,
+)
+from core.http import DOWNLOAD_TIMEOUT, get_session, read_content
 
 logger = logging.getLogger(__name__)
 
+# Process-wide session shared with the conserver poster
+_SESSION = get_session()
+
 
 class TelnyxRecordingData(BaseRecordingData):
     """Recording data from Telnyx webhook event.
@@ -44,9 +56,27 @@ class TelnyxRecordingData(BaseRecordingData):
     }
     """
 
+    __slots__ = (
+        "_payload",
+        "_event",
+        "_recording_id",
+        "_call_session_id",
+        "_from_number",
+        "_to_number",
+        "_recording_urls",
+        "_direction",
+        "_recording_url",
+        "_duration_seconds",
+        "_start_time",
+        "_platform_tags",
+    )
+
     def __init__(self, event_data: dict[str, Any]):
         """Initialize from Telnyx webhook event data.
 
+        Payload fields and the platform tags are resolved once here
+        rather than on every property access.
+
         Args:
             event_data: Dictionary of Telnyx webhook event
         """
@@ -61,101 +91,119 @@ class TelnyxRecordingData(BaseRecordingData):
             # Flat structure
             self._payload = event_data
             self._event = event_data
+        payload = self._payload
+
+        self._recording_id = first_value(payload, ("recording_id", "call_control_id"))
+        self._call_session_id = payload.get("call_session_id", "")
+        self._from_number = payload.get("from", "")
+        self._to_number = payload.get("to", "")
+        self._recording_urls = payload.get("recording_urls", {})
+
+        direction = payload.get("direction", "incoming")
+        # Telnyx uses "incoming"/"outgoing"
+        if direction == "incoming":
+            self._direction = "inbound"
+        elif direction == "outgoing":
+            self._direction = "outbound"
+        else:
+            self._direction = direction.lower()
+
+        # Prefer wav, then mp3
+        self._recording_url = first_value(self._recording_urls, ("wav", "mp3"))
+        self._duration_seconds = self._parse_duration()
+        self._start_time = self._parse_start_time()
+
+        tags = {
+            "telnyx_recording_id": self._recording_id,
+        }
+        if self._call_session_id:
+            tags["telnyx_call_session_id"] = self._call_session_id
+        if payload.get("call_control_id"):
+            tags["telnyx_call_control_id"] = payload["call_control_id"]
+        if payload.get("connection_id"):
+            tags["telnyx_connection_id"] = payload["connection_id"]
+        if payload.get("channels"):
+            tags["recording_channels"] = payload["channels"]
+        self._platform_tags = tags
+
+    def _parse_duration(self) -> float | None:
+        """Parse the recording duration in seconds."""
+        duration_millis = self._payload.get("duration_millis")
+        if duration_millis is not None:
+            try:
+                return float(duration_millis) / 1000.0
+            except (ValueError, TypeError):
+                return None
+        return None
+
+    def _parse_start_time(self) -> datetime:
+        """Parse the recording start time."""
+        start_str = self._payload.get("start_time")
+        if start_str:
+            try:
+                return parse_iso_timestamp(start_str)
+            except (ValueError, TypeError):
+                pass
+
+        # Fall back to event time
+        occurred_at = self._event.get("occurred_at")
+        if occurred_at:
+            try:
+                return parse_iso_timestamp(occurred_at)
+            except (ValueError, TypeError):
+                pass
+
+        return datetime.now(timezone.utc)
 
     @property
     def recording_id(self) -> str:
         """Telnyx recording ID."""
-        return self._payload.get("recording_id", self._payload.get("call_control_id", ""))
+        return self._recording_id
 
     @property
     def call_session_id(self) -> str:
         """Telnyx call session ID."""
-        return self._payload.get("call_session_id", "")
+        return self._call_session_id
 
     @property
     def from_number(self) -> str:
         """Caller's phone number."""
-        return self._payload.get("from", "")
+        return self._from_number
 
     @property
     def to_number(self) -> str:
         """Called phone number."""
-        return self._payload.get("to", "")
+        return self._to_number
 
     @property
     def direction(self) -> str:
         """Call direction."""
-        direction = self._payload.get("direction", "incoming")
-        # Telnyx uses "incoming"/"outgoing"
-        if direction == "incoming":
-            return "inbound"
-        elif direction == "outgoing":
-            return "outbound"
-        return direction.lower()
+        return self._direction
 
     @property
     def recording_url(self) -> str:
         """URL to download the recording."""
-        urls = self._payload.get("recording_urls", {})
-        # Prefer wav, then mp3
-        return urls.get("wav", urls.get("mp3", ""))
+        return self._recording_url
 
     @property
     def recording_urls(self) -> dict[str, str]:
         """All available recording URLs by format."""
-        return self._payload.get("recording_urls", {})
+        return self._recording_urls
 
     @property
     def duration_seconds(self) -> float | None:
         """Recording duration in seconds."""
-        duration_millis = self._payload.get("duration_millis")
-        if duration_millis is not None:
-            try:
-                return float(duration_millis) / 1000.0
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._duration_seconds
 
     @property
     def start_time(self) -> datetime:
         """Recording start time."""
-        start_str = self._payload.get("start_time")
-        if start_str:
-            try:
-                return datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                pass
-
-        # Fall back to event time
-        occurred_at = self._event.get("occurred_at")
-        if occurred_at:
-            try:
-                return datetime.fromisoformat(occurred_at.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                pass
-
-        return datetime.now(timezone.utc)
+        return self._start_time
 
     @property
     def platform_tags(self) -> dict[str, str]:
         """Telnyx-specific metadata tags."""
-        tags = {
-            "telnyx_recording_id": self.recording_id,
-        }
-
-        if self.call_session_id:
-            tags["telnyx_call_session_id"] = self.call_session_id
-
-        if self._payload.get("call_control_id"):
-            tags["telnyx_call_control_id"] = self._payload["call_control_id"]
-
-        if self._payload.get("connection_id"):
-            tags["telnyx_connection_id"] = self._payload["connection_id"]
-
-        if self._payload.get("channels"):
-            tags["recording_channels"] = self._payload["channels"]
-
-        return tags
+        return self._platform_tags
 
 
 class TelnyxVconBuilder(BaseVconBuilder):
@@ -168,6 +216,7 @@ class TelnyxVconBuilder(BaseVconBuilder):
         download_recordings: bool = True,
         recording_format: str = "wav",
         api_key: str | None = None,
+        parallel_downloads: bool = False,
     ):
         """Initialize Telnyx vCon builder.
 
@@ -175,11 +224,22 @@ class TelnyxVconBuilder(BaseVconBuilder):
             download_recordings: Whether to download and embed recordings
             recording_format: Preferred recording format (wav or mp3)
             api_key: Telnyx API key for authenticated downloads
+            parallel_downloads: Fetch every available format at once so a
+                failed preferred download falls back without waiting
         """
         super().__init__(download_recordings, recording_format)
         self.api_key = api_key
+        self._headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._download_pool = (
+            ThreadPoolExecutor(thread_name_prefix="telnyx-download") if parallel_downloads else None
+        )
+
+    def close(self) -> None:
+        """Shut down the parallel download pool, abandoning queued downloads."""
+        if self._download_pool is not None:
+            self._download_pool.shutdown(wait=False, cancel_futures=True)
 
-    def _download_recording(self, recording_data: BaseRecordingData) -> bytes | None:
+    def _download_recording(self, recording_data: BaseRecordingData) -> AudioData | None:
         """Download recording from Telnyx.
 
         Args:
@@ -188,30 +248,106 @@ class TelnyxVconBuilder(BaseVconBuilder):
         Returns:
             Raw audio bytes or None if download fails
         """
+        return self._download_audio(recording_data)[0]
+
+    def _download_audio(self, recording_data: BaseRecordingData) -> tuple[AudioData | None, str]:
+        """Download recording from Telnyx along with its format.
+
+        The configured format is used when Telnyx offers it; otherwise,
+        or with parallel downloads when it fails, another format stands
+        in and is reported so the dialog is labelled correctly.
+
+        Args:
+            recording_data: Telnyx recording data
+
+        Returns:
+            Tuple of (raw audio or None if download fails, recording format)
+        """
         telnyx_data = recording_data
         if not isinstance(telnyx_data, TelnyxRecordingData):
             logger.error("Expected TelnyxRecordingData")
-            return None
+            return None, self.recording_format
+
+        # Preferred format first, then the others as offered
+        formats = sorted(
+            ((fmt, url) for fmt, url in telnyx_data.recording_urls.items() if url),
+            key=lambda item: item[0] != self.recording_format,
+        )
+        if not formats:
+            logger.error("No recording URL available for %s", telnyx_data.recording_id)
+            return None, self.recording_format
+
+        if self._download_pool is not None and len(formats) > 1:
+            return self._download_any(telnyx_data.recording_id, formats)
+
+        recording_format, recording_url = formats[0]
+        return self._fetch(telnyx_data.recording_id, recording_url), recording_format
+
+    def _download_any(
+        self, recording_id: str, formats: list[tuple[str, str]]
+    ) -> tuple[AudioData | None, str]:
+        """Download all formats concurrently, preferring the first one.
+
+        The preferred format is used whenever it succeeds; the others
+        only stand in when it fails, by which point they are already
+        downloaded or in flight. Once a result is chosen the remaining
+        downloads are abandoned: queued ones are cancelled and running
+        ones stop at their next chunk.
 
-        # Get URL for preferred format
-        urls = telnyx_data.recording_urls
-        recording_url = urls.get(self.recording_format, telnyx_data.recording_url)
+        Args:
+            recording_id: Telnyx recording ID
+            formats: (format, URL) pairs, preferred first
 
-        if not recording_url:
-            logger.error(f"No recording URL available for {telnyx_data.recording_id}")
-            return None
+        Returns:
+            Tuple of (raw audio or None if every download fails, format)
+        """
+        abandoned = threading.Event()
+        futures = [
+            (self._download_pool.submit(self._fetch, recording_id, url, abandoned), fmt)
+            for fmt, url in formats
+        ]
 
         try:
-            logger.debug(f"Downloading recording from: {recording_url}")
+            for future, fmt in futures:
+                audio = future.result()
+                if audio is not None:
+                    return audio, fmt
+            return None, formats[0][0]
+        finally:
+            abandoned.set()
+            for future, _ in futures:
+                future.cancel()
+
+    def _fetch(
+        self, recording_id: str, recording_url: str, abandoned: threading.Event | None = None
+    ) -> AudioData | None:
+        """Download a single recording URL.
 
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
+        Args:
+            recording_id: Telnyx recording ID
+            recording_url: URL to download
+            abandoned: Set once the result is no longer wanted
 
-            response = requests.get(recording_url, headers=headers, timeout=60)
-            response.raise_for_status()
-            return response.content
+        Returns:
+            Raw audio bytes or None if download fails or is abandoned
+        """
+        if abandoned is not None and abandoned.is_set():
+            return None
+
+        try:
+            logger.debug("Downloading recording from: %s", recording_url)
+
+            with _SESSION.get(
+                recording_url, headers=self._headers, timeout=DOWNLOAD_TIMEOUT, stream=True
+            ) as response:
+                response.raise_for_status()
+                content = read_content(response, stop=abandoned)
 
         except requests.RequestException as e:
-            logger.error(f"Failed to download Telnyx recording {telnyx_data.recording_id}: {e}")
+            logger.error("Failed to download Telnyx recording %s: %s", recording_id, e)
+            return None
+
+        if abandoned is not None and abandoned.is_set():
+            # Possibly cut short; the caller has already picked a result
             return None
+        return content
@@ -1,8 +1,11 @@
 """Configuration management for Telnyx adapter."""
 
 import os
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 
-from core.base_config import BaseConfig
+from core.base_config import BaseConfig, env_bool
 
 
 class TelnyxConfig(BaseConfig):
@@ -34,25 +37,41 @@ class TelnyxConfig(BaseConfig):
         self.telnyx_public_key = os.getenv("TELNYX_PUBLIC_KEY")
 
         # Whether to validate webhook signatures
-        self.validate_webhook = os.getenv("VALIDATE_TELNYX_WEBHOOK", "true").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.validate_webhook = env_bool("VALIDATE_TELNYX_WEBHOOK", True)
 
         # Webhook URL (for signature validation)
         self.webhook_url = os.getenv("TELNYX_WEBHOOK_URL")
 
-    def get_api_headers(self) -> dict:
-        """Get headers for Telnyx API requests.
+        # Download every available recording format at once
+        self.parallel_downloads = env_bool("TELNYX_PARALLEL_DOWNLOADS", False)
 
-        Returns:
-            Dictionary of HTTP headers
-        """
+        # The API key is fixed once loaded, so build the headers up front;
+        # the read-only view lets every caller share one mapping
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
         if self.telnyx_api_key:
             headers["Authorization"] = f"Bearer {self.telnyx_api_key}"
-        return headers
+        self._api_headers = MappingProxyType(headers)
+
+    def get_api_headers(self) -> Mapping[str, str]:
+        """Get headers for Telnyx API requests.
+
+        Returns:
+            Read-only mapping of HTTP headers
+        """
+        return self._api_headers
+
+
+@lru_cache(maxsize=1)
+def get_config(env_file: str | None = None) -> TelnyxConfig:
+    """Load the Telnyx configuration once per process.
+
+    Args:
+        env_file: Optional path to .env file
+
+    Returns:
+        Cached TelnyxConfig instance
+    """
+    return TelnyxConfig(env_file)
@@ -1,19 +1,43 @@
 """FastAPI webhook receiver for Telnyx recording events."""
 
+import asyncio
 import base64
+import binascii
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from typing import Any
 
-from fastapi import FastAPI, Header, HTTPException, Request
+import orjson
+from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+except ImportError:
+    InvalidSignature = Ed25519PublicKey = None
+
 from core.poster import HttpPoster
-from core.tracker import StateTracker
+from core.responses import OrjsonResponse
+from core.tracker import create_tracker
 
 from .builder import TelnyxRecordingData, TelnyxVconBuilder
 from .config import TelnyxConfig
 
 logger = logging.getLogger(__name__)
 
+# Event types that carry a finished recording
+_RECORDING_EVENTS = frozenset({"call.recording.saved", "call_recording.saved", "recording.saved"})
+
+# Length of a base64-encoded 64-byte Ed25519 signature
+_SIGNATURE_B64_LENGTH = 88
+
+# Pulls event types out of a raw body without parsing the JSON
+_EVENT_TYPE_RE = re.compile(rb'"event_type"\s*:\s*"([^"\\]+)"')
+_RECORDING_EVENTS_RAW = frozenset(event.encode() for event in _RECORDING_EVENTS)
+
 
 def create_app(config: TelnyxConfig) -> FastAPI:
     """Create and configure the FastAPI application.
@@ -24,10 +48,29 @@ def create_app(config: TelnyxConfig) -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Size the default executor used for downloads, posts and state writes
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=config.worker_threads)
+        )
+        # Persist buffered state updates in the background
+        flusher = asyncio.create_task(tracker.run_flusher())
+        yield
+        flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher
+        await asyncio.to_thread(tracker.flush)
+        tracker.close()
+        builder.close()
+
     app = FastAPI(
         title="vCon Telnyx Adapter",
         description="Receives Telnyx recording events and creates vCons",
         version="0.1.0",
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan,
     )
 
     # Initialize components
@@ -35,9 +78,31 @@ def create_app(config: TelnyxConfig) -> FastAPI:
         download_recordings=config.download_recordings,
         recording_format=config.recording_format,
         api_key=config.telnyx_api_key,
+        parallel_downloads=config.parallel_downloads,
     )
     poster = HttpPoster(config.conserver_url, config.get_headers(), config.ingress_lists)
-    tracker = StateTracker(config.state_file)
+    tracker = create_tracker(config.state_file)
+
+    # Caps recordings being downloaded and base64-encoded at once, so a
+    # burst of webhooks cannot hold that many full recordings in memory
+    downloads = asyncio.Semaphore(config.max_concurrent_downloads)
+
+    # Recordings currently being processed, keyed by recording ID
+    inflight: dict[str, asyncio.Event] = {}
+
+    # Bounds recordings processed at once, so queued background work
+    # waits here rather than piling up on the worker pool
+    processing = asyncio.Semaphore(config.worker_threads)
+
+    # Decode the public key once; it is fixed for the app's lifetime
+    public_key = None
+    if config.telnyx_public_key and Ed25519PublicKey is not None:
+        try:
+            public_key = Ed25519PublicKey.from_public_bytes(
+                base64.b64decode(config.telnyx_public_key)
+            )
+        except ValueError as e:
+            logger.error("Invalid Telnyx public key: %s", e)
 
     def validate_telnyx_signature(
         request_body: bytes,
@@ -66,32 +131,105 @@ def create_app(config: TelnyxConfig) -> FastAPI:
         if not signature or not timestamp:
             return False
 
+        if Ed25519PublicKey is None:
+            logger.warning("cryptography library not installed, skipping signature validation")
+            return True
+
+        if public_key is None:
+            # The configured key could not be decoded
+            return False
+
+        # Reject malformed signatures before decoding or verifying
+        if len(signature) != _SIGNATURE_B64_LENGTH:
+            return False
+
         try:
             # Telnyx signature validation
             # The signature is: ed25519(timestamp + "." + body)
             signed_payload = f"{timestamp}.".encode() + request_body
-
-            # Decode the base64 signature
-            signature_bytes = base64.b64decode(signature)
-
-            # Verify using ed25519 (requires cryptography library)
-            try:
-                from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
-
-                public_key_bytes = base64.b64decode(config.telnyx_public_key)
-                public_key = Ed25519PublicKey.from_public_bytes(public_key_bytes)
-                public_key.verify(signature_bytes, signed_payload)
-                return True
-            except ImportError:
-                logger.warning("cryptography library not installed, skipping signature validation")
-                return True
-            except Exception:
-                return False
-
-        except Exception as e:
-            logger.warning(f"Signature validation error: {e}")
+            public_key.verify(binascii.a2b_base64(signature), signed_payload)
+            return True
+        except (InvalidSignature, ValueError):
             return False
 
+    async def process_recording(recording_id: str, recording_data: TelnyxRecordingData) -> None:
+        """Build, post and record a single recording.
+
+        Args:
+            recording_id: Telnyx recording ID
+            recording_data: Parsed recording data
+        """
+        call_info = {
+            "call_session_id": recording_data.call_session_id,
+            "from_number": recording_data.from_number,
+            "to_number": recording_data.to_number,
+        }
+
+        # Build vCon off the event loop; downloading the recording blocks
+        async with downloads:
+            vcon = await asyncio.to_thread(builder.build, recording_data)
+        if not vcon:
+            logger.error("Failed to build vCon for recording %s", recording_id)
+            tracker.mark_processed_buffered(recording_id, "", status="build_failed", **call_info)
+            return
+
+        # Post to conserver
+        success = await asyncio.to_thread(poster.post, vcon)
+
+        if success:
+            tracker.mark_processed_buffered(recording_id, vcon.uuid, status="success", **call_info)
+            logger.info("Successfully processed recording %s -> vCon %s", recording_id, vcon.uuid)
+        else:
+            tracker.mark_processed_buffered(
+                recording_id, vcon.uuid, status="post_failed", **call_info
+            )
+            logger.error("Failed to post vCon %s for recording %s", vcon.uuid, recording_id)
+
+    async def handle_event(event_data: dict[str, Any]) -> None:
+        """Process a single Telnyx webhook event.
+
+        Args:
+            event_data: Parsed webhook event
+        """
+        # Check event type
+        data = event_data.get("data", event_data)
+        event_type = data.get("event_type", "")
+
+        # Only process recording saved events
+        if event_type not in _RECORDING_EVENTS:
+            logger.debug("Ignoring Telnyx event type: %s", event_type)
+            return
+
+        # Parse recording data
+        recording_data = TelnyxRecordingData(event_data)
+        recording_id = recording_data.recording_id
+
+        if not recording_id:
+            logger.warning("No recording ID in Telnyx event")
+            return
+
+        logger.info("Received Telnyx recording event: recording_id=%s", recording_id)
+
+        # Check if already processed
+        if tracker.is_processed(recording_id):
+            logger.info("Recording %s already processed, skipping", recording_id)
+            return
+
+        # Coalesce concurrent deliveries of the same recording (webhook retries)
+        pending = inflight.get(recording_id)
+        if pending is not None:
+            logger.info("Recording %s already in progress, waiting", recording_id)
+            await pending.wait()
+            return
+
+        inflight[recording_id] = done = asyncio.Event()
+        try:
+            async with processing:
+                await process_recording(recording_id, recording_data)
+        finally:
+            done.set()
+            del inflight[recording_id]
+
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
@@ -100,13 +238,16 @@ def create_app(config: TelnyxConfig) -> FastAPI:
     @app.post("/webhook/recording", response_class=PlainTextResponse)
     async def recording_event(
         request: Request,
+        background: BackgroundTasks,
         telnyx_signature_ed25519: str | None = Header(default=None),
         telnyx_timestamp: str | None = Header(default=None),
     ):
         """Handle Telnyx recording webhook event.
 
         This endpoint receives call.recording.saved events from
-        Telnyx when call recordings are completed.
+        Telnyx when call recordings are completed. The event is
+        acknowledged once validated; the vCon is built and posted in a
+        background task.
         """
         # Get raw body for signature validation
         body = await request.body()
@@ -116,75 +257,26 @@ def create_app(config: TelnyxConfig) -> FastAPI:
             logger.warning("Invalid Telnyx webhook signature")
             raise HTTPException(status_code=403, detail="Invalid signature")
 
-        # Parse JSON body
-        try:
-            event_data = await request.json()
-        except Exception as e:
-            logger.error(f"Failed to parse JSON body: {e}")
-            raise HTTPException(status_code=400, detail="Invalid JSON") from None
-
-        # Check event type
-        data = event_data.get("data", event_data)
-        event_type = data.get("event_type", "")
-
-        # Only process recording saved events
-        if event_type not in ("call.recording.saved", "call_recording.saved", "recording.saved"):
-            logger.debug(f"Ignoring Telnyx event type: {event_type}")
-            return "OK"
-
-        # Parse recording data
-        recording_data = TelnyxRecordingData(event_data)
-        recording_id = recording_data.recording_id
-
-        if not recording_id:
-            logger.warning("No recording ID in Telnyx event")
-            return "OK"
-
-        logger.info(f"Received Telnyx recording event: recording_id={recording_id}")
-
-        # Check if already processed
-        if tracker.is_processed(recording_id):
-            logger.info(f"Recording {recording_id} already processed, skipping")
-            return "OK"
-
-        # Build vCon
-        vcon = builder.build(recording_data)
-        if not vcon:
-            logger.error(f"Failed to build vCon for recording {recording_id}")
-            tracker.mark_processed(
-                recording_id,
-                "",
-                status="build_failed",
-                call_session_id=recording_data.call_session_id,
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
+        # Telnyx sends every call event to the same URL; most are not
+        # recordings, so answer those before parsing the body
+        event_types = _EVENT_TYPE_RE.findall(body)
+        if event_types and _RECORDING_EVENTS_RAW.isdisjoint(event_types):
+            logger.debug(
+                "Ignoring Telnyx event type: %s", event_types[0].decode("utf-8", "replace")
             )
             return "OK"
 
-        # Post to conserver
-        success = poster.post(vcon)
-
-        if success:
-            tracker.mark_processed(
-                recording_id,
-                vcon.uuid,
-                status="success",
-                call_session_id=recording_data.call_session_id,
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            logger.info(f"Successfully processed recording {recording_id} -> vCon {vcon.uuid}")
-        else:
-            tracker.mark_processed(
-                recording_id,
-                vcon.uuid,
-                status="post_failed",
-                call_session_id=recording_data.call_session_id,
-                from_number=recording_data.from_number,
-                to_number=recording_data.to_number,
-            )
-            logger.error(f"Failed to post vCon {vcon.uuid} for recording {recording_id}")
+        # Parse JSON body
+        try:
+            event_data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON body: %s", e)
+            raise HTTPException(status_code=400, detail="Invalid JSON") from None
+        if not isinstance(event_data, dict):
+            logger.error("Webhook body is not a JSON object")
+            raise HTTPException(status_code=400, detail="Invalid event")
 
+        background.add_task(handle_event, event_data)
         return "OK"
 
     @app.get("/status/{recording_id}")
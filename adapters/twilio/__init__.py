@@ -1,7 +1,7 @@
 """Twilio adapter for converting recordings to vCon format."""
 
 from .builder import TwilioRecordingData, TwilioVconBuilder
-from .config import TwilioConfig
+from .config import TwilioConfig, get_config
 from .webhook import create_app
 
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "TwilioRecordingData",
     "TwilioVconBuilder",
     "create_app",
+    "get_config",
 ]
@@ -1,24 +1,60 @@
 """vCon builder to create vCons from Twilio recordings."""
 
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
-import requests
-
 from core.base_builder import BaseRecordingData, BaseVconBuilder
+from core.http import DOWNLOAD_TIMEOUT, get_session, read_content
 
 logger = logging.getLogger(__name__)
 
+# Process-wide session shared with the conserver poster
+_SESSION = get_session()
+
 
 class TwilioRecordingData(BaseRecordingData):
     """Data class to hold Twilio recording webhook data."""
 
-    def __init__(self, webhook_data: dict[str, Any]):
+    __slots__ = (
+        "recording_sid",
+        "account_sid",
+        "call_sid",
+        "_recording_url",
+        "recording_status",
+        "recording_duration",
+        "recording_channels",
+        "recording_source",
+        "recording_start_time",
+        "_from_number",
+        "_to_number",
+        "caller",
+        "called",
+        "_direction",
+        "call_status",
+        "api_version",
+        "forwarded_from",
+        "caller_city",
+        "caller_state",
+        "caller_zip",
+        "caller_country",
+        "called_city",
+        "called_state",
+        "called_zip",
+        "called_country",
+        "_duration_seconds",
+        "_start_time",
+        "_platform_tags",
+    )
+
+    def __init__(self, webhook_data: Mapping[str, Any]):
         """Initialize from Twilio webhook payload.
 
         Args:
-            webhook_data: Dictionary of Twilio webhook parameters
+            webhook_data: Mapping of Twilio webhook parameters (a dict or
+                the request's FormData)
         """
         # Core identifiers
         self.recording_sid = webhook_data.get("RecordingSid", "")
@@ -36,8 +72,8 @@ class TwilioRecordingData(BaseRecordingData):
         # Call participants
         self._from_number = webhook_data.get("From", "")
         self._to_number = webhook_data.get("To", "")
-        self.caller = webhook_data.get("Caller", self._from_number)
-        self.called = webhook_data.get("Called", self._to_number)
+        self.caller = webhook_data.get("Caller") or self._from_number
+        self.called = webhook_data.get("Called") or self._to_number
 
         # Direction and status
         self._direction = webhook_data.get("Direction", "")
@@ -55,39 +91,13 @@ class TwilioRecordingData(BaseRecordingData):
         self.called_zip = webhook_data.get("CalledZip")
         self.called_country = webhook_data.get("CalledCountry")
 
-        # Store raw data for additional fields
-        self._raw_data = webhook_data
-
-    # BaseRecordingData abstract property implementations
-
-    @property
-    def recording_id(self) -> str:
-        """Platform-specific recording identifier."""
-        return self.recording_sid
-
-    @property
-    def from_number(self) -> str:
-        """Caller's phone number."""
-        return self._from_number
-
-    @property
-    def to_number(self) -> str:
-        """Callee's phone number."""
-        return self._to_number
-
-    @property
-    def direction(self) -> str:
-        """Call direction."""
-        return self._direction
-
-    @property
-    def recording_url(self) -> str:
-        """URL to download the recording."""
-        return self._recording_url
+        # Resolved once; read by build() and platform_tags
+        self._duration_seconds = self._parse_duration()
+        self._start_time = self._parse_start_time()
+        self._platform_tags = self._build_platform_tags()
 
-    @property
-    def duration_seconds(self) -> float | None:
-        """Get recording duration in seconds."""
+    def _parse_duration(self) -> float | None:
+        """Parse the recording duration in seconds."""
         if self.recording_duration:
             try:
                 return float(self.recording_duration)
@@ -95,22 +105,18 @@ class TwilioRecordingData(BaseRecordingData):
                 return None
         return None
 
-    @property
-    def start_time(self) -> datetime:
-        """Get recording start time as datetime."""
+    def _parse_start_time(self) -> datetime:
+        """Parse the recording start time."""
         if self.recording_start_time:
             try:
                 # Twilio sends timestamps in RFC 2822 format
-                from email.utils import parsedate_to_datetime
-
                 return parsedate_to_datetime(self.recording_start_time)
-            except Exception:
+            except (ValueError, TypeError):
                 pass
         return datetime.now(timezone.utc)
 
-    @property
-    def platform_tags(self) -> dict[str, str]:
-        """Twilio-specific tags to add to the vCon."""
+    def _build_platform_tags(self) -> dict[str, str]:
+        """Build the Twilio-specific tags."""
         tags = {
             "recording_sid": self.recording_sid,
             "call_sid": self.call_sid,
@@ -123,8 +129,8 @@ class TwilioRecordingData(BaseRecordingData):
         if self.recording_source:
             tags["recording_source"] = self.recording_source
 
-        if self.duration_seconds is not None:
-            tags["duration_seconds"] = f"{self.duration_seconds:.2f}"
+        if self._duration_seconds is not None:
+            tags["duration_seconds"] = f"{self._duration_seconds:.2f}"
 
         # Add geographic metadata if available
         if self.caller_city:
@@ -142,6 +148,48 @@ class TwilioRecordingData(BaseRecordingData):
 
         return tags
 
+    # BaseRecordingData abstract property implementations
+
+    @property
+    def recording_id(self) -> str:
+        """Platform-specific recording identifier."""
+        return self.recording_sid
+
+    @property
+    def from_number(self) -> str:
+        """Caller's phone number."""
+        return self._from_number
+
+    @property
+    def to_number(self) -> str:
+        """Callee's phone number."""
+        return self._to_number
+
+    @property
+    def direction(self) -> str:
+        """Call direction."""
+        return self._direction
+
+    @property
+    def recording_url(self) -> str:
+        """URL to download the recording."""
+        return self._recording_url
+
+    @property
+    def duration_seconds(self) -> float | None:
+        """Get recording duration in seconds."""
+        return self._duration_seconds
+
+    @property
+    def start_time(self) -> datetime:
+        """Get recording start time as datetime."""
+        return self._start_time
+
+    @property
+    def platform_tags(self) -> dict[str, str]:
+        """Twilio-specific tags to add to the vCon."""
+        return self._platform_tags
+
 
 class TwilioVconBuilder(BaseVconBuilder):
     """Builds vCon objects from Twilio recording data."""
@@ -164,7 +212,7 @@ class TwilioVconBuilder(BaseVconBuilder):
         super().__init__(download_recordings, recording_format)
         self.twilio_auth = twilio_auth
 
-    def _download_recording(self, recording_data: BaseRecordingData) -> bytes | None:
+    def _download_recording(self, recording_data: BaseRecordingData) -> bytearray | None:
         """Download recording audio from Twilio.
 
         Args:
@@ -178,22 +226,28 @@ class TwilioVconBuilder(BaseVconBuilder):
             return None
 
         # Append format extension to get the audio file
-        url = f"{recording_url}.{self.recording_format}"
+        url = recording_url + self._ext
 
         try:
-            response = requests.get(url, auth=self.twilio_auth, timeout=60)
-
-            if response.status_code == 200:
-                logger.debug(f"Downloaded recording: {len(response.content)} bytes")
-                return response.content
-            else:
-                logger.error(
-                    f"Failed to download recording from {url}: " f"status {response.status_code}"
-                )
-                return None
+            # Stream the body so a long recording is read once into a
+            # single buffer rather than also held as urllib3 chunks
+            with _SESSION.get(
+                url, auth=self.twilio_auth, timeout=DOWNLOAD_TIMEOUT, stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(
+                        "Failed to download recording from %s: status %s",
+                        url,
+                        response.status_code,
+                    )
+                    return None
+
+                content = read_content(response)
+                logger.debug("Downloaded recording: %s bytes", len(content))
+                return content
 
         except Exception as e:
-            logger.error(f"Error downloading recording from {url}: {e}")
+            logger.error("Error downloading recording from %s: %s", url, e)
             return None
 
 
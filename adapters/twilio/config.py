@@ -1,8 +1,9 @@
 """Twilio-specific configuration extending base config."""
 
 import os
+from functools import lru_cache
 
-from core.base_config import BaseConfig
+from core.base_config import BaseConfig, env_bool
 
 
 class TwilioConfig(BaseConfig):
@@ -22,11 +23,7 @@ class TwilioConfig(BaseConfig):
         # Twilio-specific settings
         self.twilio_account_sid = os.getenv("TWILIO_ACCOUNT_SID")
         self.twilio_auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-        self.validate_twilio_signature = os.getenv("VALIDATE_TWILIO_SIGNATURE", "true").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.validate_twilio_signature = env_bool("VALIDATE_TWILIO_SIGNATURE", True)
 
         if self.validate_twilio_signature and not self.twilio_auth_token:
             raise ValueError("TWILIO_AUTH_TOKEN is required when VALIDATE_TWILIO_SIGNATURE is true")
@@ -34,8 +31,26 @@ class TwilioConfig(BaseConfig):
         # Webhook URL for signature validation (optional, can be auto-detected)
         self.webhook_url = os.getenv("WEBHOOK_URL")
 
+        # Credentials are fixed once loaded, so build the auth tuple up front
+        self._twilio_auth = (
+            (self.twilio_account_sid, self.twilio_auth_token)
+            if self.twilio_account_sid and self.twilio_auth_token
+            else None
+        )
+
     def get_twilio_auth(self) -> tuple | None:
         """Get Twilio authentication tuple for API requests."""
-        if self.twilio_account_sid and self.twilio_auth_token:
-            return (self.twilio_account_sid, self.twilio_auth_token)
-        return None
+        return self._twilio_auth
+
+
+@lru_cache(maxsize=1)
+def get_config(env_file: str | None = None) -> TwilioConfig:
+    """Load the Twilio configuration once per process.
+
+    Args:
+        env_file: Optional path to .env file
+
+    Returns:
+        Cached TwilioConfig instance
+    """
+    return TwilioConfig(env_file)
@@ -1,13 +1,17 @@
 """FastAPI webhook receiver for Twilio recording status callbacks."""
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI, Form, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 from twilio.request_validator import RequestValidator
 
 from core.poster import HttpPoster
-from core.tracker import StateTracker
+from core.responses import OrjsonResponse
+from core.tracker import create_tracker
 
 from .builder import TwilioRecordingData, TwilioVconBuilder
 from .config import TwilioConfig
@@ -24,10 +28,28 @@ def create_app(config: TwilioConfig) -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Size the default executor used for downloads, posts and state writes
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=config.worker_threads)
+        )
+        # Persist buffered state updates in the background
+        flusher = asyncio.create_task(tracker.run_flusher())
+        yield
+        flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher
+        await asyncio.to_thread(tracker.flush)
+        tracker.close()
+
     app = FastAPI(
         title="vCon Twilio Adapter",
         description="Receives Twilio recording webhooks and creates vCons",
         version="0.1.0",
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan,
     )
 
     # Initialize components
@@ -37,7 +59,11 @@ def create_app(config: TwilioConfig) -> FastAPI:
         twilio_auth=config.get_twilio_auth(),
     )
     poster = HttpPoster(config.conserver_url, config.get_headers(), config.ingress_lists)
-    tracker = StateTracker(config.state_file)
+    tracker = create_tracker(config.state_file)
+
+    # Caps recordings being downloaded and base64-encoded at once, so a
+    # burst of webhooks cannot hold that many full recordings in memory
+    downloads = asyncio.Semaphore(config.max_concurrent_downloads)
 
     # Twilio signature validator
     validator = None
@@ -68,14 +94,17 @@ def create_app(config: TwilioConfig) -> FastAPI:
 
         # Get the signature header
         signature = request.headers.get("X-Twilio-Signature", "")
+        if not signature:
+            logger.warning("Missing Twilio signature for request to %s", url)
+            raise HTTPException(status_code=403, detail="Invalid Twilio signature")
 
-        # Get form data for validation
+        # FormData is a multi-dict the validator reads directly (via
+        # getlist), so there is no need to copy it into a plain dict
         form_data = await request.form()
-        params = dict(form_data.items())
 
         # Validate the request
-        if not validator.validate(url, params, signature):
-            logger.warning(f"Invalid Twilio signature for request to {url}")
+        if not validator.validate(url, form_data, signature):
+            logger.warning("Invalid Twilio signature for request to %s", url)
             raise HTTPException(status_code=403, detail="Invalid Twilio signature")
 
         return True
@@ -86,34 +115,7 @@ def create_app(config: TwilioConfig) -> FastAPI:
         return {"status": "healthy", "service": "vcon-telephony-adapters-twilio"}
 
     @app.post("/webhook/recording", response_class=PlainTextResponse)
-    async def recording_status_callback(
-        request: Request,
-        RecordingSid: str = Form(...),
-        AccountSid: str = Form(default=""),
-        CallSid: str = Form(default=""),
-        RecordingUrl: str = Form(default=""),
-        RecordingStatus: str = Form(default=""),
-        RecordingDuration: str | None = Form(default=None),
-        RecordingChannels: str = Form(default="1"),
-        RecordingSource: str = Form(default=""),
-        RecordingStartTime: str | None = Form(default=None),
-        From: str = Form(default="", alias="From"),
-        To: str = Form(default="", alias="To"),
-        Caller: str = Form(default=""),
-        Called: str = Form(default=""),
-        Direction: str = Form(default=""),
-        CallStatus: str = Form(default=""),
-        ApiVersion: str = Form(default=""),
-        ForwardedFrom: str | None = Form(default=None),
-        CallerCity: str | None = Form(default=None),
-        CallerState: str | None = Form(default=None),
-        CallerZip: str | None = Form(default=None),
-        CallerCountry: str | None = Form(default=None),
-        CalledCity: str | None = Form(default=None),
-        CalledState: str | None = Form(default=None),
-        CalledZip: str | None = Form(default=None),
-        CalledCountry: str | None = Form(default=None),
-    ):
+    async def recording_status_callback(request: Request):
         """Handle Twilio recording status callback.
 
         This endpoint receives webhooks from Twilio when recordings are ready.
@@ -122,90 +124,59 @@ def create_app(config: TwilioConfig) -> FastAPI:
         # Validate Twilio signature
         await validate_twilio_request(request)
 
+        # Starlette caches the parsed form, so this reuses the parse done
+        # for signature validation; the FormData mapping is handed to
+        # TwilioRecordingData as-is instead of being copied per field
+        form = await request.form()
+        recording_sid = form.get("RecordingSid")
+        if not recording_sid:
+            raise HTTPException(status_code=422, detail="Missing RecordingSid")
+        recording_status = form.get("RecordingStatus", "")
+
         logger.info(
-            f"Received recording callback: RecordingSid={RecordingSid}, "
-            f"Status={RecordingStatus}, CallSid={CallSid}"
+            "Received recording callback: RecordingSid=%s, Status=%s, CallSid=%s",
+            recording_sid,
+            recording_status,
+            form.get("CallSid", ""),
         )
 
         # Only process completed recordings
-        if RecordingStatus != "completed":
-            logger.info(f"Ignoring recording {RecordingSid} with status: {RecordingStatus}")
+        if recording_status != "completed":
+            logger.info("Ignoring recording %s with status: %s", recording_sid, recording_status)
             return "OK"
 
         # Check if already processed
-        if tracker.is_processed(RecordingSid):
-            logger.info(f"Recording {RecordingSid} already processed, skipping")
+        if tracker.is_processed(recording_sid):
+            logger.info("Recording %s already processed, skipping", recording_sid)
             return "OK"
 
-        # Build webhook data dictionary
-        webhook_data = {
-            "RecordingSid": RecordingSid,
-            "AccountSid": AccountSid,
-            "CallSid": CallSid,
-            "RecordingUrl": RecordingUrl,
-            "RecordingStatus": RecordingStatus,
-            "RecordingDuration": RecordingDuration,
-            "RecordingChannels": RecordingChannels,
-            "RecordingSource": RecordingSource,
-            "RecordingStartTime": RecordingStartTime,
-            "From": From,
-            "To": To,
-            "Caller": Caller or From,
-            "Called": Called or To,
-            "Direction": Direction,
-            "CallStatus": CallStatus,
-            "ApiVersion": ApiVersion,
-            "ForwardedFrom": ForwardedFrom,
-            "CallerCity": CallerCity,
-            "CallerState": CallerState,
-            "CallerZip": CallerZip,
-            "CallerCountry": CallerCountry,
-            "CalledCity": CalledCity,
-            "CalledState": CalledState,
-            "CalledZip": CalledZip,
-            "CalledCountry": CalledCountry,
-        }
-
         # Parse recording data
-        recording_data = TwilioRecordingData(webhook_data)
+        recording_data = TwilioRecordingData(form)
+        call_info = {
+            "call_sid": recording_data.call_sid,
+            "from_number": recording_data.from_number,
+            "to_number": recording_data.to_number,
+        }
 
-        # Build vCon
-        vcon = builder.build(recording_data)
+        # Build vCon off the event loop; downloading the recording blocks
+        async with downloads:
+            vcon = await asyncio.to_thread(builder.build, recording_data)
         if not vcon:
-            logger.error(f"Failed to build vCon for recording {RecordingSid}")
-            tracker.mark_processed(
-                RecordingSid,
-                "",
-                status="build_failed",
-                call_sid=CallSid,
-                from_number=From,
-                to_number=To,
-            )
+            logger.error("Failed to build vCon for recording %s", recording_sid)
+            tracker.mark_processed_buffered(recording_sid, "", status="build_failed", **call_info)
             return "OK"
 
         # Post to conserver
-        success = poster.post(vcon)
+        success = await asyncio.to_thread(poster.post, vcon)
 
         if success:
-            tracker.mark_processed(
-                RecordingSid,
-                vcon.uuid,
-                status="success",
-                call_sid=CallSid,
-                from_number=From,
-                to_number=To,
-            )
-            logger.info(f"Successfully processed recording {RecordingSid} -> vCon {vcon.uuid}")
+            tracker.mark_processed_buffered(recording_sid, vcon.uuid, status="success", **call_info)
+            logger.info("Successfully processed recording %s -> vCon %s", recording_sid, vcon.uuid)
         else:
-            tracker.mark_processed(
-                RecordingSid,
-                vcon.uuid,
-                status="post_failed",
-                call_sid=CallSid,
-                from_number=From,
-                to_number=To,
+            tracker.mark_processed_buffered(
+                recording_sid, vcon.uuid, status="post_failed", **call_info
             )
-            logger.error(f"Failed to post vCon {vcon.uuid} for recording {RecordingSid}")
+            logger.error("Failed to post vCon %s for recording %s", vcon.uuid, recording_sid)
 
         # Always return 200 OK to Twilio to prevent retries
         return "OK"
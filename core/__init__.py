@@ -3,11 +3,13 @@
 from .base_builder import BaseVconBuilder
 from .base_config import BaseConfig
 from .poster import HttpPoster
-from .tracker import StateTracker
+from .tracker import SqliteStateTracker, StateTracker, create_tracker
 
 __all__ = [
     "HttpPoster",
     "StateTracker",
+    "SqliteStateTracker",
+    "create_tracker",
     "BaseConfig",
     "BaseVconBuilder",
 ]
@@ -2,22 +2,105 @@
 
 import base64
 import logging
+import mmap
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any
 
 from vcon import Vcon
 from vcon.dialog import Dialog
 from vcon.party import Party
 
+try:
+    # SIMD base64 encoder from the optional "speedups" extra
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:
+
+    def _b64encode(data: bytes | bytearray | mmap.mmap) -> str:
+        """Base64-encode data to a str with the stdlib encoder."""
+        return base64.b64encode(data).decode("ascii")
+
+
 logger = logging.getLogger(__name__)
 
 
+# Raw recording audio as returned by _download_recording
+AudioData = bytes | bytearray | mmap.mmap
+
+# Direction values meaning the platform placed the call
+_OUTBOUND_DIRECTIONS = frozenset({"outbound", "outbound-api", "outgoing"})
+
 # MIME type mapping for recording formats
-MIME_TYPES = {
-    "wav": "audio/wav",
-    "mp3": "audio/mpeg",
-}
+MIME_TYPES = MappingProxyType(
+    {
+        "wav": "audio/wav",
+        "mp3": "audio/mpeg",
+    }
+)
+
+
+def parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp as sent in webhook payloads.
+
+    Platforms overwhelmingly send UTC timestamps shaped like
+    ``2024-01-15T10:30:00Z`` or ``2024-01-15T10:30:00.000Z``; those are
+    sliced at fixed offsets. Anything else falls back to fromisoformat.
+
+    Args:
+        value: Timestamp string
+
+    Returns:
+        Timezone-aware datetime
+
+    Raises:
+        ValueError: If the value is not a valid ISO-8601 timestamp
+    """
+    length = len(value)
+    if (
+        (length == 20 or (length == 24 and value[19] == "."))
+        and value[-1] == "Z"
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+    ):
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            int(value[20:23]) * 1000 if length == 24 else 0,
+            tzinfo=timezone.utc,
+        )
+
+    # fromisoformat accepts a trailing "Z" natively since Python 3.11
+    return datetime.fromisoformat(value)
+
+
+def first_value(data: dict[str, Any], keys: tuple[str, ...], default: Any = "") -> Any:
+    """Get the value of the first key present in a payload.
+
+    Platforms name the same field differently depending on how the
+    event was sent; keys are tried in order and the lookup stops at
+    the first one with a non-None value.
+
+    Args:
+        data: Event payload
+        keys: Candidate keys in order of preference
+        default: Value returned when none of the keys are present
+
+    Returns:
+        First matching value, or default
+    """
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return default
 
 
 class BaseRecordingData(ABC):
@@ -27,6 +110,9 @@ class BaseRecordingData(ABC):
     platform-specific data into a common format.
     """
 
+    # Allow subclasses to declare __slots__ and drop the per-instance __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def recording_id(self) -> str:
@@ -99,9 +185,15 @@ class BaseVconBuilder(ABC):
         """
         self.download_recordings = download_recordings
         self.recording_format = recording_format
+        # Both depend only on the format, so resolve them once per builder
+        self._mime_type = MIME_TYPES.get(recording_format, "audio/wav")
+        self._ext = f".{recording_format}"
+
+        # Choose how recordings are attached once rather than on every build
+        self._dialog_content = self._embedded_content if download_recordings else self._url_content
 
     @abstractmethod
-    def _download_recording(self, recording_data: BaseRecordingData) -> bytes | None:
+    def _download_recording(self, recording_data: BaseRecordingData) -> AudioData | None:
         """Download recording audio from the platform.
 
         Args:
@@ -112,6 +204,21 @@ class BaseVconBuilder(ABC):
         """
         pass
 
+    def _download_audio(self, recording_data: BaseRecordingData) -> tuple[AudioData | None, str]:
+        """Download recording audio along with the format it was fetched in.
+
+        Builders that may fall back to a format other than the
+        configured one override this so the dialog is labelled with
+        what was actually downloaded.
+
+        Args:
+            recording_data: Recording data with URL and auth info
+
+        Returns:
+            Tuple of (raw audio or None if download fails, recording format)
+        """
+        return self._download_recording(recording_data), self.recording_format
+
     def _determine_originator(self, direction: str) -> int:
         """Determine which party originated the call.
 
@@ -123,10 +230,62 @@ class BaseVconBuilder(ABC):
         """
         # outbound = we called them, so party 0 initiated
         # inbound = they called us, so party 1 initiated
-        if direction.lower() in ("outbound", "outbound-api", "outgoing"):
+        if direction.lower() in _OUTBOUND_DIRECTIONS:
             return 0
         return 1
 
+    def _url_content(self, recording_data: BaseRecordingData) -> dict[str, Any]:
+        """Dialog fields referencing the recording by URL.
+
+        Args:
+            recording_data: Platform-specific recording data
+
+        Returns:
+            Dialog keyword arguments, empty if there is no recording URL
+        """
+        if not recording_data.recording_url:
+            return {}
+        return {"url": recording_data.recording_url + self._ext}
+
+    def _embedded_content(self, recording_data: BaseRecordingData) -> dict[str, Any]:
+        """Dialog fields embedding the downloaded recording.
+
+        Falls back to a URL reference if the download fails.
+
+        Args:
+            recording_data: Platform-specific recording data
+
+        Returns:
+            Dialog keyword arguments, empty if there is no recording URL
+        """
+        if not recording_data.recording_url:
+            return {}
+
+        audio_data, recording_format = self._download_audio(recording_data)
+        if not audio_data:
+            logger.warning(
+                "Download failed, using URL reference for %s", recording_data.recording_id
+            )
+            return self._url_content(recording_data)
+
+        try:
+            audio_base64 = _b64encode(audio_data)
+        finally:
+            if isinstance(audio_data, mmap.mmap):
+                # Release the file mapping now, even if encoding failed,
+                # instead of waiting for GC
+                audio_data.close()
+        if recording_format == self.recording_format:
+            mime_type, ext = self._mime_type, self._ext
+        else:
+            mime_type, ext = MIME_TYPES.get(recording_format, "audio/wav"), f".{recording_format}"
+        return {
+            "body": audio_base64,
+            "encoding": "base64",
+            "filename": recording_data.recording_id + ext,
+            "mimetype": mime_type,
+        }
+
     def build(self, recording_data: BaseRecordingData) -> Vcon | None:
         """Build a vCon from recording data.
 
@@ -153,45 +312,19 @@ class BaseVconBuilder(ABC):
             vcon.add_party(caller_party)
             vcon.add_party(callee_party)
 
-            # Determine who initiated based on direction
-            originator = self._determine_originator(recording_data.direction)
-
-            # Build dialog
-            mime_type = MIME_TYPES.get(self.recording_format, "audio/wav")
-            dialog_kwargs: dict[str, Any] = {
-                "type": "recording",
-                "start": start_time,
-                "parties": [0, 1],
-                "originator": originator,
-                "mimetype": mime_type,
-            }
-
-            # Add duration if available
-            if recording_data.duration_seconds is not None:
-                dialog_kwargs["duration"] = recording_data.duration_seconds
-
-            # Download and embed recording if configured
-            if self.download_recordings and recording_data.recording_url:
-                audio_data = self._download_recording(recording_data)
-                if audio_data:
-                    audio_base64 = base64.b64encode(audio_data).decode("utf-8")
-                    dialog_kwargs["body"] = audio_base64
-                    dialog_kwargs["encoding"] = "base64"
-                    dialog_kwargs["filename"] = (
-                        f"{recording_data.recording_id}.{self.recording_format}"
-                    )
-                else:
-                    # Fall back to URL reference if download fails
-                    logger.warning(
-                        f"Download failed, using URL reference for {recording_data.recording_id}"
-                    )
-                    dialog_kwargs["url"] = f"{recording_data.recording_url}.{self.recording_format}"
-            elif recording_data.recording_url:
-                # Use URL reference without downloading
-                dialog_kwargs["url"] = f"{recording_data.recording_url}.{self.recording_format}"
-
-            # Create dialog
-            dialog = Dialog(**dialog_kwargs)
+            # Build dialog; unset fields (e.g. an unknown duration) are
+            # dropped when the dialog is serialized. Embedded audio
+            # carries the MIME type of the format actually downloaded.
+            content = self._dialog_content(recording_data)
+            dialog = Dialog(
+                type="recording",
+                start=start_time,
+                parties=[0, 1],
+                originator=self._determine_originator(recording_data.direction),
+                mimetype=content.pop("mimetype", self._mime_type),
+                duration=recording_data.duration_seconds,
+                **content,
+            )
             vcon.add_dialog(dialog)
 
             # Add source tag
@@ -202,12 +335,17 @@ class BaseVconBuilder(ABC):
                 vcon.add_tag(tag_name, tag_value)
 
             logger.info(
-                f"Created vCon {vcon.uuid} from recording {recording_data.recording_id} "
-                f"(from: {recording_data.from_number}, to: {recording_data.to_number})"
+                "Created vCon %s from recording %s (from: %s, to: %s)",
+                vcon.uuid,
+                recording_data.recording_id,
+                recording_data.from_number,
+                recording_data.to_number,
             )
 
             return vcon
 
         except Exception as e:
-            logger.error(f"Error building vCon from recording {recording_data.recording_id}: {e}")
+            logger.error(
+                "Error building vCon from recording %s: %s", recording_data.recording_id, e
+            )
             return None
@@ -1,9 +1,48 @@
 """Base configuration management for telephony adapters."""
 
 import os
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 
+# Values treated as true for boolean environment variables
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on", "y"})
+
+
+def env_bool(key: str, default: bool = False) -> bool:
+    """Read a boolean environment variable.
+
+    Args:
+        key: Environment variable name
+        default: Value to use when the variable is unset
+
+    Returns:
+        True if the value is one of true/1/yes/on/y (case-insensitive)
+    """
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return value.lower() in _TRUE_VALUES
+
+
+@cache
+def _load_env_file(env_file: str | None) -> None:
+    """Load a .env file into the environment once per process.
+
+    Every adapter config and ``get_config`` call would otherwise re-read
+    and re-parse the same file. Values already present in the
+    environment still take precedence over the file.
+
+    Args:
+        env_file: Path to .env file, or None to search for one
+    """
+    if env_file:
+        load_dotenv(env_file)
+    else:
+        load_dotenv()
+
 
 class BaseConfig:
     """Base configuration class with common settings for all adapters.
@@ -17,10 +56,7 @@ class BaseConfig:
         Args:
             env_file: Optional path to .env file
         """
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            load_dotenv()
+        _load_env_file(env_file)
 
         # Server settings
         self.host = os.getenv("HOST", "0.0.0.0")
@@ -38,18 +74,14 @@ class BaseConfig:
         # State tracking
         self.state_file = os.getenv("STATE_FILE", ".adapter_state.json")
 
-        # Ingress lists for vCon routing
+        # Ingress lists for vCon routing; a tuple so the config stays read-only
         ingress_lists_str = os.getenv("INGRESS_LISTS", "")
-        self.ingress_lists: list[str] = [
+        self.ingress_lists: tuple[str, ...] = tuple(
             item.strip() for item in ingress_lists_str.split(",") if item.strip()
-        ]
+        )
 
         # Recording download settings
-        self.download_recordings = os.getenv("DOWNLOAD_RECORDINGS", "true").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.download_recordings = env_bool("DOWNLOAD_RECORDINGS", True)
 
         # Recording format preference (wav or mp3)
         self.recording_format = os.getenv("RECORDING_FORMAT", "wav").lower()
@@ -61,9 +93,18 @@ class BaseConfig:
         # Logging level
         self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 
-    def get_headers(self) -> dict[str, str]:
-        """Get HTTP headers for conserver requests."""
+        # Worker threads for blocking work (downloads, posts, state writes)
+        self.worker_threads = int(os.getenv("WORKER_THREADS", "32"))
+
+        # Recordings downloaded and encoded at once; bounds peak memory
+        self.max_concurrent_downloads = int(os.getenv("MAX_CONCURRENT_DOWNLOADS", "8"))
+
+        # Conserver headers are fixed for the life of the config
         headers = {"Content-Type": "application/json"}
         if self.conserver_api_token:
             headers[self.conserver_header_name] = self.conserver_api_token
-        return headers
+        self._headers = MappingProxyType(headers)
+
+    def get_headers(self) -> Mapping[str, str]:
+        """Get HTTP headers for conserver requests."""
+        return self._headers
@@ -0,0 +1,118 @@
+"""Shared HTTP session configuration for telephony adapters."""
+
+import threading
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts for recording downloads
+DOWNLOAD_TIMEOUT = (5, 60)
+
+# Status codes that indicate a transient upstream failure worth retrying
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Chunk size used when streaming response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Largest Content-Length trusted for preallocating a response buffer
+MAX_PREALLOCATE = 256 * 1024 * 1024
+
+
+def create_session(
+    pool_connections: int = 16,
+    pool_maxsize: int = 32,
+    retries: int = 3,
+    backoff_factor: float = 0.2,
+) -> requests.Session:
+    """Create a requests session with connection pooling and retries.
+
+    Reusing a session keeps TCP/TLS connections alive across requests
+    to the same host instead of paying a new handshake per call.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum connections kept alive per host
+        retries: Number of retries on connection errors and transient statuses
+        backoff_factor: Backoff factor between retries
+
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        # Hand the final response back so callers can inspect/raise on it
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """Get the process-wide HTTP session.
+
+    Recording downloads and conserver posts share this session so
+    they draw on one pool of kept-alive connections.
+
+    Returns:
+        Shared requests session
+    """
+    return create_session()
+
+
+def read_content(
+    response: requests.Response,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    stop: threading.Event | None = None,
+) -> bytearray:
+    """Read a streamed response body into a single buffer.
+
+    The buffer is preallocated from Content-Length when the server
+    sends one, so chunks are copied into place rather than appended.
+    This avoids holding urllib3's chunk list and a joined bytes copy
+    of the body at the same time. Negative lengths, or lengths above
+    MAX_PREALLOCATE, are not trusted; the buffer then grows as data
+    arrives.
+
+    Args:
+        response: Response obtained with stream=True
+        chunk_size: Size of chunks to read from the socket
+        stop: Event that, once set, ends the read early; the caller
+            then discards the partial body
+
+    Returns:
+        Response body
+    """
+    try:
+        expected = int(response.headers.get("Content-Length", 0))
+    except (TypeError, ValueError):
+        expected = 0
+    if not 0 < expected <= MAX_PREALLOCATE:
+        expected = 0
+
+    buf = bytearray(expected)
+    offset = 0
+    for chunk in response.iter_content(chunk_size):
+        if stop is not None and stop.is_set():
+            break
+        end = offset + len(chunk)
+        # Copies into the preallocated space; grows the buffer if the
+        # body turns out longer than advertised (e.g. content-encoded)
+        buf[offset:end] = chunk
+        offset = end
+
+    # Drop unused space if the body was shorter than advertised
+    del buf[offset:]
+    return buf
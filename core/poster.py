@@ -1,17 +1,25 @@
 """HTTP poster to send vCons to conserver endpoint."""
 
 import logging
+from collections.abc import Mapping, Sequence
 
-import requests
+import orjson
 from vcon import Vcon
 
+from core.http import get_session
+
 logger = logging.getLogger(__name__)
 
+# Process-wide session shared with recording downloads
+_SESSION = get_session()
+
 
 class HttpPoster:
     """Posts vCons to HTTP conserver endpoint."""
 
-    def __init__(self, url: str, headers: dict[str, str], ingress_lists: list[str] | None = None):
+    def __init__(
+        self, url: str, headers: Mapping[str, str], ingress_lists: Sequence[str] | None = None
+    ):
         """Initialize HTTP poster.
 
         Args:
@@ -23,6 +31,10 @@ class HttpPoster:
         self.headers = headers
         self.ingress_lists = ingress_lists or []
 
+        # Routing is fixed per poster, so build the query and log text once
+        self._params = {"ingress_lists": ",".join(self.ingress_lists)} if self.ingress_lists else {}
+        self._ingress_log = ", ".join(self.ingress_lists)
+
     def post(self, vcon: Vcon) -> bool:
         """Post vCon to conserver endpoint.
 
@@ -33,39 +45,44 @@ class HttpPoster:
             True if post was successful, False otherwise
         """
         try:
-            # Build URL with ingress_lists query parameter if configured
             url = self.url
-            params = {}
-            if self.ingress_lists:
-                params["ingress_lists"] = ",".join(self.ingress_lists)
+            if self._params:
                 logger.info(
-                    f"Posting vCon {vcon.uuid} to {url} "
-                    f"with ingress_lists: {', '.join(self.ingress_lists)}"
+                    "Posting vCon %s to %s with ingress_lists: %s",
+                    vcon.uuid,
+                    url,
+                    self._ingress_log,
                 )
             else:
-                logger.info(f"Posting vCon {vcon.uuid} to {url}")
+                logger.info("Posting vCon %s to %s", vcon.uuid, url)
 
-            # Convert vCon to JSON
-            vcon_json = vcon.to_json()
+            # Serialize the vCon dict straight to UTF-8 JSON bytes; orjson is
+            # much faster than vcon.to_json() on large base64 recordings
+            vcon_json = orjson.dumps(vcon.vcon_dict)
 
             # POST to endpoint
-            response = requests.post(
-                url, params=params, data=vcon_json, headers=self.headers, timeout=30
+            response = _SESSION.post(
+                url, params=self._params, data=vcon_json, headers=self.headers, timeout=30
             )
 
             # Check if response indicates success
             if 200 <= response.status_code < 300:
                 logger.info(
-                    f"Successfully posted vCon {vcon.uuid} " f"(status: {response.status_code})"
+                    "Successfully posted vCon %s (status: %s)", vcon.uuid, response.status_code
                 )
                 return True
             else:
+                # Decode only the preview; response.text would decode (and
+                # charset-sniff) a possibly large error page in full
+                preview = response.content[:200].decode("utf-8", errors="replace")
                 logger.error(
-                    f"Failed to post vCon {vcon.uuid} "
-                    f"(status: {response.status_code}, response: {response.text[:200]})"
+                    "Failed to post vCon %s (status: %s, response: %s)",
+                    vcon.uuid,
+                    response.status_code,
+                    preview,
                 )
                 return False
 
         except Exception as e:
-            logger.error(f"Error posting vCon {vcon.uuid} to {self.url}: {e}")
+            logger.error("Error posting vCon %s to %s: %s", vcon.uuid, self.url, e)
             return False
@@ -0,0 +1,21 @@
+"""Response classes shared by the adapter web apps."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize response content to JSON bytes.
+
+        Args:
+            content: JSON-serializable content
+
+        Returns:
+            Encoded JSON body
+        """
+        return orjson.dumps(content)
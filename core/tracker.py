@@ -1,12 +1,57 @@
 """State tracker to prevent reprocessing of recordings."""
 
-import json
+import asyncio
 import logging
+import os
+import sqlite3
+import threading
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Seconds between background flushes of buffered state
+FLUSH_INTERVAL = 0.25
+
+# Number of buffered updates that triggers an early flush
+FLUSH_BACKLOG = 64
+
+# Number of journal lines after which the state file is rewritten
+COMPACT_THRESHOLD = 1024
+
+# State file suffixes that select the SQLite-backed tracker
+SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+
+@lru_cache(maxsize=1)
+def _utc_second(epoch_seconds: int) -> str:
+    """Format whole UTC seconds; marks within one second share the result."""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO-8601 with microseconds.
+
+    Roughly twice as fast as ``datetime.now(timezone.utc).isoformat()``,
+    which matters when a catch-up run marks many recordings at once.
+    """
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    return f"{_utc_second(seconds)}.{micros:06d}+00:00"
+
+
+def _make_entry(vcon_uuid: str, status: str, metadata: dict) -> dict:
+    """Build the stored entry for a processed recording."""
+    return {
+        "vcon_uuid": vcon_uuid,
+        "timestamp": _utc_timestamp(),
+        "status": status,
+        **metadata,
+    }
+
 
 class StateTracker:
     """Tracks processed recordings to avoid duplicates.
@@ -14,6 +59,11 @@ class StateTracker:
     This is a generic tracker that works with any telephony platform.
     The recording_id is platform-specific (e.g., RecordingSid for Twilio,
     recording UUID for FreeSWITCH, etc.)
+
+    State is kept as a compact JSON snapshot plus an append-only
+    journal (``<state_file>.log``, one JSON line per mark). Marks append
+    to the journal; the snapshot is only rewritten on flush or once the
+    journal reaches COMPACT_THRESHOLD lines.
     """
 
     def __init__(self, state_file: str):
@@ -24,28 +74,172 @@ class StateTracker:
         """
         self.state_file = Path(state_file)
         self.state: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        # Serializes snapshot writes, which run outside _lock
+        self._save_lock = threading.Lock()
+        self._pending = 0
+        self._flush_requested: asyncio.Event | None = None
+        self.journal_file = self.state_file.with_name(f"{self.state_file.name}.log")
+        self.rotated_journal_file = self.state_file.with_name(f"{self.state_file.name}.log.1")
+        self._journal = None
+        self._journal_entries = 0
+        self._unsynced = False
         self._load()
 
     def _load(self):
-        """Load state from file."""
+        """Load state from file, then replay the journal over it."""
         if self.state_file.exists():
             try:
-                with open(self.state_file) as f:
-                    self.state = json.load(f)
-                logger.info(f"Loaded state for {len(self.state)} processed recordings")
+                self.state = orjson.loads(self.state_file.read_bytes())
             except Exception as e:
-                logger.error(f"Error loading state file: {e}")
+                logger.error("Error loading state file: %s", e)
                 self.state = {}
         else:
             self.state = {}
 
+        # A rotated journal is older than the current one
+        for journal_file in (self.rotated_journal_file, self.journal_file):
+            if not journal_file.exists():
+                continue
+            try:
+                with open(journal_file, "rb") as f:
+                    for line in f:
+                        try:
+                            record = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            # A torn final line from a crash mid-append
+                            logger.warning("Skipping unreadable journal line in %s", journal_file)
+                            continue
+                        # Later lines win, so each id keeps its latest entry
+                        self.state[record["id"]] = record["entry"]
+                        self._journal_entries += 1
+            except Exception as e:
+                logger.error("Error replaying state journal: %s", e)
+
+        logger.info("Loaded state for %d processed recordings", len(self.state))
+
+    def _append(self, recording_id: str, entry: dict):
+        """Append one entry to the journal.
+
+        Must be called with the lock held.
+
+        Args:
+            recording_id: Platform-specific recording identifier
+            entry: State entry for the recording
+        """
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, "ab", buffering=1 << 16)
+            self._journal.write(orjson.dumps({"id": recording_id, "entry": entry}) + b"\n")
+            # Hand the line to the OS so it survives a process crash;
+            # fsync is left to the flusher
+            self._journal.flush()
+            self._journal_entries += 1
+            self._unsynced = True
+        except Exception as e:
+            logger.error("Error appending to state journal: %s", e)
+
+    def _sync(self):
+        """fsync journal lines appended since the last sync."""
+        with self._lock:
+            if not self._unsynced or self._journal is None:
+                return
+            self._unsynced = False
+            try:
+                os.fsync(self._journal.fileno())
+            except Exception as e:
+                logger.error("Error syncing state journal: %s", e)
+
     def _save(self):
-        """Save state to file."""
+        """Save state to file and drop the journal it supersedes.
+
+        Only a shallow copy of the state and a rename of the journal to
+        ``<state_file>.log.1`` happen under the lock, so buffered marks
+        on the event loop never wait on the snapshot write. Marks made
+        meanwhile go to a fresh journal. The snapshot is written to a
+        temporary file and renamed over the state file so a crash
+        mid-write never leaves it truncated; the rotated journal is
+        replayed on load until the snapshot lands.
+        """
+        tmp_file = self.state_file.with_name(f"{self.state_file.name}.tmp")
+        with self._save_lock:
+            with self._lock:
+                self._pending = 0
+                snapshot = self.state.copy()
+                self._rotate_journal()
+
+            try:
+                tmp_file.write_bytes(orjson.dumps(snapshot))
+                os.replace(tmp_file, self.state_file)
+            except Exception as e:
+                logger.error("Error saving state file: %s", e)
+                return
+
+            try:
+                self.rotated_journal_file.unlink(missing_ok=True)
+            except Exception as e:
+                logger.error("Error removing rotated state journal: %s", e)
+
+    def _rotate_journal(self):
+        """Move the journal aside so new marks start a fresh one.
+
+        Must be called with the lock held. If an earlier save failed and
+        left a rotated journal behind, the current journal is appended
+        to it rather than replacing it.
+        """
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._journal_entries = 0
+        self._unsynced = False
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(self.state, f, indent=2)
+            if not self.journal_file.exists():
+                return
+            if self.rotated_journal_file.exists():
+                with open(self.rotated_journal_file, "ab") as f:
+                    f.write(self.journal_file.read_bytes())
+                self.journal_file.unlink()
+            else:
+                os.replace(self.journal_file, self.rotated_journal_file)
         except Exception as e:
-            logger.error(f"Error saving state file: {e}")
+            logger.error("Error rotating state journal: %s", e)
+
+    def flush(self):
+        """Write buffered and journaled updates to the state file, if any."""
+        if self._pending or self._journal_entries:
+            self._save()
+
+    def close(self):
+        """Close the journal file, if open.
+
+        Call after the final flush(); a later mark reopens it.
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    async def run_flusher(self, interval: float = FLUSH_INTERVAL):
+        """Periodically flush buffered updates until cancelled.
+
+        Flushes every ``interval`` seconds, or sooner once
+        FLUSH_BACKLOG updates are waiting. Journal appends made since
+        the last pass are fsynced together.
+
+        Args:
+            interval: Seconds between flushes
+        """
+        self._flush_requested = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=interval)
+            except TimeoutError:
+                pass
+            self._flush_requested.clear()
+            if self._pending:
+                await asyncio.to_thread(self._save)
+            elif self._unsynced:
+                await asyncio.to_thread(self._sync)
 
     def is_processed(self, recording_id: str) -> bool:
         """Check if recording has been processed.
@@ -63,22 +257,51 @@ class StateTracker:
     ):
         """Mark recording as processed.
 
+        The entry is appended to the journal rather than rewriting the
+        state file. Blocks on a file write, so async callers should run
+        it via asyncio.to_thread.
+
+        Args:
+            recording_id: Platform-specific recording identifier
+            vcon_uuid: UUID of the created vCon
+            status: Processing status (success, failed, etc.)
+            **metadata: Additional platform-specific metadata to store
+        """
+        entry = _make_entry(vcon_uuid, status, metadata)
+
+        with self._lock:
+            self.state[recording_id] = entry
+            self._append(recording_id, entry)
+            compact = self._journal_entries >= COMPACT_THRESHOLD
+        if compact:
+            self._save()
+        logger.debug("Marked recording %s as processed (status: %s)", recording_id, status)
+
+    def mark_processed_buffered(
+        self, recording_id: str, vcon_uuid: str, status: str = "success", **metadata
+    ):
+        """Mark recording as processed without writing the state file.
+
+        The update is visible immediately and persisted by run_flusher
+        or the next flush(). Must be called from the event loop thread
+        running the flusher.
+
         Args:
             recording_id: Platform-specific recording identifier
             vcon_uuid: UUID of the created vCon
             status: Processing status (success, failed, etc.)
             **metadata: Additional platform-specific metadata to store
         """
-        entry = {
-            "vcon_uuid": vcon_uuid,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "status": status,
-            **metadata,
-        }
+        entry = _make_entry(vcon_uuid, status, metadata)
+
+        with self._lock:
+            self.state[recording_id] = entry
+            self._pending += 1
+            backlog = self._pending
 
-        self.state[recording_id] = entry
-        self._save()
-        logger.debug(f"Marked recording {recording_id} as processed (status: {status})")
+        if backlog >= FLUSH_BACKLOG and self._flush_requested is not None:
+            self._flush_requested.set()
+        logger.debug("Buffered recording %s as processed (status: %s)", recording_id, status)
 
     def get_vcon_uuid(self, recording_id: str) -> str | None:
         """Get vCon UUID for a processed recording.
@@ -114,3 +337,146 @@ class StateTracker:
             Full metadata dict or None if not processed
         """
         return self.state.get(recording_id)
+
+
+class SqliteStateTracker:
+    """Tracks processed recordings in a SQLite database.
+
+    An alternative to StateTracker for deployments that run several
+    worker processes against one state file, or that track too many
+    recordings to hold in memory. Nothing is loaded at startup: lookups
+    use the primary-key index and each mark is a single-row upsert.
+
+    The database runs in WAL mode with synchronous=NORMAL, so a commit
+    appends to the write-ahead log without an fsync.
+    """
+
+    def __init__(self, state_file: str):
+        """Initialize state tracker.
+
+        Args:
+            state_file: Path to SQLite database storing state
+        """
+        self.state_file = Path(state_file)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.state_file, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed "
+            "(recording_id TEXT PRIMARY KEY, entry BLOB NOT NULL)"
+        )
+
+    def _get(self, recording_id: str) -> dict | None:
+        """Fetch the stored entry for a recording."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT entry FROM processed WHERE recording_id = ?", (recording_id,)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def flush(self):
+        """Nothing is buffered; every mark is committed as it is made."""
+
+    async def run_flusher(self, interval: float = FLUSH_INTERVAL):
+        """Nothing is buffered, so there is no background work.
+
+        Provided so adapters can start a flusher for either tracker.
+
+        Args:
+            interval: Unused
+        """
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def is_processed(self, recording_id: str) -> bool:
+        """Check if recording has been processed.
+
+        Args:
+            recording_id: Platform-specific recording identifier
+
+        Returns:
+            True if recording has been processed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM processed WHERE recording_id = ?", (recording_id,)
+            ).fetchone()
+        return row is not None
+
+    def mark_processed(
+        self, recording_id: str, vcon_uuid: str, status: str = "success", **metadata
+    ):
+        """Mark recording as processed.
+
+        Args:
+            recording_id: Platform-specific recording identifier
+            vcon_uuid: UUID of the created vCon
+            status: Processing status (success, failed, etc.)
+            **metadata: Additional platform-specific metadata to store
+        """
+        entry = orjson.dumps(_make_entry(vcon_uuid, status, metadata))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO processed (recording_id, entry) VALUES (?, ?)",
+                (recording_id, entry),
+            )
+        logger.debug("Marked recording %s as processed (status: %s)", recording_id, status)
+
+    # A WAL commit without fsync is cheap enough to run on the event loop
+    mark_processed_buffered = mark_processed
+
+    def get_vcon_uuid(self, recording_id: str) -> str | None:
+        """Get vCon UUID for a processed recording.
+
+        Args:
+            recording_id: Platform-specific recording identifier
+
+        Returns:
+            vCon UUID or None if not processed
+        """
+        entry = self._get(recording_id)
+        return entry.get("vcon_uuid") if entry else None
+
+    def get_processing_status(self, recording_id: str) -> str | None:
+        """Get processing status for a recording.
+
+        Args:
+            recording_id: Platform-specific recording identifier
+
+        Returns:
+            Processing status or None if not processed
+        """
+        entry = self._get(recording_id)
+        return entry.get("status") if entry else None
+
+    def get_metadata(self, recording_id: str) -> dict | None:
+        """Get all metadata for a processed recording.
+
+        Args:
+            recording_id: Platform-specific recording identifier
+
+        Returns:
+            Full metadata dict or None if not processed
+        """
+        return self._get(recording_id)
+
+
+def create_tracker(state_file: str) -> StateTracker | SqliteStateTracker:
+    """Create the tracker matching a state file path.
+
+    Paths ending in .db, .sqlite or .sqlite3 use SqliteStateTracker;
+    anything else uses the JSON-backed StateTracker.
+
+    Args:
+        state_file: Path to the state file
+
+    Returns:
+        State tracker for the path
+    """
+    if Path(state_file).suffix.lower() in SQLITE_SUFFIXES:
+        return SqliteStateTracker(state_file)
+    return StateTracker(state_file)
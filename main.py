@@ -10,6 +10,7 @@ Supports running individual adapters via command line argument:
     python main.py             # Default: Run Twilio adapter
 """
 
+import importlib
 import logging
 import sys
 
@@ -28,146 +29,78 @@ def setup_logging(level: str = "INFO"):
     )
 
 
-def run_twilio_adapter():
-    """Run the Twilio adapter."""
-    from adapters.twilio import TwilioConfig, create_app
-
-    # Load configuration
-    config = TwilioConfig()
-
-    # Setup logging
-    setup_logging(config.log_level)
-    logger = logging.getLogger(__name__)
-
-    logger.info("Starting vCon Twilio Adapter...")
-    logger.info(f"Conserver URL: {config.conserver_url}")
-    logger.info(f"Twilio signature validation: {config.validate_twilio_signature}")
-    logger.info(f"Download recordings: {config.download_recordings}")
-    logger.info(f"Recording format: {config.recording_format}")
-
-    # Create FastAPI app
-    app = create_app(config)
-
-    # Run server
-    logger.info(f"Starting server on {config.host}:{config.port}")
-    uvicorn.run(app, host=config.host, port=config.port, log_level=config.log_level.lower())
-
-
-def run_freeswitch_adapter():
-    """Run the FreeSWITCH adapter."""
-    from adapters.freeswitch import FreeSwitchConfig, create_app
-
-    # Load configuration
-    config = FreeSwitchConfig()
-
-    # Setup logging
-    setup_logging(config.log_level)
-    logger = logging.getLogger(__name__)
-
-    logger.info("Starting vCon FreeSWITCH Adapter...")
-    logger.info(f"Conserver URL: {config.conserver_url}")
-    logger.info(f"Recordings path: {config.recordings_path}")
-    logger.info(f"Webhook validation: {config.validate_webhook}")
-    logger.info(f"Download recordings: {config.download_recordings}")
-    logger.info(f"Recording format: {config.recording_format}")
-
-    # Create FastAPI app
-    app = create_app(config)
-
-    # Run server
-    logger.info(f"Starting server on {config.host}:{config.port}")
-    uvicorn.run(app, host=config.host, port=config.port, log_level=config.log_level.lower())
-
-
-def run_asterisk_adapter():
-    """Run the Asterisk adapter."""
-    from adapters.asterisk import AsteriskConfig, create_app
-
-    # Load configuration
-    config = AsteriskConfig()
-
-    # Setup logging
-    setup_logging(config.log_level)
-    logger = logging.getLogger(__name__)
-
-    logger.info("Starting vCon Asterisk Adapter...")
-    logger.info(f"Conserver URL: {config.conserver_url}")
-    logger.info(f"ARI URL: {config.asterisk_ari_url}")
-    logger.info(f"Recordings path: {config.recordings_path}")
-    logger.info(f"Webhook validation: {config.validate_webhook}")
-    logger.info(f"Download recordings: {config.download_recordings}")
-    logger.info(f"Recording format: {config.recording_format}")
-
-    # Create FastAPI app
-    app = create_app(config)
-
-    # Run server
-    logger.info(f"Starting server on {config.host}:{config.port}")
-    uvicorn.run(app, host=config.host, port=config.port, log_level=config.log_level.lower())
-
-
-def run_telnyx_adapter():
-    """Run the Telnyx adapter."""
-    from adapters.telnyx import TelnyxConfig, create_app
-
-    # Load configuration
-    config = TelnyxConfig()
-
-    # Setup logging
-    setup_logging(config.log_level)
-    logger = logging.getLogger(__name__)
+# Adapter name -> (display name, adapter-specific settings logged at startup)
+ADAPTERS = {
+    "twilio": (
+        "Twilio",
+        (("Twilio signature validation", "validate_twilio_signature"),),
+    ),
+    "freeswitch": (
+        "FreeSWITCH",
+        (
+            ("Recordings path", "recordings_path"),
+            ("Webhook validation", "validate_webhook"),
+        ),
+    ),
+    "asterisk": (
+        "Asterisk",
+        (
+            ("ARI URL", "asterisk_ari_url"),
+            ("Recordings path", "recordings_path"),
+            ("Webhook validation", "validate_webhook"),
+        ),
+    ),
+    "telnyx": (
+        "Telnyx",
+        (
+            ("Telnyx API URL", "telnyx_api_url"),
+            ("Webhook validation", "validate_webhook"),
+        ),
+    ),
+    "bandwidth": (
+        "Bandwidth",
+        (
+            ("Bandwidth Voice API", "bandwidth_voice_api_url"),
+            ("Webhook validation", "validate_webhook"),
+        ),
+    ),
+}
 
-    logger.info("Starting vCon Telnyx Adapter...")
-    logger.info(f"Conserver URL: {config.conserver_url}")
-    logger.info(f"Telnyx API URL: {config.telnyx_api_url}")
-    logger.info(f"Webhook validation: {config.validate_webhook}")
-    logger.info(f"Download recordings: {config.download_recordings}")
-    logger.info(f"Recording format: {config.recording_format}")
 
-    # Create FastAPI app
-    app = create_app(config)
-
-    # Run server
-    logger.info(f"Starting server on {config.host}:{config.port}")
-    uvicorn.run(app, host=config.host, port=config.port, log_level=config.log_level.lower())
+def run_adapter(name: str):
+    """Run the named adapter.
 
+    Only the selected adapter package is imported, so its platform SDK
+    is loaded but the other adapters' dependencies are not.
 
-def run_bandwidth_adapter():
-    """Run the Bandwidth adapter."""
-    from adapters.bandwidth import BandwidthConfig, create_app
+    Args:
+        name: Adapter name, a key of ADAPTERS
+    """
+    display_name, settings = ADAPTERS[name]
+    adapter = importlib.import_module(f"adapters.{name}")
 
     # Load configuration
-    config = BandwidthConfig()
+    config = adapter.get_config()
 
     # Setup logging
     setup_logging(config.log_level)
     logger = logging.getLogger(__name__)
 
-    logger.info("Starting vCon Bandwidth Adapter...")
+    logger.info(f"Starting vCon {display_name} Adapter...")
     logger.info(f"Conserver URL: {config.conserver_url}")
-    logger.info(f"Bandwidth Voice API: {config.bandwidth_voice_api_url}")
-    logger.info(f"Webhook validation: {config.validate_webhook}")
+    for label, attribute in settings:
+        logger.info(f"{label}: {getattr(config, attribute)}")
     logger.info(f"Download recordings: {config.download_recordings}")
     logger.info(f"Recording format: {config.recording_format}")
 
     # Create FastAPI app
-    app = create_app(config)
+    app = adapter.create_app(config)
 
     # Run server
     logger.info(f"Starting server on {config.host}:{config.port}")
     uvicorn.run(app, host=config.host, port=config.port, log_level=config.log_level.lower())
 
 
-# Registry of available adapters
-ADAPTERS = {
-    "twilio": run_twilio_adapter,
-    "freeswitch": run_freeswitch_adapter,
-    "asterisk": run_asterisk_adapter,
-    "telnyx": run_telnyx_adapter,
-    "bandwidth": run_bandwidth_adapter,
-}
-
-
 def main():
     """Main entry point."""
     try:
@@ -194,7 +127,7 @@ def main():
             sys.exit(1)
 
         # Run the selected adapter
-        ADAPTERS[adapter_name]()
+        run_adapter(adapter_name)
 
     except ValueError as e:
         print(f"Configuration error: {e}", file=sys.stderr)
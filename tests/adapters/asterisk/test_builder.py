@@ -1,112 +1,166 @@
 """Tests for Asterisk vCon builder."""
 
+import mmap
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+import requests
 
 from adapters.asterisk.builder import AsteriskRecordingData, AsteriskVconBuilder
 
 
-class TestAsteriskRecordingData:
-    """Tests for AsteriskRecordingData class."""
+class StreamedResponse:
+    """Lightweight stand-in for a successful streamed download response."""
 
-    @pytest.fixture
-    def sample_ari_event(self):
-        """Sample Asterisk ARI event data."""
-        return {
+    status_code = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, *chunks: bytes):
+        self._chunks = chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        return iter(self._chunks)
+
+
+@pytest.fixture(scope="module")
+def _session_get():
+    """Patch the shared session's get once for the whole module."""
+    with patch("adapters.asterisk.builder._SESSION.get") as mock_get:
+        yield mock_get
+
+
+@pytest.fixture(autouse=True)
+def mock_get(_session_get):
+    """Session get mock, reset per test so no test reaches the network."""
+    _session_get.reset_mock(return_value=True, side_effect=True)
+    return _session_get
+
+
+@pytest.fixture(scope="module")
+def sample_ari_event():
+    """Sample Asterisk ARI event data."""
+    return {
+        "recording_name": "rec-abc123",
+        "name": "rec-abc123",
+        "target_uri": "file:/var/spool/asterisk/recording/rec-abc123.wav",
+        "format": "wav",
+        "duration": 30,
+        "channel_id": "channel-123",
+        "caller_id_num": "+15551234567",
+        "caller_id_name": "John Doe",
+        "connected_line_num": "+15559876543",
+        "direction": "inbound",
+        "context": "from-external",
+        "timestamp": "2024-01-15T10:29:30Z",
+        "Uniqueid": "1705312170.123",
+        "application": "MixMonitor",
+    }
+
+
+@pytest.fixture(scope="module")
+def asterisk_data(sample_ari_event):
+    """Recording data parsed once from the sample event; tests only read it."""
+    return AsteriskRecordingData(sample_ari_event)
+
+
+@pytest.fixture(scope="module")
+def sample_recording_data():
+    """Create sample recording data."""
+    return AsteriskRecordingData(
+        {
             "recording_name": "rec-abc123",
-            "name": "rec-abc123",
-            "target_uri": "file:/var/spool/asterisk/recording/rec-abc123.wav",
-            "format": "wav",
-            "duration": 30,
-            "channel_id": "channel-123",
             "caller_id_num": "+15551234567",
-            "caller_id_name": "John Doe",
             "connected_line_num": "+15559876543",
             "direction": "inbound",
-            "context": "from-external",
+            "duration": 30,
             "timestamp": "2024-01-15T10:29:30Z",
-            "Uniqueid": "1705312170.123",
-            "application": "MixMonitor",
         }
+    )
 
-    def test_recording_id(self, sample_ari_event):
-        """Test recording_id extraction."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.recording_id == "rec-abc123"
-
-    def test_recording_id_fallback(self):
-        """Test recording_id fallback to Uniqueid."""
-        data = AsteriskRecordingData({"Uniqueid": "1705312170.456"})
-        assert data.recording_id == "1705312170.456"
-
-    def test_from_number(self, sample_ari_event):
-        """Test from_number extraction."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.from_number == "+15551234567"
-
-    def test_from_number_fallback(self):
-        """Test from_number fallback to CallerIDNum."""
-        data = AsteriskRecordingData({"CallerIDNum": "+15550001111"})
-        assert data.from_number == "+15550001111"
-
-    def test_to_number(self, sample_ari_event):
-        """Test to_number extraction."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.to_number == "+15559876543"
-
-    def test_to_number_fallback(self):
-        """Test to_number fallback to extension."""
-        data = AsteriskRecordingData({"extension": "100"})
-        assert data.to_number == "100"
-
-    def test_direction_explicit(self, sample_ari_event):
-        """Test direction when explicitly set."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.direction == "inbound"
-
-    def test_direction_inferred_outbound(self):
-        """Test direction inferred from context."""
-        data = AsteriskRecordingData({"context": "from-internal"})
-        assert data.direction == "outbound"
-
-    def test_direction_inferred_inbound(self):
-        """Test direction default to inbound."""
-        data = AsteriskRecordingData({})
-        assert data.direction == "inbound"
 
-    def test_recording_url(self, sample_ari_event):
-        """Test recording_url extraction."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.recording_url == "file:/var/spool/asterisk/recording/rec-abc123.wav"
-
-    def test_recording_file_path(self, sample_ari_event):
-        """Test recording_file_path extraction."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.recording_file_path == "/var/spool/asterisk/recording/rec-abc123.wav"
+class TestAsteriskRecordingData:
+    """Tests for AsteriskRecordingData class."""
 
-    def test_recording_format(self, sample_ari_event):
-        """Test recording_format extraction."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.recording_format == "wav"
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("recording_id", "rec-abc123"),
+            ("from_number", "+15551234567"),
+            ("to_number", "+15559876543"),
+            ("direction", "inbound"),
+            ("recording_url", "file:/var/spool/asterisk/recording/rec-abc123.wav"),
+            ("recording_file_path", "/var/spool/asterisk/recording/rec-abc123.wav"),
+            ("recording_format", "wav"),
+            ("duration_seconds", 30.0),
+        ],
+    )
+    def test_fields(self, asterisk_data, attr, expected):
+        """Test fields extracted from a full ARI event."""
+        assert getattr(asterisk_data, attr) == expected
+
+    @pytest.mark.parametrize(
+        ("event", "attr", "expected"),
+        [
+            ({"Uniqueid": "1705312170.456"}, "recording_id", "1705312170.456"),
+            ({"CallerIDNum": "+15550001111"}, "from_number", "+15550001111"),
+            ({"extension": "100"}, "to_number", "100"),
+            ({"context": "from-internal"}, "direction", "outbound"),
+            ({"context": "Trunk-Outbound"}, "direction", "outbound"),
+            ({"context": None}, "direction", "inbound"),
+            ({}, "direction", "inbound"),
+            ({}, "duration_seconds", None),
+        ],
+        ids=[
+            "recording_id-uniqueid",
+            "from_number-calleridnum",
+            "to_number-extension",
+            "direction-from-context",
+            "direction-context-case-insensitive",
+            "direction-null-context",
+            "direction-default",
+            "duration_seconds-missing",
+        ],
+    )
+    def test_field_fallbacks(self, event, attr, expected):
+        """Test fallback keys and defaults for sparse events."""
+        data = AsteriskRecordingData(event)
+        assert getattr(data, attr) == expected
+
+    def test_null_fields(self):
+        """Test null and non-string fields fall back instead of raising."""
+        data = AsteriskRecordingData(
+            {
+                "recording_name": "rec-null",
+                "direction": None,
+                "context": None,
+                "target_uri": None,
+            }
+        )
 
-    def test_duration_seconds(self, sample_ari_event):
-        """Test duration_seconds extraction."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.duration_seconds == 30.0
+        assert data.direction == "inbound"
+        assert data.recording_url == ""
+        assert data.recording_file_path == "rec-null"
+        assert AsteriskRecordingData({"direction": 1, "context": 2}).direction == "inbound"
 
-    def test_duration_seconds_none(self):
-        """Test duration_seconds when not provided."""
-        data = AsteriskRecordingData({})
-        assert data.duration_seconds is None
+    def test_no_instance_dict(self, asterisk_data):
+        """Test instances use slots instead of a per-instance __dict__."""
+        assert not hasattr(asterisk_data, "__dict__")
 
-    def test_start_time_iso(self, sample_ari_event):
+    def test_start_time_iso(self, asterisk_data):
         """Test start_time from ISO format."""
-        data = AsteriskRecordingData(sample_ari_event)
-        assert data.start_time.year == 2024
-        assert data.start_time.month == 1
-        assert data.start_time.day == 15
+        assert asterisk_data.start_time.year == 2024
+        assert asterisk_data.start_time.month == 1
+        assert asterisk_data.start_time.day == 15
 
     def test_start_time_epoch(self):
         """Test start_time from epoch."""
@@ -114,10 +168,15 @@ class TestAsteriskRecordingData:
         expected = datetime.fromtimestamp(1705312170, tz=timezone.utc)
         assert data.start_time == expected
 
-    def test_platform_tags(self, sample_ari_event):
+    def test_fallback_start_time_is_stable(self):
+        """Fallback start time is resolved once, not on every access."""
+        data = AsteriskRecordingData({})
+
+        assert data.start_time is data.start_time
+
+    def test_platform_tags(self, asterisk_data):
         """Test platform_tags extraction."""
-        data = AsteriskRecordingData(sample_ari_event)
-        tags = data.platform_tags
+        tags = asterisk_data.platform_tags
 
         assert tags["asterisk_recording_name"] == "rec-abc123"
         assert tags["asterisk_channel_id"] == "channel-123"
@@ -141,31 +200,13 @@ class TestAsteriskVconBuilder:
             ari_auth=("asterisk", "secret"),
         )
 
-    @pytest.fixture
-    def sample_recording_data(self):
-        """Create sample recording data."""
-        return AsteriskRecordingData(
-            {
-                "recording_name": "rec-abc123",
-                "caller_id_num": "+15551234567",
-                "connected_line_num": "+15559876543",
-                "direction": "inbound",
-                "duration": 30,
-                "timestamp": "2024-01-15T10:29:30Z",
-            }
-        )
-
     def test_adapter_source(self, builder):
         """Test adapter source tag."""
         assert builder.ADAPTER_SOURCE == "asterisk_adapter"
 
-    @patch("adapters.asterisk.builder.requests.get")
     def test_download_recording_ari(self, mock_get, builder, sample_recording_data):
         """Test downloading recording via ARI."""
-        mock_response = MagicMock()
-        mock_response.content = b"fake audio data"
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = StreamedResponse(b"fake ", b"audio data")
 
         result = builder._download_recording(sample_recording_data)
 
@@ -173,8 +214,21 @@ class TestAsteriskVconBuilder:
         call_url = mock_get.call_args[0][0]
         assert "recordings/stored/rec-abc123/file" in call_url
 
-    def test_download_recording_no_url(self, builder):
+    def test_download_recording_ari_trailing_slash(self, mock_get):
+        """Test a trailing slash on the ARI URL is not doubled."""
+        mock_get.return_value = StreamedResponse(b"fake audio data")
+        builder = AsteriskVconBuilder(ari_url="http://localhost:8088/ari/")
+
+        builder._download_recording(AsteriskRecordingData({"recording_name": "rec-abc123"}))
+
+        assert mock_get.call_args[0][0] == (
+            "http://localhost:8088/ari/recordings/stored/rec-abc123/file"
+        )
+
+    def test_download_recording_no_url(self, mock_get, builder):
         """Test download fails gracefully with no URL."""
+        # ARI is unreachable, leaving no other source for the recording
+        mock_get.side_effect = requests.ConnectionError("connection refused")
         recording_data = AsteriskRecordingData(
             {
                 "recording_name": "rec-abc123",
@@ -188,13 +242,65 @@ class TestAsteriskVconBuilder:
 
         assert result is None
 
-    @patch("adapters.asterisk.builder.requests.get")
+    def test_read_local_recording_file(self, tmp_path):
+        """Test local recordings are memory-mapped rather than copied."""
+        (tmp_path / "rec-abc123.wav").write_bytes(b"local audio data")
+        builder = AsteriskVconBuilder(recordings_path=str(tmp_path))
+        recording_data = AsteriskRecordingData({"recording_name": "rec-abc123"})
+
+        result = builder._download_recording(recording_data)
+
+        assert isinstance(result, mmap.mmap)
+        assert result[:] == b"local audio data"
+        result.close()
+
+    def test_local_recording_closed_when_encoding_fails(self, tmp_path):
+        """Test the file mapping is released even if base64 encoding raises."""
+        (tmp_path / "rec-abc123.wav").write_bytes(b"local audio data")
+        builder = AsteriskVconBuilder(recordings_path=str(tmp_path))
+        recording_data = AsteriskRecordingData(
+            {"recording_name": "rec-abc123", "target_uri": "recording:rec-abc123"}
+        )
+        mapped = []
+        download = builder._download_recording
+
+        def track(data):
+            mapped.append(download(data))
+            return mapped[-1]
+
+        with (
+            patch.object(builder, "_download_recording", side_effect=track),
+            patch("core.base_builder._b64encode", side_effect=MemoryError),
+            pytest.raises(MemoryError),
+        ):
+            builder._embedded_content(recording_data)
+
+        assert mapped[0].closed
+
+    def test_read_local_recording_replaces_extension(self, tmp_path):
+        """Test a mismatched extension is swapped, ignoring dots in directories."""
+        recordings_dir = tmp_path / "spool.d"
+        recordings_dir.mkdir()
+        (recordings_dir / "rec-abc123.wav").write_bytes(b"local audio data")
+        builder = AsteriskVconBuilder(recordings_path=str(recordings_dir))
+
+        for name in ("rec-abc123.gsm", "rec-abc123"):
+            recording_data = AsteriskRecordingData({"recording_name": name})
+            result = builder._download_recording(recording_data)
+            assert result[:] == b"local audio data"
+            result.close()
+
+    def test_read_empty_local_recording_file(self, tmp_path):
+        """Test empty local recordings are treated as missing audio."""
+        (tmp_path / "rec-abc123.wav").write_bytes(b"")
+        builder = AsteriskVconBuilder(recordings_path=str(tmp_path))
+        recording_data = AsteriskRecordingData({"recording_name": "rec-abc123"})
+
+        assert not builder._download_recording(recording_data)
+
     def test_build_vcon(self, mock_get, builder, sample_recording_data):
         """Test building vCon from recording data."""
-        mock_response = MagicMock()
-        mock_response.content = b"fake audio data"
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = StreamedResponse(b"fake ", b"audio data")
 
         vcon = builder.build(sample_recording_data)
 
@@ -2,20 +2,41 @@
 
 import pytest
 
-from adapters.asterisk.config import AsteriskConfig
+from adapters.asterisk.config import AsteriskConfig, get_config
+
+CONSERVER_URL = "https://conserver.example.com/vcon"
+
+
+@pytest.fixture
+def make_config(monkeypatch):
+    """Build an AsteriskConfig from CONSERVER_URL plus the given env vars."""
+
+    def _make(**env: str) -> AsteriskConfig:
+        monkeypatch.setenv("CONSERVER_URL", CONSERVER_URL)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        return AsteriskConfig()
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Config with only CONSERVER_URL set, shared by read-only default tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CONSERVER_URL", CONSERVER_URL)
+        return AsteriskConfig()
 
 
 class TestAsteriskConfig:
     """Tests for AsteriskConfig class."""
 
-    def test_minimal_config(self, monkeypatch):
+    def test_minimal_config(self, default_config):
         """Test config with only required CONSERVER_URL."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-        config = AsteriskConfig()
-        assert config.conserver_url == "https://conserver.example.com/vcon"
-        assert config.asterisk_host == "localhost"
-        assert config.asterisk_ari_port == 8088
-        assert config.asterisk_ari_username == "asterisk"
+        assert default_config.conserver_url == CONSERVER_URL
+        assert default_config.asterisk_host == "localhost"
+        assert default_config.asterisk_ari_port == 8088
+        assert default_config.asterisk_ari_username == "asterisk"
 
     def test_missing_conserver_url(self, monkeypatch):
         """Test that missing CONSERVER_URL raises error."""
@@ -23,16 +44,15 @@ class TestAsteriskConfig:
         with pytest.raises(ValueError, match="CONSERVER_URL"):
             AsteriskConfig()
 
-    def test_asterisk_settings(self, monkeypatch):
+    def test_asterisk_settings(self, make_config):
         """Test Asterisk-specific settings."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-        monkeypatch.setenv("ASTERISK_HOST", "ast.example.com")
-        monkeypatch.setenv("ASTERISK_ARI_PORT", "8089")
-        monkeypatch.setenv("ASTERISK_ARI_USERNAME", "admin")
-        monkeypatch.setenv("ASTERISK_ARI_PASSWORD", "secret123")
-        monkeypatch.setenv("ASTERISK_RECORDINGS_PATH", "/data/recordings")
-
-        config = AsteriskConfig()
+        config = make_config(
+            ASTERISK_HOST="ast.example.com",
+            ASTERISK_ARI_PORT="8089",
+            ASTERISK_ARI_USERNAME="admin",
+            ASTERISK_ARI_PASSWORD="secret123",
+            ASTERISK_RECORDINGS_PATH="/data/recordings",
+        )
 
         assert config.asterisk_host == "ast.example.com"
         assert config.asterisk_ari_port == 8089
@@ -40,69 +60,56 @@ class TestAsteriskConfig:
         assert config.asterisk_ari_password == "secret123"
         assert config.recordings_path == "/data/recordings"
 
-    def test_ari_url_default(self, monkeypatch):
+    def test_ari_url_default(self, make_config):
         """Test ARI URL default construction."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-        monkeypatch.setenv("ASTERISK_HOST", "ast.example.com")
-        monkeypatch.setenv("ASTERISK_ARI_PORT", "8088")
-
-        config = AsteriskConfig()
+        config = make_config(ASTERISK_HOST="ast.example.com", ASTERISK_ARI_PORT="8088")
 
         assert config.asterisk_ari_url == "http://ast.example.com:8088"
 
-    def test_ari_url_https(self, monkeypatch):
+    def test_ari_url_https(self, make_config):
         """Test ARI URL with HTTPS."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-        monkeypatch.setenv("ASTERISK_ARI_SCHEME", "https")
-        monkeypatch.setenv("ASTERISK_HOST", "ast.example.com")
-
-        config = AsteriskConfig()
+        config = make_config(ASTERISK_ARI_SCHEME="https", ASTERISK_HOST="ast.example.com")
 
         assert config.asterisk_ari_url.startswith("https://")
 
-    def test_ari_url_override(self, monkeypatch):
+    def test_ari_url_override(self, make_config):
         """Test ARI URL can be overridden."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-        monkeypatch.setenv("ASTERISK_ARI_URL", "https://custom-ari.example.com:9000")
-
-        config = AsteriskConfig()
+        config = make_config(ASTERISK_ARI_URL="https://custom-ari.example.com:9000")
 
         assert config.asterisk_ari_url == "https://custom-ari.example.com:9000"
 
-    def test_get_ari_auth(self, monkeypatch):
+    def test_get_ari_auth(self, make_config):
         """Test get_ari_auth method."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-        monkeypatch.setenv("ASTERISK_ARI_USERNAME", "admin")
-        monkeypatch.setenv("ASTERISK_ARI_PASSWORD", "secret")
+        config = make_config(ASTERISK_ARI_USERNAME="admin", ASTERISK_ARI_PASSWORD="secret")
 
-        config = AsteriskConfig()
-        auth = config.get_ari_auth()
+        assert config.get_ari_auth() == ("admin", "secret")
 
-        assert auth == ("admin", "secret")
-
-    def test_webhook_validation_disabled(self, monkeypatch):
+    def test_webhook_validation_disabled(self, default_config):
         """Test webhook validation defaults to disabled."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-
-        config = AsteriskConfig()
+        assert default_config.validate_webhook is False
 
-        assert config.validate_webhook is False
-
-    def test_webhook_validation_enabled(self, monkeypatch):
+    def test_webhook_validation_enabled(self, make_config):
         """Test webhook validation can be enabled."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-        monkeypatch.setenv("VALIDATE_ASTERISK_WEBHOOK", "true")
-        monkeypatch.setenv("ASTERISK_WEBHOOK_SECRET", "secret")
-
-        config = AsteriskConfig()
+        config = make_config(VALIDATE_ASTERISK_WEBHOOK="true", ASTERISK_WEBHOOK_SECRET="secret")
 
         assert config.validate_webhook is True
         assert config.webhook_secret == "secret"
 
-    def test_state_file_default(self, monkeypatch):
+    def test_state_file_default(self, default_config):
         """Test Asterisk-specific state file default."""
-        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
-
-        config = AsteriskConfig()
-
-        assert config.state_file == ".asterisk_adapter_state.json"
+        assert default_config.state_file == ".asterisk_adapter_state.json"
+
+
+class TestGetConfig:
+    """Tests for the cached get_config factory."""
+
+    def test_returns_cached_instance(self, monkeypatch):
+        """Test repeated calls reuse the first loaded config."""
+        monkeypatch.setenv("CONSERVER_URL", CONSERVER_URL)
+        get_config.cache_clear()
+        try:
+            config = get_config()
+            assert isinstance(config, AsteriskConfig)
+            assert get_config() is config
+        finally:
+            get_config.cache_clear()
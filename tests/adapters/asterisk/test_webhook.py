@@ -1,7 +1,15 @@
 """Tests for Asterisk webhook endpoints."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -9,6 +17,21 @@ from adapters.asterisk.config import AsteriskConfig
 from adapters.asterisk.webhook import create_app
 
 
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """Shared client for tests that need no patched collaborators.
+
+    Tests using it only exercise paths that leave state untouched, so
+    one app serves the whole module.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        mp.setenv("STATE_FILE", str(tmp_path_factory.mktemp("asterisk") / "state.json"))
+        config = AsteriskConfig()
+    with TestClient(create_app(config)) as client:
+        yield client
+
+
 class TestAsteriskWebhook:
     """Tests for Asterisk webhook endpoints."""
 
@@ -19,6 +42,25 @@ class TestAsteriskWebhook:
         monkeypatch.setenv("STATE_FILE", str(tmp_path / "state.json"))
         return AsteriskConfig()
 
+    @pytest.fixture
+    def mocked(self, config):
+        """App with a mocked builder and poster.
+
+        Yields (client, builder, poster). The builder returns a vCon with
+        UUID ``vcon-uuid-123`` and posts succeed unless a test says otherwise.
+        """
+        with (
+            patch("adapters.asterisk.webhook.HttpPoster") as mock_poster_class,
+            patch("adapters.asterisk.webhook.AsteriskVconBuilder") as mock_builder_class,
+        ):
+            mock_builder = mock_builder_class.return_value
+            mock_builder.build.return_value = SimpleNamespace(uuid="vcon-uuid-123")
+            mock_poster = mock_poster_class.return_value
+            mock_poster.post.return_value = True
+
+            with TestClient(create_app(config)) as client:
+                yield client, mock_builder, mock_poster
+
     @pytest.fixture
     def sample_recording_event(self):
         """Sample Asterisk ARI recording event."""
@@ -32,72 +74,114 @@ class TestAsteriskWebhook:
             "timestamp": "2024-01-15T10:29:30Z",
         }
 
-    def test_health_check(self, config):
+    def test_health_check(self, client):
         """Test health check endpoint."""
-        app = create_app(config)
-        client = TestClient(app)
         response = client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["service"] == "vcon-asterisk-adapter"
 
-    def test_recording_event_success(self, config, sample_recording_event):
+    def test_recording_event_success(self, mocked, sample_recording_event):
         """Test successful recording event processing."""
-        with (
-            patch("adapters.asterisk.webhook.HttpPoster") as mock_poster_class,
-            patch("adapters.asterisk.webhook.AsteriskVconBuilder") as mock_builder_class,
-        ):
-            mock_vcon = MagicMock()
-            mock_vcon.uuid = "vcon-uuid-123"
-            mock_builder = MagicMock()
-            mock_builder.build.return_value = mock_vcon
-            mock_builder_class.return_value = mock_builder
+        client, mock_builder, mock_poster = mocked
 
-            mock_poster = MagicMock()
-            mock_poster.post.return_value = True
-            mock_poster_class.return_value = mock_poster
+        response = client.post(
+            "/webhook/recording",
+            json=sample_recording_event,
+        )
 
-            app = create_app(config)
-            client = TestClient(app)
+        assert response.status_code == 200
+        assert response.text == "OK"
+        mock_poster.post.assert_called_once_with(mock_builder.build.return_value)
 
-            response = client.post(
-                "/webhook/recording",
-                json=sample_recording_event,
-            )
+    def test_recording_event_builds_off_event_loop(self, mocked, sample_recording_event):
+        """Test vCon build runs in a worker thread, not on the event loop."""
+        client, mock_builder, _ = mocked
+        loops_seen = []
 
-            assert response.status_code == 200
-            assert response.text == "OK"
+        def build(recording_data):
+            try:
+                loops_seen.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops_seen.append(None)
+            return SimpleNamespace(uuid="vcon-uuid-123")
 
-    def test_recording_event_duplicate(self, config, sample_recording_event):
-        """Test duplicate recording event handling."""
+        mock_builder.build.side_effect = build
+        response = client.post("/webhook/recording", json=sample_recording_event)
+
+        assert response.status_code == 200
+        assert loops_seen == [None]
+
+    def test_downloads_are_capped(self, monkeypatch, tmp_path, sample_recording_event):
+        """Test MAX_CONCURRENT_DOWNLOADS bounds builds running at once."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        monkeypatch.setenv("STATE_FILE", str(tmp_path / "state.json"))
+        monkeypatch.setenv("MAX_CONCURRENT_DOWNLOADS", "2")
         with (
             patch("adapters.asterisk.webhook.HttpPoster") as mock_poster_class,
             patch("adapters.asterisk.webhook.AsteriskVconBuilder") as mock_builder_class,
         ):
-            mock_vcon = MagicMock()
-            mock_vcon.uuid = "vcon-uuid-123"
-            mock_builder = MagicMock()
-            mock_builder.build.return_value = mock_vcon
-            mock_builder_class.return_value = mock_builder
+            lock = threading.Lock()
+            running = 0
+            peak = 0
 
-            mock_poster = MagicMock()
-            mock_poster.post.return_value = True
-            mock_poster_class.return_value = mock_poster
+            def build(recording_data):
+                nonlocal running, peak
+                with lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.05)
+                with lock:
+                    running -= 1
+                mock_vcon = SimpleNamespace(uuid=f"vcon-{recording_data.recording_id}")
+                return mock_vcon
+
+            mock_builder_class.return_value.build.side_effect = build
+            mock_poster_class.return_value.post.return_value = True
+            app = create_app(AsteriskConfig())
 
-            app = create_app(config)
-            client = TestClient(app)
+            async def send_burst():
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    return await asyncio.gather(
+                        *(
+                            client.post(
+                                "/webhook/recording",
+                                json={**sample_recording_event, "recording_name": f"rec-{i}"},
+                            )
+                            for i in range(6)
+                        )
+                    )
 
-            response1 = client.post("/webhook/recording", json=sample_recording_event)
-            assert response1.status_code == 200
+            responses = asyncio.run(send_burst())
 
-            response2 = client.post("/webhook/recording", json=sample_recording_event)
-            assert response2.status_code == 200
+        assert all(response.status_code == 200 for response in responses)
+        assert peak == 2
 
-    def test_recording_event_wrong_type(self, config):
+    def test_recording_event_null_fields(self, mocked, sample_recording_event):
+        """Test null optional fields still reach the builder."""
+        client, mock_builder, _ = mocked
+        event = {**sample_recording_event, "direction": None, "context": None, "target_uri": None}
+
+        response = client.post("/webhook/recording", json=event)
+
+        assert response.status_code == 200
+        mock_builder.build.assert_called_once()
+
+    def test_recording_event_duplicate(self, mocked, sample_recording_event):
+        """Test duplicate recording event handling."""
+        client, mock_builder, _ = mocked
+
+        response1 = client.post("/webhook/recording", json=sample_recording_event)
+        assert response1.status_code == 200
+
+        response2 = client.post("/webhook/recording", json=sample_recording_event)
+        assert response2.status_code == 200
+        mock_builder.build.assert_called_once()
+
+    def test_recording_event_wrong_type(self, client):
         """Test ignoring non-recording events."""
-        app = create_app(config)
-        client = TestClient(app)
         response = client.post(
             "/webhook/recording",
             json={"type": "ChannelCreated", "channel_id": "123"},
@@ -105,10 +189,8 @@ class TestAsteriskWebhook:
         assert response.status_code == 200
         assert response.text == "OK"
 
-    def test_recording_event_no_name(self, config):
+    def test_recording_event_no_name(self, client):
         """Test recording event without name."""
-        app = create_app(config)
-        client = TestClient(app)
         response = client.post(
             "/webhook/recording",
             json={"type": "RecordingFinished"},
@@ -116,10 +198,8 @@ class TestAsteriskWebhook:
         assert response.status_code == 200
         assert response.text == "OK"
 
-    def test_recording_event_invalid_json(self, config):
+    def test_recording_event_invalid_json(self, client):
         """Test recording event with invalid JSON."""
-        app = create_app(config)
-        client = TestClient(app)
         response = client.post(
             "/webhook/recording",
             content="not valid json",
@@ -127,36 +207,96 @@ class TestAsteriskWebhook:
         )
         assert response.status_code == 400
 
-    def test_get_recording_status(self, config, sample_recording_event):
+    def test_recording_event_not_an_object(self, client):
+        """Test valid JSON that is not an object is rejected."""
+        response = client.post(
+            "/webhook/recording",
+            content="[]",
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 400
+
+    def test_get_recording_status(self, mocked, sample_recording_event):
         """Test getting recording status."""
+        client, _, _ = mocked
+
+        client.post("/webhook/recording", json=sample_recording_event)
+
+        response = client.get("/status/rec-abc123")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["recording_id"] == "rec-abc123"
+        assert data["vcon_uuid"] == "vcon-uuid-123"
+
+    def test_sqlite_state_file(self, monkeypatch, tmp_path, sample_recording_event):
+        """Test a .db STATE_FILE tracks recordings in SQLite."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        monkeypatch.setenv("STATE_FILE", str(tmp_path / "state.db"))
         with (
             patch("adapters.asterisk.webhook.HttpPoster") as mock_poster_class,
             patch("adapters.asterisk.webhook.AsteriskVconBuilder") as mock_builder_class,
         ):
-            mock_vcon = MagicMock()
-            mock_vcon.uuid = "vcon-uuid-123"
-            mock_builder = MagicMock()
-            mock_builder.build.return_value = mock_vcon
-            mock_builder_class.return_value = mock_builder
-
-            mock_poster = MagicMock()
-            mock_poster.post.return_value = True
-            mock_poster_class.return_value = mock_poster
+            mock_vcon = SimpleNamespace(uuid="vcon-uuid-123")
+            mock_builder_class.return_value.build.return_value = mock_vcon
+            mock_poster_class.return_value.post.return_value = True
 
-            app = create_app(config)
-            client = TestClient(app)
+            with TestClient(create_app(AsteriskConfig())) as client:
+                client.post("/webhook/recording", json=sample_recording_event)
 
-            client.post("/webhook/recording", json=sample_recording_event)
-
-            response = client.get("/status/rec-abc123")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["recording_id"] == "rec-abc123"
-            assert data["vcon_uuid"] == "vcon-uuid-123"
+        # A fresh app reads the mark back from the database
+        response = TestClient(create_app(AsteriskConfig())).get("/status/rec-abc123")
+        assert response.status_code == 200
+        assert response.json()["vcon_uuid"] == "vcon-uuid-123"
 
-    def test_get_recording_status_not_found(self, config):
+    def test_get_recording_status_not_found(self, client):
         """Test getting status for unknown recording."""
-        app = create_app(config)
-        client = TestClient(app)
         response = client.get("/status/unknown-name")
         assert response.status_code == 404
+
+
+class TestAsteriskWebhookValidation:
+    """Tests for Asterisk webhook signature validation."""
+
+    @pytest.fixture
+    def config_with_validation(self, monkeypatch, tmp_path):
+        """Create config with webhook validation enabled."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        monkeypatch.setenv("STATE_FILE", str(tmp_path / "state.json"))
+        monkeypatch.setenv("VALIDATE_ASTERISK_WEBHOOK", "true")
+        monkeypatch.setenv("ASTERISK_WEBHOOK_SECRET", "test-secret")
+        return AsteriskConfig()
+
+    def test_webhook_missing_signature(self, config_with_validation):
+        """Test webhook without signature header."""
+        app = create_app(config_with_validation)
+        client = TestClient(app)
+        response = client.post("/webhook/recording", json={"type": "RecordingFinished"})
+        assert response.status_code == 403
+
+    def test_webhook_valid_signature(self, config_with_validation):
+        """Test webhook with valid signature."""
+        data = json.dumps({"type": "ChannelCreated"}).encode()
+        signature = hmac.new(b"test-secret", data, hashlib.sha256).hexdigest()
+
+        app = create_app(config_with_validation)
+        client = TestClient(app)
+        response = client.post(
+            "/webhook/recording",
+            content=data,
+            headers={
+                "Content-Type": "application/json",
+                "X-Asterisk-Signature": signature,
+            },
+        )
+        assert response.status_code == 200
+
+    def test_webhook_wrong_signature(self, config_with_validation):
+        """Test webhook with a well-formed but wrong signature."""
+        app = create_app(config_with_validation)
+        client = TestClient(app)
+        response = client.post(
+            "/webhook/recording",
+            json={"type": "RecordingFinished"},
+            headers={"X-Asterisk-Signature": "00" * 32},
+        )
+        assert response.status_code == 403
@@ -1,116 +1,188 @@
 """Tests for Bandwidth vCon builder."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
-from adapters.bandwidth.builder import BandwidthRecordingData, BandwidthVconBuilder
+from adapters.bandwidth.builder import (
+    BandwidthRecordingData,
+    BandwidthVconBuilder,
+    _parse_duration,
+)
 
 
-class TestBandwidthRecordingData:
-    """Tests for BandwidthRecordingData class."""
+class StreamedResponse:
+    """Lightweight stand-in for a successful streamed download response."""
 
-    @pytest.fixture
-    def sample_webhook_event(self):
-        """Sample Bandwidth recording complete event."""
-        return {
+    status_code = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, *chunks: bytes):
+        self._chunks = chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        return iter(self._chunks)
+
+
+@pytest.fixture(scope="module")
+def _session_get():
+    """Patch the shared session's get once for the whole module."""
+    with patch("adapters.bandwidth.builder._SESSION.get") as mock_get:
+        yield mock_get
+
+
+@pytest.fixture(autouse=True)
+def mock_get(_session_get):
+    """Session get mock, reset per test so no test reaches the network."""
+    _session_get.reset_mock(return_value=True, side_effect=True)
+    return _session_get
+
+
+@pytest.fixture(scope="module")
+def sample_webhook_event():
+    """Sample Bandwidth recording complete event."""
+    return {
+        "eventType": "recordingComplete",
+        "accountId": "123456",
+        "applicationId": "app-789",
+        "callId": "c-call-abc123",
+        "callUrl": "https://voice.bandwidth.com/api/v2/accounts/123456/calls/c-call-abc123",
+        "recordingId": "r-rec-def456",
+        "mediaUrl": "https://voice.bandwidth.com/api/v2/accounts/123456/calls/c-call-abc123/recordings/r-rec-def456/media",
+        "direction": "inbound",
+        "from": "+15551234567",
+        "to": "+15559876543",
+        "startTime": "2024-01-15T10:29:30.000Z",
+        "endTime": "2024-01-15T10:30:00.000Z",
+        "duration": "PT30S",
+        "channels": 1,
+        "fileFormat": "wav",
+        "status": "complete",
+    }
+
+
+@pytest.fixture(scope="module")
+def bandwidth_data(sample_webhook_event):
+    """Recording data parsed once from the sample event; tests only read it."""
+    return BandwidthRecordingData(sample_webhook_event)
+
+
+@pytest.fixture(scope="module")
+def sample_recording_data():
+    """Create sample recording data."""
+    return BandwidthRecordingData(
+        {
             "eventType": "recordingComplete",
-            "accountId": "123456",
-            "applicationId": "app-789",
-            "callId": "c-call-abc123",
-            "callUrl": "https://voice.bandwidth.com/api/v2/accounts/123456/calls/c-call-abc123",
-            "recordingId": "r-rec-def456",
-            "mediaUrl": "https://voice.bandwidth.com/api/v2/accounts/123456/calls/c-call-abc123/recordings/r-rec-def456/media",
-            "direction": "inbound",
+            "recordingId": "r-rec-123",
+            "callId": "c-call-456",
             "from": "+15551234567",
             "to": "+15559876543",
-            "startTime": "2024-01-15T10:29:30.000Z",
-            "endTime": "2024-01-15T10:30:00.000Z",
+            "direction": "inbound",
             "duration": "PT30S",
-            "channels": 1,
-            "fileFormat": "wav",
-            "status": "complete",
+            "mediaUrl": "https://voice.bandwidth.com/recordings/r-rec-123/media",
+            "startTime": "2024-01-15T10:29:30.000Z",
         }
+    )
 
-    def test_recording_id(self, sample_webhook_event):
-        """Test recording_id extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.recording_id == "r-rec-def456"
-
-    def test_call_id(self, sample_webhook_event):
-        """Test call_id extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.call_id == "c-call-abc123"
-
-    def test_from_number(self, sample_webhook_event):
-        """Test from_number extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.from_number == "+15551234567"
-
-    def test_to_number(self, sample_webhook_event):
-        """Test to_number extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.to_number == "+15559876543"
-
-    def test_direction(self, sample_webhook_event):
-        """Test direction extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.direction == "inbound"
-
-    def test_direction_outbound(self):
-        """Test outbound direction."""
-        data = BandwidthRecordingData({"direction": "Outbound"})
-        assert data.direction == "outbound"
-
-    def test_recording_url(self, sample_webhook_event):
-        """Test recording_url extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert "media" in data.recording_url
-
-    def test_file_format(self, sample_webhook_event):
-        """Test file_format extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.file_format == "wav"
-
-    def test_duration_seconds_pt30s(self, sample_webhook_event):
-        """Test duration_seconds parsing PT30S format."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.duration_seconds == 30.0
-
-    def test_duration_seconds_pt1m30s(self):
-        """Test duration_seconds parsing PT1M30S format."""
-        data = BandwidthRecordingData({"duration": "PT1M30S"})
-        assert data.duration_seconds == 90.0
-
-    def test_duration_seconds_pt1h30m45s(self):
-        """Test duration_seconds parsing PT1H30M45S format."""
-        data = BandwidthRecordingData({"duration": "PT1H30M45S"})
-        assert data.duration_seconds == 5445.0
-
-    def test_duration_seconds_none(self):
-        """Test duration_seconds when not provided."""
-        data = BandwidthRecordingData({})
-        assert data.duration_seconds is None
 
-    def test_start_time(self, sample_webhook_event):
+class TestBandwidthRecordingData:
+    """Tests for BandwidthRecordingData class."""
+
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("recording_id", "r-rec-def456"),
+            ("call_id", "c-call-abc123"),
+            ("from_number", "+15551234567"),
+            ("to_number", "+15559876543"),
+            ("direction", "inbound"),
+            (
+                "recording_url",
+                "https://voice.bandwidth.com/api/v2/accounts/123456/calls/c-call-abc123"
+                "/recordings/r-rec-def456/media",
+            ),
+            ("file_format", "wav"),
+            ("duration_seconds", 30.0),
+        ],
+    )
+    def test_fields(self, bandwidth_data, attr, expected):
+        """Test fields extracted from a full recording event."""
+        assert getattr(bandwidth_data, attr) == expected
+
+    @pytest.mark.parametrize(
+        ("event", "attr", "expected"),
+        [
+            ({"direction": "Outbound"}, "direction", "outbound"),
+            ({"duration": "PT1M30S"}, "duration_seconds", 90.0),
+            ({"duration": "PT1H30M45S"}, "duration_seconds", 5445.0),
+            ({"duration": "PT2M1.5S"}, "duration_seconds", 121.5),
+            ({}, "duration_seconds", None),
+            ({"duration": "30 seconds"}, "duration_seconds", None),
+            ({"duration": 30}, "duration_seconds", None),
+        ],
+        ids=[
+            "direction-normalized",
+            "duration-minutes",
+            "duration-hours",
+            "duration-fractional",
+            "duration-missing",
+            "duration-not-iso",
+            "duration-not-string",
+        ],
+    )
+    def test_field_parsing(self, event, attr, expected):
+        """Test normalization and ISO-8601 duration parsing on sparse events."""
+        data = BandwidthRecordingData(event)
+        assert getattr(data, attr) == expected
+
+    def test_duration_parse_memoized(self):
+        """Test repeated duration strings are parsed once."""
+        _parse_duration.cache_clear()
+        for _ in range(3):
+            assert BandwidthRecordingData({"duration": "PT4M5S"}).duration_seconds == 245.0
+
+        info = _parse_duration.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_no_instance_dict(self, bandwidth_data):
+        """Test instances use slots instead of a per-instance __dict__."""
+        assert not hasattr(bandwidth_data, "__dict__")
+
+    def test_start_time(self, bandwidth_data):
         """Test start_time extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.start_time.year == 2024
-        assert data.start_time.month == 1
-        assert data.start_time.day == 15
-        assert data.start_time.hour == 10
-        assert data.start_time.minute == 29
-
-    def test_end_time(self, sample_webhook_event):
+        assert bandwidth_data.start_time.year == 2024
+        assert bandwidth_data.start_time.month == 1
+        assert bandwidth_data.start_time.day == 15
+        assert bandwidth_data.start_time.hour == 10
+        assert bandwidth_data.start_time.minute == 29
+
+    def test_fallback_start_time_is_stable(self):
+        """Fallback start time is resolved once, not on every access."""
+        data = BandwidthRecordingData({})
+
+        assert data.start_time is data.start_time
+
+    def test_end_time(self, bandwidth_data):
         """Test end_time extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        assert data.end_time is not None
-        assert data.end_time.minute == 30
+        assert bandwidth_data.end_time is not None
+        assert bandwidth_data.end_time.minute == 30
 
-    def test_platform_tags(self, sample_webhook_event):
+    def test_platform_tags_computed_once(self, bandwidth_data):
+        """Test platform_tags is built at init, not on every access."""
+        assert bandwidth_data.platform_tags is bandwidth_data.platform_tags
+
+    def test_platform_tags(self, bandwidth_data):
         """Test platform_tags extraction."""
-        data = BandwidthRecordingData(sample_webhook_event)
-        tags = data.platform_tags
+        tags = bandwidth_data.platform_tags
 
         assert tags["bandwidth_recording_id"] == "r-rec-def456"
         assert tags["bandwidth_call_id"] == "c-call-abc123"
@@ -131,34 +203,13 @@ class TestBandwidthVconBuilder:
             api_auth=("user", "pass"),
         )
 
-    @pytest.fixture
-    def sample_recording_data(self):
-        """Create sample recording data."""
-        return BandwidthRecordingData(
-            {
-                "eventType": "recordingComplete",
-                "recordingId": "r-rec-123",
-                "callId": "c-call-456",
-                "from": "+15551234567",
-                "to": "+15559876543",
-                "direction": "inbound",
-                "duration": "PT30S",
-                "mediaUrl": "https://voice.bandwidth.com/recordings/r-rec-123/media",
-                "startTime": "2024-01-15T10:29:30.000Z",
-            }
-        )
-
     def test_adapter_source(self, builder):
         """Test adapter source tag."""
         assert builder.ADAPTER_SOURCE == "bandwidth_adapter"
 
-    @patch("adapters.bandwidth.builder.requests.get")
     def test_download_recording(self, mock_get, builder, sample_recording_data):
         """Test downloading recording."""
-        mock_response = MagicMock()
-        mock_response.content = b"fake audio data"
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = StreamedResponse(b"fake ", b"audio data")
 
         result = builder._download_recording(sample_recording_data)
 
@@ -167,14 +218,10 @@ class TestBandwidthVconBuilder:
         call_kwargs = mock_get.call_args[1]
         assert call_kwargs["auth"] is not None
 
-    @patch("adapters.bandwidth.builder.requests.get")
     def test_download_recording_no_auth(self, mock_get, sample_recording_data):
         """Test downloading without auth."""
         builder = BandwidthVconBuilder(api_auth=None)
-        mock_response = MagicMock()
-        mock_response.content = b"fake audio data"
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = StreamedResponse(b"fake ", b"audio data")
 
         result = builder._download_recording(sample_recording_data)
 
@@ -182,7 +229,6 @@ class TestBandwidthVconBuilder:
         call_kwargs = mock_get.call_args[1]
         assert call_kwargs["auth"] is None
 
-    @patch("adapters.bandwidth.builder.requests.get")
     def test_download_recording_no_url(self, mock_get, builder):
         """Test download fails gracefully with no URL."""
         recording_data = BandwidthRecordingData(
@@ -2,7 +2,7 @@
 
 import pytest
 
-from adapters.bandwidth.config import BandwidthConfig
+from adapters.bandwidth.config import BandwidthConfig, get_config
 
 
 class TestBandwidthConfig:
@@ -101,3 +101,18 @@ class TestBandwidthConfig:
         config = BandwidthConfig()
 
         assert config.state_file == ".bandwidth_adapter_state.json"
+
+
+class TestGetConfig:
+    """Tests for the cached get_config factory."""
+
+    def test_returns_cached_instance(self, monkeypatch):
+        """Test repeated calls reuse the first loaded config."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        get_config.cache_clear()
+        try:
+            config = get_config()
+            assert isinstance(config, BandwidthConfig)
+            assert get_config() is config
+        finally:
+            get_config.cache_clear()
@@ -1,8 +1,10 @@
 """Tests for Bandwidth webhook endpoints."""
 
 import base64
+import json
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
@@ -75,6 +77,40 @@ class TestBandwidthWebhook:
             assert response.status_code == 200
             assert response.text == "OK"
 
+    def test_batch_recording_events(self, config, sample_recording_event):
+        """Test NDJSON batch processing returns a status per line."""
+        with (
+            patch("adapters.bandwidth.webhook.HttpPoster") as mock_poster_class,
+            patch("adapters.bandwidth.webhook.BandwidthVconBuilder") as mock_builder_class,
+        ):
+            mock_vcon = MagicMock()
+            mock_vcon.uuid = "vcon-uuid-123"
+            mock_builder_class.return_value.build.return_value = mock_vcon
+            mock_poster_class.return_value.post.return_value = True
+
+            body = b"\n".join(
+                json.dumps(event).encode()
+                for event in (
+                    sample_recording_event,
+                    {"eventType": "initiate", "callId": "c-123"},
+                    "recordingComplete",
+                    sample_recording_event,
+                )
+            )
+
+            app = create_app(config)
+            client = TestClient(app)
+            response = client.post("/webhook/recording/batch", content=body)
+
+            assert response.status_code == 200
+            assert response.json() == {
+                "results": ["success", "ignored", "invalid_event", "duplicate"]
+            }
+            assert mock_builder_class.return_value.build.call_count == 1
+            with open(config.state_file) as f:
+                state = json.load(f)
+            assert set(state) == {"r-rec-def456"}
+
     def test_recording_event_duplicate(self, config, sample_recording_event):
         """Test duplicate recording event handling."""
         with (
@@ -100,6 +136,62 @@ class TestBandwidthWebhook:
             response2 = client.post("/webhook/recording", json=sample_recording_event)
             assert response2.status_code == 200
 
+    def test_processed_retry_skips_json_parse(self, config, sample_recording_event):
+        """Test a retry of a processed recording is answered without parsing the body."""
+        with (
+            patch("adapters.bandwidth.webhook.HttpPoster") as mock_poster_class,
+            patch("adapters.bandwidth.webhook.BandwidthVconBuilder") as mock_builder_class,
+        ):
+            mock_vcon = MagicMock()
+            mock_vcon.uuid = "vcon-uuid-123"
+            mock_builder_class.return_value.build.return_value = mock_vcon
+            mock_poster_class.return_value.post.return_value = True
+
+            app = create_app(config)
+            client = TestClient(app)
+            client.post("/webhook/recording", json=sample_recording_event)
+
+            with patch("adapters.bandwidth.webhook.orjson.loads") as mock_loads:
+                response = client.post("/webhook/recording", json=sample_recording_event)
+
+            assert response.status_code == 200
+            assert response.text == "OK"
+            mock_loads.assert_not_called()
+            assert mock_builder_class.return_value.build.call_count == 1
+
+    @pytest.mark.parametrize(
+        ("prefix", "overrides"),
+        [
+            # A processed ID nested ahead of a new top-level one
+            ({"transcription": {"recordingId": "r-rec-def456"}}, {"recordingId": "r-rec-new789"}),
+            ({}, {"eventType": "transferComplete"}),
+        ],
+        ids=["nested-processed-id", "non-recording-event"],
+    )
+    def test_ambiguous_body_is_parsed(self, config, sample_recording_event, prefix, overrides):
+        """Test the raw-body prefilter only short-circuits unambiguous recording events."""
+        with (
+            patch("adapters.bandwidth.webhook.HttpPoster") as mock_poster_class,
+            patch("adapters.bandwidth.webhook.BandwidthVconBuilder") as mock_builder_class,
+        ):
+            mock_vcon = MagicMock()
+            mock_vcon.uuid = "vcon-uuid-123"
+            mock_builder_class.return_value.build.return_value = mock_vcon
+            mock_poster_class.return_value.post.return_value = True
+
+            app = create_app(config)
+            client = TestClient(app)
+            client.post("/webhook/recording", json=sample_recording_event)
+
+            event = {**prefix, **sample_recording_event, **overrides}
+            with patch(
+                "adapters.bandwidth.webhook.orjson.loads", side_effect=orjson.loads
+            ) as mock_loads:
+                response = client.post("/webhook/recording", json=event)
+
+            assert response.status_code == 200
+            mock_loads.assert_called_once()
+
     def test_recording_event_wrong_type(self, config):
         """Test ignoring non-recording events."""
         app = create_app(config)
@@ -114,6 +114,17 @@ class TestFreeSwitchRecordingData:
         assert tags["freeswitch_context"] == "default"
         assert tags["sip_user_agent"] == "Ooma/1.0"
 
+    def test_derived_fields_are_computed_once(self, sample_event_data):
+        """Test parsed fields are cached on the instance."""
+        data = FreeSwitchRecordingData(sample_event_data)
+        assert data.start_time is data.start_time
+        assert data.platform_tags is data.platform_tags
+
+    def test_has_no_instance_dict(self, sample_event_data):
+        """Test instances use slots rather than a per-instance __dict__."""
+        data = FreeSwitchRecordingData(sample_event_data)
+        assert not hasattr(data, "__dict__")
+
 
 class TestFreeSwitchVconBuilder:
     """Tests for FreeSwitchVconBuilder class."""
@@ -147,12 +158,13 @@ class TestFreeSwitchVconBuilder:
         """Test adapter source tag."""
         assert builder.ADAPTER_SOURCE == "freeswitch_adapter"
 
-    @patch("adapters.freeswitch.builder.requests.get")
+    @patch("adapters.freeswitch.builder._SESSION.get")
     def test_download_recording_http(self, mock_get, builder, sample_recording_data):
         """Test downloading recording via HTTP."""
         mock_response = MagicMock()
-        mock_response.content = b"fake audio data"
-        mock_response.raise_for_status = MagicMock()
+        mock_response.headers = {"Content-Length": "15"}
+        mock_response.iter_content.return_value = [b"fake ", b"audio data"]
+        mock_response.__enter__.return_value = mock_response
         mock_get.return_value = mock_response
 
         result = builder._download_recording(sample_recording_data)
@@ -162,7 +174,7 @@ class TestFreeSwitchVconBuilder:
 
     @patch("builtins.open", create=True)
     @patch("os.path.isabs", return_value=True)
-    @patch("adapters.freeswitch.builder.requests.get")
+    @patch("adapters.freeswitch.builder._SESSION.get")
     def test_download_recording_local_file(self, mock_get, mock_isabs, mock_open, builder):
         """Test reading recording from local file."""
         mock_get.side_effect = Exception("Network error")
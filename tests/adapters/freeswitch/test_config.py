@@ -2,7 +2,7 @@
 
 import pytest
 
-from adapters.freeswitch.config import FreeSwitchConfig
+from adapters.freeswitch.config import FreeSwitchConfig, get_config
 
 
 class TestFreeSwitchConfig:
@@ -76,3 +76,18 @@ class TestFreeSwitchConfig:
         config = FreeSwitchConfig()
 
         assert config.state_file == "/var/lib/custom_state.json"
+
+
+class TestGetConfig:
+    """Tests for the cached get_config factory."""
+
+    def test_returns_cached_instance(self, monkeypatch):
+        """Test repeated calls reuse the first loaded config."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        get_config.cache_clear()
+        try:
+            config = get_config()
+            assert isinstance(config, FreeSwitchConfig)
+            assert get_config() is config
+        finally:
+            get_config.cache_clear()
@@ -1,5 +1,6 @@
 """Tests for FreeSWITCH webhook endpoints."""
 
+import asyncio
 import hashlib
 import hmac
 import json
@@ -10,6 +11,7 @@ from fastapi.testclient import TestClient
 
 from adapters.freeswitch.config import FreeSwitchConfig
 from adapters.freeswitch.webhook import create_app
+from core.tracker import StateTracker
 
 
 class TestFreeSwitchWebhook:
@@ -45,6 +47,40 @@ class TestFreeSwitchWebhook:
         assert data["status"] == "healthy"
         assert data["service"] == "vcon-freeswitch-adapter"
 
+    def test_recording_event_builds_off_event_loop(self, config, sample_recording_event):
+        """Test vCon build and post run in worker threads, not on the event loop."""
+        with (
+            patch("adapters.freeswitch.webhook.HttpPoster") as mock_poster_class,
+            patch("adapters.freeswitch.webhook.FreeSwitchVconBuilder") as mock_builder_class,
+        ):
+            loops_seen = []
+
+            def running_loop():
+                try:
+                    return asyncio.get_running_loop()
+                except RuntimeError:
+                    return None
+
+            def build(recording_data):
+                loops_seen.append(running_loop())
+                mock_vcon = MagicMock()
+                mock_vcon.uuid = "vcon-uuid-123"
+                return mock_vcon
+
+            def post(vcon):
+                loops_seen.append(running_loop())
+                return True
+
+            mock_builder_class.return_value.build.side_effect = build
+            mock_poster_class.return_value.post.side_effect = post
+
+            app = create_app(config)
+            client = TestClient(app)
+            response = client.post("/webhook/recording", json=sample_recording_event)
+
+            assert response.status_code == 200
+            assert loops_seen == [None, None]
+
     def test_recording_event_success(self, config, sample_recording_event):
         """Test successful recording event processing."""
         with (
@@ -154,6 +190,70 @@ class TestFreeSwitchWebhook:
         response = client.get("/status/unknown-uuid")
         assert response.status_code == 404
 
+    def test_single_event_flushed_by_lifespan(self, config, sample_recording_event):
+        """Test a single event is buffered and persisted on shutdown, not per request."""
+        with (
+            patch("adapters.freeswitch.webhook.HttpPoster") as mock_poster_class,
+            patch("adapters.freeswitch.webhook.FreeSwitchVconBuilder") as mock_builder_class,
+            patch.object(
+                StateTracker, "flush", autospec=True, side_effect=StateTracker.flush
+            ) as flush,
+        ):
+            mock_vcon = MagicMock()
+            mock_vcon.uuid = "vcon-uuid-123"
+            mock_builder_class.return_value.build.return_value = mock_vcon
+            mock_poster_class.return_value.post.return_value = True
+
+            with TestClient(create_app(config)) as client:
+                response = client.post("/webhook/recording", json=sample_recording_event)
+                assert response.status_code == 200
+                flush.assert_not_called()
+
+            flush.assert_called_once()
+
+            with open(config.state_file) as f:
+                state = json.load(f)
+            assert set(state) == {"abc123-def456"}
+
+    def test_batch_recording_events(self, config, sample_recording_event):
+        """Test NDJSON batch processing returns a status per line."""
+        with (
+            patch("adapters.freeswitch.webhook.HttpPoster") as mock_poster_class,
+            patch("adapters.freeswitch.webhook.FreeSwitchVconBuilder") as mock_builder_class,
+        ):
+            mock_vcon = MagicMock()
+            mock_vcon.uuid = "vcon-uuid-123"
+            mock_builder_class.return_value.build.return_value = mock_vcon
+            mock_poster_class.return_value.post.return_value = True
+
+            second_event = {**sample_recording_event, "uuid": "ghi789"}
+            body = b"\n".join(
+                [
+                    json.dumps(sample_recording_event).encode(),
+                    b"not json",
+                    b"",
+                    b'["not", "an", "object"]',
+                    json.dumps({"caller_id_number": "+15551234567"}).encode(),
+                    json.dumps(second_event).encode(),
+                ]
+            )
+
+            app = create_app(config)
+            client = TestClient(app)
+            response = client.post(
+                "/webhook/recording/batch",
+                content=body,
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+            assert response.status_code == 200
+            assert response.json() == {
+                "results": ["success", "invalid_json", "invalid_event", "missing_id", "success"]
+            }
+            with open(config.state_file) as f:
+                state = json.load(f)
+            assert set(state) == {"abc123-def456", "ghi789"}
+
 
 class TestFreeSwitchWebhookValidation:
     """Tests for FreeSWITCH webhook signature validation."""
@@ -1,8 +1,10 @@
 """Tests for Telnyx vCon builder."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from adapters.telnyx.builder import TelnyxRecordingData, TelnyxVconBuilder
 
@@ -133,6 +135,17 @@ class TestTelnyxRecordingData:
         assert data.start_time.hour == 10
         assert data.start_time.minute == 30
 
+    def test_start_time_non_string_falls_back(self):
+        """Test a non-string start_time falls back to occurred_at."""
+        event = {
+            "data": {
+                "occurred_at": "2024-01-15T10:30:00Z",
+                "payload": {"recording_id": "rec-123", "start_time": 1705314570},
+            }
+        }
+        data = TelnyxRecordingData(event)
+        assert data.start_time.minute == 30
+
     def test_platform_tags(self, sample_webhook_event):
         """Test platform_tags extraction."""
         data = TelnyxRecordingData(sample_webhook_event)
@@ -144,6 +157,17 @@ class TestTelnyxRecordingData:
         assert tags["telnyx_connection_id"] == "conn-111"
         assert tags["recording_channels"] == "single"
 
+    def test_derived_fields_are_computed_once(self, sample_webhook_event):
+        """Test parsed fields are cached on the instance."""
+        data = TelnyxRecordingData(sample_webhook_event)
+        assert data.start_time is data.start_time
+        assert data.platform_tags is data.platform_tags
+
+    def test_has_no_instance_dict(self, sample_webhook_event):
+        """Test instances use slots rather than a per-instance __dict__."""
+        data = TelnyxRecordingData(sample_webhook_event)
+        assert not hasattr(data, "__dict__")
+
 
 class TestTelnyxVconBuilder:
     """Tests for TelnyxVconBuilder class."""
@@ -181,12 +205,13 @@ class TestTelnyxVconBuilder:
         """Test adapter source tag."""
         assert builder.ADAPTER_SOURCE == "telnyx_adapter"
 
-    @patch("adapters.telnyx.builder.requests.get")
+    @patch("adapters.telnyx.builder._SESSION.get")
     def test_download_recording(self, mock_get, builder, sample_recording_data):
         """Test downloading recording."""
         mock_response = MagicMock()
-        mock_response.content = b"fake audio data"
-        mock_response.raise_for_status = MagicMock()
+        mock_response.headers = {"Content-Length": "15"}
+        mock_response.iter_content.return_value = [b"fake ", b"audio data"]
+        mock_response.__enter__.return_value = mock_response
         mock_get.return_value = mock_response
 
         result = builder._download_recording(sample_recording_data)
@@ -197,13 +222,14 @@ class TestTelnyxVconBuilder:
         assert "Authorization" in call_kwargs["headers"]
         assert call_kwargs["headers"]["Authorization"] == "Bearer test-api-key"
 
-    @patch("adapters.telnyx.builder.requests.get")
+    @patch("adapters.telnyx.builder._SESSION.get")
     def test_download_recording_no_api_key(self, mock_get, sample_recording_data):
         """Test downloading without API key."""
         builder = TelnyxVconBuilder(api_key=None)
         mock_response = MagicMock()
-        mock_response.content = b"fake audio data"
-        mock_response.raise_for_status = MagicMock()
+        mock_response.headers = {"Content-Length": "15"}
+        mock_response.iter_content.return_value = [b"fake ", b"audio data"]
+        mock_response.__enter__.return_value = mock_response
         mock_get.return_value = mock_response
 
         result = builder._download_recording(sample_recording_data)
@@ -212,7 +238,7 @@ class TestTelnyxVconBuilder:
         call_kwargs = mock_get.call_args[1]
         assert "Authorization" not in call_kwargs["headers"]
 
-    @patch("adapters.telnyx.builder.requests.get")
+    @patch("adapters.telnyx.builder._SESSION.get")
     def test_download_recording_no_url(self, mock_get, builder):
         """Test download fails gracefully with no URL."""
         recording_data = TelnyxRecordingData(
@@ -231,6 +257,113 @@ class TestTelnyxVconBuilder:
 
         assert result is None
 
+    @patch("adapters.telnyx.builder._SESSION.get")
+    def test_parallel_download_prefers_configured_format(self, mock_get):
+        """Test the preferred format wins even when both downloads succeed."""
+        builder = TelnyxVconBuilder(recording_format="wav", parallel_downloads=True)
+        recording_data = TelnyxRecordingData(
+            {
+                "payload": {
+                    "recording_id": "rec-123",
+                    "recording_urls": {
+                        "mp3": "https://api.telnyx.com/recordings/rec-123.mp3",
+                        "wav": "https://api.telnyx.com/recordings/rec-123.wav",
+                    },
+                }
+            }
+        )
+
+        def get(url, **kwargs):
+            response = MagicMock()
+            response.headers = {}
+            response.iter_content.return_value = [url.rsplit(".", 1)[1].encode()]
+            response.__enter__.return_value = response
+            return response
+
+        mock_get.side_effect = get
+
+        assert builder._download_recording(recording_data) == b"wav"
+
+    @patch("adapters.telnyx.builder._SESSION.get")
+    def test_parallel_download_falls_back_on_failure(self, mock_get):
+        """Test another format is used when the preferred download fails."""
+        builder = TelnyxVconBuilder(recording_format="wav", parallel_downloads=True)
+        recording_data = TelnyxRecordingData(
+            {
+                "payload": {
+                    "recording_id": "rec-123",
+                    "recording_urls": {
+                        "wav": "https://api.telnyx.com/recordings/rec-123.wav",
+                        "mp3": "https://api.telnyx.com/recordings/rec-123.mp3",
+                    },
+                }
+            }
+        )
+
+        def get(url, **kwargs):
+            if url.endswith(".wav"):
+                raise requests.ConnectionError("timed out")
+            response = MagicMock()
+            response.headers = {}
+            response.iter_content.return_value = [b"mp3 audio"]
+            response.__enter__.return_value = response
+            return response
+
+        mock_get.side_effect = get
+
+        assert builder._download_recording(recording_data) == b"mp3 audio"
+        assert mock_get.call_count == 2
+
+    @patch("adapters.telnyx.builder._SESSION.get")
+    def test_fallback_format_labels_dialog(self, mock_get):
+        """Test a stand-in format sets the dialog MIME type and filename."""
+        builder = TelnyxVconBuilder(recording_format="wav", parallel_downloads=True)
+        recording_data = TelnyxRecordingData(
+            {
+                "payload": {
+                    "recording_id": "rec-123",
+                    "recording_urls": {
+                        "wav": "https://api.telnyx.com/recordings/rec-123.wav",
+                        "mp3": "https://api.telnyx.com/recordings/rec-123.mp3",
+                    },
+                }
+            }
+        )
+
+        def get(url, **kwargs):
+            if url.endswith(".wav"):
+                raise requests.ConnectionError("timed out")
+            response = MagicMock()
+            response.headers = {}
+            response.iter_content.return_value = [b"ID3 mp3 audio"]
+            response.__enter__.return_value = response
+            return response
+
+        mock_get.side_effect = get
+
+        dialog = builder.build(recording_data).dialog[0]
+
+        assert dialog["mimetype"] == "audio/mpeg"
+        assert dialog["filename"] == "rec-123.mp3"
+
+    def test_abandoned_fetch_is_discarded(self, builder):
+        """Test a download abandoned by the race returns nothing."""
+        abandoned = threading.Event()
+        abandoned.set()
+
+        with patch("adapters.telnyx.builder._SESSION.get") as mock_get:
+            assert builder._fetch("rec-123", "https://example.com/a.mp3", abandoned) is None
+        mock_get.assert_not_called()
+
+    def test_close_shuts_down_download_pool(self):
+        """Test close() shuts the parallel download pool down."""
+        builder = TelnyxVconBuilder(parallel_downloads=True)
+
+        builder.close()
+
+        with pytest.raises(RuntimeError):
+            builder._download_pool.submit(print)
+
     def test_build_vcon_structure(self, sample_recording_data):
         """Test building vCon creates proper structure."""
         builder = TelnyxVconBuilder(download_recordings=False)
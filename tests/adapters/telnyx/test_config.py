@@ -2,7 +2,7 @@
 
 import pytest
 
-from adapters.telnyx.config import TelnyxConfig
+from adapters.telnyx.config import TelnyxConfig, get_config
 
 
 class TestTelnyxConfig:
@@ -81,6 +81,18 @@ class TestTelnyxConfig:
 
         assert "Authorization" not in headers
 
+    def test_get_api_headers_cached(self, monkeypatch):
+        """Test get_api_headers returns the same read-only mapping."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        monkeypatch.setenv("TELNYX_API_KEY", "KEY123")
+
+        config = TelnyxConfig()
+        headers = config.get_api_headers()
+
+        assert config.get_api_headers() is headers
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer OTHER"
+
     def test_state_file_default(self, monkeypatch):
         """Test Telnyx-specific state file default."""
         monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
@@ -97,3 +109,26 @@ class TestTelnyxConfig:
         config = TelnyxConfig()
 
         assert config.webhook_url == "https://webhook.example.com/telnyx"
+
+    def test_parallel_downloads(self, monkeypatch):
+        """Test parallel format downloads are opt-in."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        assert TelnyxConfig().parallel_downloads is False
+
+        monkeypatch.setenv("TELNYX_PARALLEL_DOWNLOADS", "true")
+        assert TelnyxConfig().parallel_downloads is True
+
+
+class TestGetConfig:
+    """Tests for the cached get_config factory."""
+
+    def test_returns_cached_instance(self, monkeypatch):
+        """Test repeated calls reuse the first loaded config."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        get_config.cache_clear()
+        try:
+            config = get_config()
+            assert isinstance(config, TelnyxConfig)
+            assert get_config() is config
+        finally:
+            get_config.cache_clear()
@@ -1,8 +1,12 @@
 """Tests for Telnyx webhook endpoints."""
 
+import base64
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 from fastapi.testclient import TestClient
 
 from adapters.telnyx.config import TelnyxConfig
@@ -116,6 +120,40 @@ class TestTelnyxWebhook:
         assert response.status_code == 200
         assert response.text == "OK"
 
+    def test_wrong_type_skips_json_parse(self, config):
+        """Test non-recording events are answered without parsing the body."""
+        app = create_app(config)
+        client = TestClient(app)
+
+        with patch("adapters.telnyx.webhook.orjson.loads") as mock_loads:
+            response = client.post(
+                "/webhook/recording",
+                json={"data": {"event_type": "call.answered", "payload": {}}},
+            )
+
+        assert response.status_code == 200
+        assert response.text == "OK"
+        mock_loads.assert_not_called()
+
+    def test_recording_event_parsed_despite_other_event_types(self, config, sample_recording_event):
+        """Test a recording event is processed even if other event_type keys appear."""
+        sample_recording_event["data"]["payload"]["event_type"] = "call.hangup"
+        with (
+            patch("adapters.telnyx.webhook.HttpPoster") as mock_poster_class,
+            patch("adapters.telnyx.webhook.TelnyxVconBuilder") as mock_builder_class,
+        ):
+            mock_vcon = MagicMock()
+            mock_vcon.uuid = "vcon-uuid-123"
+            mock_builder_class.return_value.build.return_value = mock_vcon
+            mock_poster_class.return_value.post.return_value = True
+
+            app = create_app(config)
+            client = TestClient(app)
+            response = client.post("/webhook/recording", json=sample_recording_event)
+
+            assert response.status_code == 200
+            mock_builder_class.return_value.build.assert_called_once()
+
     def test_recording_event_invalid_json(self, config):
         """Test recording event with invalid JSON."""
         app = create_app(config)
@@ -198,3 +236,71 @@ class TestTelnyxWebhookValidation:
         )
         # Validation should fail or be skipped if no public key
         assert response.status_code in (200, 403)
+
+
+class TestTelnyxWebhookSignature:
+    """Tests for Ed25519 signature verification with a configured public key."""
+
+    @pytest.fixture
+    def private_key(self):
+        """Generate a signing key."""
+        return Ed25519PrivateKey.generate()
+
+    @pytest.fixture
+    def config_with_key(self, monkeypatch, tmp_path, private_key):
+        """Create config with webhook validation and a public key."""
+        public_bytes = private_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        monkeypatch.setenv("STATE_FILE", str(tmp_path / "state.json"))
+        monkeypatch.setenv("VALIDATE_TELNYX_WEBHOOK", "true")
+        monkeypatch.setenv("TELNYX_PUBLIC_KEY", base64.b64encode(public_bytes).decode())
+        return TelnyxConfig()
+
+    def _post(self, app, body, signature, timestamp="1705312170"):
+        client = TestClient(app)
+        return client.post(
+            "/webhook/recording",
+            content=body,
+            headers={
+                "Content-Type": "application/json",
+                "Telnyx-Signature-Ed25519": signature,
+                "Telnyx-Timestamp": timestamp,
+            },
+        )
+
+    def test_valid_signature(self, config_with_key, private_key):
+        """Test a correctly signed webhook is accepted."""
+        body = json.dumps({"data": {"event_type": "call.initiated"}}).encode()
+        signature = base64.b64encode(private_key.sign(b"1705312170." + body)).decode()
+
+        response = self._post(create_app(config_with_key), body, signature)
+
+        assert response.status_code == 200
+
+    def test_tampered_body(self, config_with_key, private_key):
+        """Test a signature over a different body is rejected."""
+        body = json.dumps({"data": {"event_type": "call.initiated"}}).encode()
+        signature = base64.b64encode(private_key.sign(b"1705312170." + body)).decode()
+
+        response = self._post(create_app(config_with_key), body + b" ", signature)
+
+        assert response.status_code == 403
+
+    def test_wrong_length_signature(self, config_with_key, private_key):
+        """Test a signature of the wrong length is rejected before verifying."""
+        body = json.dumps({"data": {"event_type": "call.initiated"}}).encode()
+        signature = base64.b64encode(private_key.sign(b"1705312170." + body)).decode()
+
+        response = self._post(create_app(config_with_key), body, signature + "AAAA")
+
+        assert response.status_code == 403
+
+    def test_invalid_public_key(self, config_with_key, private_key):
+        """Test an undecodable public key rejects every webhook."""
+        config_with_key.telnyx_public_key = "not-a-key"
+        body = json.dumps({"data": {"event_type": "call.initiated"}}).encode()
+        signature = base64.b64encode(private_key.sign(b"1705312170." + body)).decode()
+
+        response = self._post(create_app(config_with_key), body, signature)
+
+        assert response.status_code == 403
@@ -0,0 +1,144 @@
+"""Tests for webhook behaviour shared by the background-processing adapters."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from core.tracker import StateTracker
+
+
+def test_responds_before_processing(webhook_adapter):
+    """Test the webhook is acknowledged before the vCon is built."""
+    order = []
+
+    def build(recording_data):
+        order.append("build")
+        return webhook_adapter.builder.build.return_value
+
+    webhook_adapter.builder.build.side_effect = build
+    app = webhook_adapter.webhook.create_app(webhook_adapter.config)
+    body = json.dumps(webhook_adapter.event).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/webhook/recording",
+        "raw_path": b"/webhook/recording",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("test", 123),
+        "server": ("test", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            order.append("response")
+
+    asyncio.run(app(scope, receive, send))
+
+    assert order == ["response", "build"]
+
+
+@pytest.mark.parametrize("body", [b"[]", b'"x"', b"1"], ids=["array", "string", "number"])
+def test_rejects_non_object_body(webhook_adapter, body):
+    """Test valid JSON that is not an object is refused, not dropped in the background."""
+    client = TestClient(webhook_adapter.webhook.create_app(webhook_adapter.config))
+
+    response = client.post(
+        "/webhook/recording", content=body, headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 400
+    webhook_adapter.builder.build.assert_not_called()
+
+
+def test_concurrent_duplicate_deliveries_build_once(webhook_adapter):
+    """Test a retried delivery waits for the in-flight one instead of rebuilding."""
+    release = threading.Event()
+    mock_builder = webhook_adapter.builder
+    vcon = mock_builder.build.return_value
+
+    def build(recording_data):
+        release.wait(timeout=5)
+        return vcon
+
+    mock_builder.build.side_effect = build
+    app = webhook_adapter.webhook.create_app(webhook_adapter.config)
+    event = webhook_adapter.event
+
+    async def deliver_twice():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.create_task(client.post("/webhook/recording", json=event))
+            while not mock_builder.build.called:
+                await asyncio.sleep(0.01)
+            second = asyncio.create_task(client.post("/webhook/recording", json=event))
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(first, second)
+
+    responses = asyncio.run(deliver_twice())
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert mock_builder.build.call_count == 1
+    assert webhook_adapter.poster.post.call_count == 1
+
+
+def test_lifespan_sizes_default_executor(webhook_adapter, monkeypatch):
+    """Test app startup installs a worker pool sized from config."""
+    monkeypatch.setenv("WORKER_THREADS", "4")
+    webhook = webhook_adapter.webhook
+    config = type(webhook_adapter.config)()
+
+    with (
+        patch.object(webhook, "ThreadPoolExecutor") as pool_class,
+        patch("asyncio.BaseEventLoop.set_default_executor", autospec=True) as set_default,
+        TestClient(webhook.create_app(config)),
+    ):
+        pass
+
+    pool_class.assert_called_once_with(max_workers=4)
+    set_default.assert_called_once()
+    assert set_default.call_args.args[1] is pool_class.return_value
+
+
+def test_shutdown_flushes_buffered_state(webhook_adapter):
+    """Test processed recordings are written to the state file on shutdown."""
+    app = webhook_adapter.webhook.create_app(webhook_adapter.config)
+
+    with TestClient(app) as client:
+        client.post("/webhook/recording", json=webhook_adapter.event)
+
+    with open(webhook_adapter.config.state_file) as f:
+        state = json.load(f)
+    assert state[webhook_adapter.recording_id]["vcon_uuid"] == "vcon-uuid-123"
+
+
+def test_shutdown_closes_tracker(webhook_adapter):
+    """Test the tracker is closed after the final flush on shutdown."""
+    calls = []
+    app = webhook_adapter.webhook.create_app(webhook_adapter.config)
+
+    with (
+        patch.object(
+            StateTracker, "flush", autospec=True, side_effect=lambda _: calls.append("flush")
+        ),
+        patch.object(
+            StateTracker, "close", autospec=True, side_effect=lambda _: calls.append("close")
+        ),
+        TestClient(app),
+    ):
+        pass
+
+    assert calls == ["flush", "close"]
@@ -1,10 +1,13 @@
 """Shared pytest fixtures for telephony adapter tests."""
 
+import copy
+import importlib
 import os
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -45,6 +48,8 @@ def clean_env(monkeypatch):
         "RECORDING_FORMAT",
         "STATE_FILE",
         "INGRESS_LISTS",
+        "WORKER_THREADS",
+        "MAX_CONCURRENT_DOWNLOADS",
     ]
     for var in env_vars:
         monkeypatch.delenv(var, raising=False)
@@ -273,6 +278,8 @@ def temp_state_file():
     yield path
     if Path(path).exists():
         Path(path).unlink()
+    Path(f"{path}.log").unlink(missing_ok=True)
+    Path(f"{path}.log.1").unlink(missing_ok=True)
 
 
 @pytest.fixture
@@ -326,6 +333,91 @@ def mock_failing_poster():
     return poster
 
 
+# =============================================================================
+# Background-Processing Adapter Fixtures
+# =============================================================================
+
+# Adapters that acknowledge webhooks and process them in a background task:
+# package -> (config class, builder class, sample recording event, recording ID)
+BACKGROUND_ADAPTERS: dict[str, tuple[str, str, dict[str, Any], str]] = {
+    "bandwidth": (
+        "BandwidthConfig",
+        "BandwidthVconBuilder",
+        {
+            "eventType": "recordingComplete",
+            "callId": "c-call-abc123",
+            "recordingId": "r-rec-def456",
+            "mediaUrl": "https://voice.bandwidth.com/recordings/media",
+            "from": "+15551234567",
+            "to": "+15559876543",
+        },
+        "r-rec-def456",
+    ),
+    "freeswitch": (
+        "FreeSwitchConfig",
+        "FreeSwitchVconBuilder",
+        {
+            "uuid": "abc123-def456",
+            "caller_id_number": "+15551234567",
+            "destination_number": "+15559876543",
+            "recording_url": "https://fs.example.com/recordings/abc123.wav",
+        },
+        "abc123-def456",
+    ),
+    "telnyx": (
+        "TelnyxConfig",
+        "TelnyxVconBuilder",
+        {
+            "data": {
+                "event_type": "call.recording.saved",
+                "payload": {
+                    "recording_id": "rec-abc123",
+                    "from": "+15551234567",
+                    "to": "+15559876543",
+                    "recording_urls": {"wav": "https://api.telnyx.com/recordings/rec-abc123.wav"},
+                },
+            }
+        },
+        "rec-abc123",
+    ),
+}
+
+
+@pytest.fixture(params=sorted(BACKGROUND_ADAPTERS))
+def webhook_adapter(request, monkeypatch, tmp_path):
+    """Background-processing adapter with a mocked builder and poster.
+
+    Parametrized over BACKGROUND_ADAPTERS. Yields a namespace with the
+    adapter's webhook module, config, mocked builder and poster, a
+    sample recording event and its recording ID. Builds return a vCon
+    with UUID ``vcon-uuid-123`` and posts succeed.
+    """
+    config_name, builder_name, event, recording_id = BACKGROUND_ADAPTERS[request.param]
+    monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+    monkeypatch.setenv("STATE_FILE", str(tmp_path / "state.json"))
+    monkeypatch.setenv("VALIDATE_TELNYX_WEBHOOK", "false")
+    webhook = importlib.import_module(f"adapters.{request.param}.webhook")
+    config_class = getattr(importlib.import_module(f"adapters.{request.param}.config"), config_name)
+
+    with (
+        patch.object(webhook, "HttpPoster") as mock_poster_class,
+        patch.object(webhook, builder_name) as mock_builder_class,
+    ):
+        mock_builder = mock_builder_class.return_value
+        mock_builder.build.return_value = SimpleNamespace(uuid="vcon-uuid-123")
+        mock_poster = mock_poster_class.return_value
+        mock_poster.post.return_value = True
+
+        yield SimpleNamespace(
+            webhook=webhook,
+            config=config_class(),
+            builder=mock_builder,
+            poster=mock_poster,
+            event=copy.deepcopy(event),
+            recording_id=recording_id,
+        )
+
+
 # =============================================================================
 # Sample Audio Data Fixtures
 # =============================================================================
@@ -4,13 +4,16 @@ import base64
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from adapters.twilio.builder import (
     TwilioRecordingData,
 )
 from adapters.twilio.builder import (
     TwilioVconBuilder as VconBuilder,
 )
-from core.base_builder import MIME_TYPES
+from core.base_builder import MIME_TYPES, _b64encode, first_value, parse_iso_timestamp
+from core.http import DOWNLOAD_TIMEOUT
 
 # =============================================================================
 # TwilioRecordingData Tests
@@ -86,10 +89,18 @@ class TestTwilioRecordingDataEmptyValues:
         assert data.forwarded_from is None
         assert data.caller_city is None
 
-    def test_raw_data_preserved(self, basic_webhook_data):
-        """Raw webhook data is preserved."""
+    def test_has_no_instance_dict(self, basic_webhook_data):
+        """Instances use slots and keep no reference to the raw payload."""
         data = TwilioRecordingData(basic_webhook_data)
-        assert data._raw_data == basic_webhook_data
+        assert not hasattr(data, "__dict__")
+        assert not hasattr(data, "_raw_data")
+
+    def test_platform_tags_built_once(self, full_webhook_data):
+        """Platform tags are built at construction and reused."""
+        data = TwilioRecordingData(full_webhook_data)
+
+        assert data.platform_tags is data.platform_tags
+        assert data.platform_tags["recording_sid"] == data.recording_sid
 
 
 class TestTwilioRecordingDataCallerCalled:
@@ -107,6 +118,20 @@ class TestTwilioRecordingDataCallerCalled:
         assert data.caller == "+15551111111"
         assert data.called == "+15552222222"
 
+    def test_empty_caller_called_fallback_to_from_to(self):
+        """Empty Caller/Called form fields fall back to From/To."""
+        data = TwilioRecordingData(
+            {
+                "From": "+15551111111",
+                "To": "+15552222222",
+                "Caller": "",
+                "Called": "",
+            }
+        )
+
+        assert data.caller == "+15551111111"
+        assert data.called == "+15552222222"
+
     def test_explicit_caller_called(self):
         """Explicit Caller/Called override From/To."""
         data = TwilioRecordingData(
@@ -265,6 +290,12 @@ class TestTwilioRecordingDataStartTime:
         assert start.hour == 10
         assert start.utcoffset().total_seconds() == -5 * 3600
 
+    def test_fallback_start_time_is_stable(self):
+        """Fallback start time is resolved once, not on every access."""
+        data = TwilioRecordingData({})
+
+        assert data.start_time is data.start_time
+
 
 # =============================================================================
 # VconBuilder Tests
@@ -446,6 +477,21 @@ class TestVconBuilderUrlReference:
 
         assert vcon.dialog[0]["url"] == "https://api.twilio.com/recording.wav"
 
+    def test_no_download_attempted_when_disabled(self, builder_no_download):
+        """A builder without downloads never fetches the recording."""
+        data = TwilioRecordingData(
+            {
+                "RecordingSid": "RE123",
+                "RecordingUrl": "https://api.twilio.com/recording",
+            }
+        )
+        with patch.object(builder_no_download, "_download_recording") as mock_download:
+            vcon = builder_no_download.build(data)
+
+        mock_download.assert_not_called()
+        assert "body" not in vcon.dialog[0]
+        assert "duration" not in vcon.dialog[0]
+
     def test_url_reference_mp3_format(self, builder_mp3):
         """URL reference uses configured format."""
         data = TwilioRecordingData(
@@ -489,10 +535,11 @@ class TestVconBuilderDownload:
             }
         )
 
-        with patch("twilio_adapter.builder.requests.get") as mock_get:
+        with patch("adapters.twilio.builder._SESSION.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.content = sample_audio_bytes
+            mock_response.iter_content.return_value = [sample_audio_bytes]
+            mock_response.__enter__.return_value = mock_response
             mock_get.return_value = mock_response
 
             vcon = builder_with_auth.build(data)
@@ -513,9 +560,10 @@ class TestVconBuilderDownload:
             }
         )
 
-        with patch("twilio_adapter.builder.requests.get") as mock_get:
+        with patch("adapters.twilio.builder._SESSION.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
+            mock_response.__enter__.return_value = mock_response
             mock_get.return_value = mock_response
 
             vcon = builder_with_auth.build(data)
@@ -533,7 +581,7 @@ class TestVconBuilderDownload:
             }
         )
 
-        with patch("twilio_adapter.builder.requests.get") as mock_get:
+        with patch("adapters.twilio.builder._SESSION.get") as mock_get:
             mock_get.side_effect = Exception("Connection error")
 
             vcon = builder_with_auth.build(data)
@@ -551,10 +599,11 @@ class TestVconBuilderDownload:
             }
         )
 
-        with patch("twilio_adapter.builder.requests.get") as mock_get:
+        with patch("adapters.twilio.builder._SESSION.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.content = b"audio"
+            mock_response.iter_content.return_value = [b"audio"]
+            mock_response.__enter__.return_value = mock_response
             mock_get.return_value = mock_response
 
             builder_with_auth.build(data)
@@ -574,20 +623,24 @@ class TestVconBuilderDownload:
             }
         )
 
-        with patch("twilio_adapter.builder.requests.get") as mock_get:
+        with patch("adapters.twilio.builder._SESSION.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.content = b"audio"
+            mock_response.iter_content.return_value = [b"audio"]
+            mock_response.__enter__.return_value = mock_response
             mock_get.return_value = mock_response
 
             builder_with_auth.build(data)
 
             mock_get.assert_called_with(
-                "https://api.twilio.com/recording.wav", auth=("AC123", "auth_token"), timeout=60
+                "https://api.twilio.com/recording.wav",
+                auth=("AC123", "auth_token"),
+                timeout=DOWNLOAD_TIMEOUT,
+                stream=True,
             )
 
     def test_download_timeout(self, builder_with_auth):
-        """Download has 60 second timeout."""
+        """Download has a 60 second read timeout."""
         data = TwilioRecordingData(
             {
                 "RecordingSid": "RE123",
@@ -597,16 +650,39 @@ class TestVconBuilderDownload:
             }
         )
 
-        with patch("twilio_adapter.builder.requests.get") as mock_get:
+        with patch("adapters.twilio.builder._SESSION.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.content = b"audio"
+            mock_response.iter_content.return_value = [b"audio"]
+            mock_response.__enter__.return_value = mock_response
             mock_get.return_value = mock_response
 
             builder_with_auth.build(data)
 
-            call_kwargs = mock_get.call_args[1]
-            assert call_kwargs["timeout"] == 60
+            connect_timeout, read_timeout = mock_get.call_args[1]["timeout"]
+            assert read_timeout == 60
+
+    def test_download_streams_body(self, builder_with_auth):
+        """Download streams the body and joins chunks into one buffer."""
+        data = TwilioRecordingData(
+            {
+                "RecordingSid": "RE123",
+                "RecordingUrl": "https://api.twilio.com/recording",
+            }
+        )
+
+        with patch("adapters.twilio.builder._SESSION.get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.headers = {"Content-Length": "10"}
+            mock_response.iter_content.return_value = [b"fake ", b"audio"]
+            mock_response.__enter__.return_value = mock_response
+            mock_get.return_value = mock_response
+
+            result = builder_with_auth._download_recording(data)
+
+            assert result == b"fake audio"
+            assert mock_get.call_args[1]["stream"] is True
 
 
 class TestVconBuilderTags:
@@ -686,6 +762,11 @@ class TestMimeTypes:
         """MP3 MIME type is correct."""
         assert MIME_TYPES["mp3"] == "audio/mpeg"
 
+    def test_mime_types_read_only(self):
+        """The shared mapping cannot be mutated."""
+        with pytest.raises(TypeError):
+            MIME_TYPES["ogg"] = "audio/ogg"
+
     def test_unsupported_format_fallback(self, builder_no_download):
         """Unsupported format falls back to audio/wav."""
         builder = VconBuilder(download_recordings=False, recording_format="unsupported")
@@ -702,6 +783,74 @@ class TestMimeTypes:
         assert vcon.dialog[0]["mimetype"] == "audio/wav"
 
 
+class TestParseIsoTimestamp:
+    """Tests for ISO-8601 timestamp parsing."""
+
+    def test_utc_seconds(self):
+        """Z-suffixed second-precision timestamp is parsed."""
+        assert parse_iso_timestamp("2024-01-15T10:30:00Z") == datetime(
+            2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc
+        )
+
+    def test_utc_milliseconds(self):
+        """Z-suffixed millisecond-precision timestamp is parsed."""
+        assert parse_iso_timestamp("2024-01-15T10:30:00.250Z") == datetime(
+            2024, 1, 15, 10, 30, 0, 250000, tzinfo=timezone.utc
+        )
+
+    def test_offset_falls_back(self):
+        """Non-UTC offsets go through fromisoformat."""
+        result = parse_iso_timestamp("2024-01-15T10:30:00.123456+02:00")
+        assert result == datetime(2024, 1, 15, 8, 30, 0, 123456, tzinfo=timezone.utc)
+
+    def test_utc_microseconds_falls_back(self):
+        """Z-suffixed timestamps outside the fast path keep their UTC offset."""
+        assert parse_iso_timestamp("2024-01-15T10:30:00.123456Z") == datetime(
+            2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone.utc
+        )
+
+    def test_invalid_raises(self):
+        """Malformed timestamps raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_iso_timestamp("2024-13-15T10:30:00Z")
+        with pytest.raises(ValueError):
+            parse_iso_timestamp("not a timestamp")
+
+
+class TestFirstValue:
+    """Tests for first_value helper."""
+
+    def test_returns_first_present_key(self):
+        """The first key with a value wins."""
+        assert first_value({"b": "2", "c": "3"}, ("a", "b", "c")) == "2"
+
+    def test_skips_none_values(self):
+        """Keys mapped to None are treated as absent."""
+        assert first_value({"a": None, "b": "2"}, ("a", "b")) == "2"
+
+    def test_keeps_falsy_values(self):
+        """Empty strings and zeros are real values."""
+        assert first_value({"a": 0, "b": 5}, ("a", "b")) == 0
+
+    def test_default(self):
+        """Default is returned when no key matches."""
+        assert first_value({}, ("a", "b")) == ""
+        assert first_value({}, ("a",), None) is None
+
+
+class TestB64Encode:
+    """Tests for the base64 encoder used for embedded recordings."""
+
+    def test_matches_stdlib(self):
+        """Output matches the stdlib encoder for every input length mod 3."""
+        for data in (b"", b"a", b"ab", b"abc", bytes(range(256)) * 3):
+            assert _b64encode(data) == base64.b64encode(data).decode("ascii")
+
+    def test_accepts_bytearray(self):
+        """Buffers returned by read_content are encoded directly."""
+        assert _b64encode(bytearray(b"fake audio")) == "ZmFrZSBhdWRpbw=="
+
+
 class TestVconBuilderEdgeCases:
     """Tests for edge cases in VconBuilder."""
 
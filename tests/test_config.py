@@ -2,10 +2,12 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from adapters.twilio.config import TwilioConfig as Config
+from adapters.twilio.config import get_config
 
 
 class TestConfigRequired:
@@ -63,6 +65,14 @@ class TestConfigDefaults:
         """Log level defaults to INFO."""
         assert minimal_config.log_level == "INFO"
 
+    def test_worker_threads_default(self, minimal_config):
+        """Worker thread pool defaults to 32 threads."""
+        assert minimal_config.worker_threads == 32
+
+    def test_max_concurrent_downloads_default(self, minimal_config):
+        """Concurrent recording downloads default to 8."""
+        assert minimal_config.max_concurrent_downloads == 8
+
     def test_validate_signature_default_true(self, clean_env):
         """Signature validation defaults to true (requires token)."""
         clean_env.setenv("CONSERVER_URL", "https://example.com/vcons")
@@ -77,7 +87,7 @@ class TestConfigDefaults:
 
     def test_ingress_lists_default_empty(self, minimal_config):
         """Ingress lists defaults to empty list."""
-        assert minimal_config.ingress_lists == []
+        assert minimal_config.ingress_lists == ()
 
     def test_conserver_header_name_default(self, minimal_config):
         """Conserver header name has default value."""
@@ -116,6 +126,18 @@ class TestConfigCustomValues:
         config = Config()
         assert config.log_level == "DEBUG"
 
+    def test_custom_worker_threads(self, minimal_env):
+        """Custom worker thread count is parsed as int."""
+        minimal_env.setenv("WORKER_THREADS", "8")
+        config = Config()
+        assert config.worker_threads == 8
+
+    def test_custom_max_concurrent_downloads(self, minimal_env):
+        """Custom download concurrency is parsed as int."""
+        minimal_env.setenv("MAX_CONCURRENT_DOWNLOADS", "2")
+        config = Config()
+        assert config.max_concurrent_downloads == 2
+
     def test_custom_state_file(self, minimal_env):
         """Custom state file path is respected."""
         minimal_env.setenv("STATE_FILE", "/var/lib/adapter/state.json")
@@ -176,7 +198,9 @@ class TestConfigRecordingFormat:
 class TestConfigBooleanParsing:
     """Tests for boolean configuration parsing."""
 
-    @pytest.mark.parametrize("value", ["true", "True", "TRUE", "1", "yes", "Yes", "YES"])
+    @pytest.mark.parametrize(
+        "value", ["true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "ON", "y", "Y"]
+    )
     def test_truthy_values_for_download_recordings(self, minimal_env, value):
         """Various truthy values are recognized."""
         minimal_env.setenv("DOWNLOAD_RECORDINGS", value)
@@ -213,31 +237,31 @@ class TestConfigIngressLists:
         """Single ingress list is parsed correctly."""
         minimal_env.setenv("INGRESS_LISTS", "transcription")
         config = Config()
-        assert config.ingress_lists == ["transcription"]
+        assert config.ingress_lists == ("transcription",)
 
     def test_multiple_ingress_lists(self, minimal_env):
         """Multiple ingress lists are parsed correctly."""
         minimal_env.setenv("INGRESS_LISTS", "list1,list2,list3")
         config = Config()
-        assert config.ingress_lists == ["list1", "list2", "list3"]
+        assert config.ingress_lists == ("list1", "list2", "list3")
 
     def test_ingress_lists_with_spaces(self, minimal_env):
         """Whitespace is trimmed from ingress lists."""
         minimal_env.setenv("INGRESS_LISTS", " list1 , list2 , list3 ")
         config = Config()
-        assert config.ingress_lists == ["list1", "list2", "list3"]
+        assert config.ingress_lists == ("list1", "list2", "list3")
 
     def test_empty_ingress_lists(self, minimal_env):
         """Empty string results in empty list."""
         minimal_env.setenv("INGRESS_LISTS", "")
         config = Config()
-        assert config.ingress_lists == []
+        assert config.ingress_lists == ()
 
     def test_ingress_lists_with_empty_elements(self, minimal_env):
         """Empty elements are filtered out."""
         minimal_env.setenv("INGRESS_LISTS", "list1,,list2,,,list3")
         config = Config()
-        assert config.ingress_lists == ["list1", "list2", "list3"]
+        assert config.ingress_lists == ("list1", "list2", "list3")
 
 
 class TestConfigGetHeaders:
@@ -268,6 +292,14 @@ class TestConfigGetHeaders:
 
         assert headers == {"Content-Type": "application/json", "X-API-Key": "token123"}
 
+    def test_headers_built_once(self, minimal_config):
+        """The same read-only headers are returned on every call."""
+        headers = minimal_config.get_headers()
+
+        assert minimal_config.get_headers() is headers
+        with pytest.raises(TypeError):
+            headers["X-Extra"] = "value"
+
 
 class TestConfigGetTwilioAuth:
     """Tests for get_twilio_auth() method."""
@@ -338,6 +370,14 @@ class TestConfigFromEnvFile:
         finally:
             Path(env_file).unlink()
 
+    def test_env_file_parsed_once(self, minimal_env):
+        """Repeated configs do not re-read the same .env file."""
+        with patch("core.base_config.load_dotenv") as mock_load_dotenv:
+            Config(env_file="/nonexistent/parsed-once.env")
+            Config(env_file="/nonexistent/parsed-once.env")
+
+        mock_load_dotenv.assert_called_once_with("/nonexistent/parsed-once.env")
+
 
 class TestConfigFullConfiguration:
     """Tests for full configuration with all options."""
@@ -356,7 +396,7 @@ class TestConfigFullConfiguration:
         assert full_config.log_level == "DEBUG"
         assert full_config.download_recordings is True
         assert full_config.recording_format == "mp3"
-        assert full_config.ingress_lists == ["list1", "list2", "list3"]
+        assert full_config.ingress_lists == ("list1", "list2", "list3")
 
     def test_full_config_headers(self, full_config):
         """Full config produces correct headers."""
@@ -367,3 +407,19 @@ class TestConfigFullConfiguration:
         """Full config produces correct Twilio auth."""
         auth = full_config.get_twilio_auth()
         assert auth == ("AC1234567890abcdef", "auth_token_12345")
+
+
+class TestGetConfig:
+    """Tests for the cached get_config factory."""
+
+    def test_returns_cached_instance(self, monkeypatch):
+        """Test repeated calls reuse the first loaded config."""
+        monkeypatch.setenv("CONSERVER_URL", "https://conserver.example.com/vcon")
+        monkeypatch.setenv("VALIDATE_TWILIO_SIGNATURE", "false")
+        get_config.cache_clear()
+        try:
+            config = get_config()
+            assert isinstance(config, Config)
+            assert get_config() is config
+        finally:
+            get_config.cache_clear()
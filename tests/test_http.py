@@ -0,0 +1,120 @@
+"""Tests for shared HTTP session configuration."""
+
+import threading
+from unittest.mock import MagicMock
+
+from requests.adapters import HTTPAdapter
+
+from core.http import (
+    MAX_PREALLOCATE,
+    RETRY_STATUS_CODES,
+    create_session,
+    get_session,
+    read_content,
+)
+
+
+class TestCreateSession:
+    """Tests for create_session factory."""
+
+    def test_mounts_pooled_adapter_for_both_schemes(self):
+        """Both http and https share a pooled adapter."""
+        session = create_session(pool_connections=4, pool_maxsize=8)
+
+        http_adapter = session.get_adapter("http://example.com")
+        https_adapter = session.get_adapter("https://example.com")
+
+        assert isinstance(http_adapter, HTTPAdapter)
+        assert http_adapter is https_adapter
+        assert http_adapter._pool_connections == 4
+        assert http_adapter._pool_maxsize == 8
+
+    def test_retry_configuration(self):
+        """Retries cover transient statuses and return the final response."""
+        session = create_session(retries=5, backoff_factor=0.5)
+        retry = session.get_adapter("https://example.com").max_retries
+
+        assert retry.total == 5
+        assert retry.backoff_factor == 0.5
+        assert set(retry.status_forcelist) == set(RETRY_STATUS_CODES)
+        assert retry.raise_on_status is False
+
+
+class TestGetSession:
+    """Tests for the process-wide session."""
+
+    def test_downloads_and_posts_share_session(self):
+        """Builders and the poster draw on the same pooled session."""
+        from adapters.telnyx import builder
+        from core import poster
+
+        assert get_session() is get_session()
+        assert builder._SESSION is poster._SESSION is get_session()
+
+
+class TestReadContent:
+    """Tests for read_content helper."""
+
+    def test_joins_streamed_chunks(self):
+        """Chunks are appended in order into one buffer."""
+        response = MagicMock()
+        response.headers = {}
+        response.iter_content.return_value = [b"abc", b"", b"def"]
+
+        assert read_content(response, chunk_size=3) == b"abcdef"
+        response.iter_content.assert_called_once_with(3)
+
+    def test_preallocates_from_content_length(self):
+        """A body matching Content-Length fills the preallocated buffer."""
+        response = MagicMock()
+        response.headers = {"Content-Length": "6"}
+        response.iter_content.return_value = [b"abc", b"def"]
+
+        assert read_content(response) == b"abcdef"
+
+    def test_body_longer_than_content_length(self):
+        """A body longer than advertised is still read in full."""
+        response = MagicMock()
+        response.headers = {"Content-Length": "4"}
+        response.iter_content.return_value = [b"abc", b"def"]
+
+        assert read_content(response) == b"abcdef"
+
+    def test_body_shorter_than_content_length(self):
+        """Unused preallocated space is trimmed."""
+        response = MagicMock()
+        response.headers = {"Content-Length": "100"}
+        response.iter_content.return_value = [b"abc", b"def"]
+
+        assert read_content(response) == b"abcdef"
+
+    def test_negative_content_length(self):
+        """A negative Content-Length is ignored rather than raising."""
+        response = MagicMock()
+        response.headers = {"Content-Length": "-5"}
+        response.iter_content.return_value = [b"abc", b"def"]
+
+        assert read_content(response) == b"abcdef"
+
+    def test_oversized_content_length(self):
+        """A Content-Length above the cap is not preallocated."""
+        response = MagicMock()
+        response.headers = {"Content-Length": str(MAX_PREALLOCATE * 1024)}
+        response.iter_content.return_value = [b"abc", b"def"]
+
+        assert read_content(response) == b"abcdef"
+
+    def test_stop_ends_read_early(self):
+        """A set stop event ends the read before the next chunk."""
+        stop = threading.Event()
+        response = MagicMock()
+        response.headers = {}
+
+        def chunks():
+            yield b"abc"
+            stop.set()
+            yield b"def"
+
+        response.iter_content.return_value = chunks()
+
+        assert read_content(response, stop=stop) == b"abc"
@@ -2,8 +2,10 @@
 
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 from vcon import Vcon
+from vcon.party import Party
 
 from core.poster import HttpPoster
 
@@ -43,7 +45,7 @@ class TestHttpPosterPost:
         """Successful POST returns True for 200 status."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -57,7 +59,7 @@ class TestHttpPosterPost:
         """Successful POST returns True for 201 status."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 201
             mock_post.return_value = mock_response
@@ -70,7 +72,7 @@ class TestHttpPosterPost:
         """Successful POST returns True for 204 status."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 204
             mock_post.return_value = mock_response
@@ -83,7 +85,7 @@ class TestHttpPosterPost:
         """Failed POST returns False for 400 status."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 400
             mock_response.text = "Bad Request"
@@ -97,7 +99,7 @@ class TestHttpPosterPost:
         """Failed POST returns False for 401 status."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 401
             mock_response.text = "Unauthorized"
@@ -111,7 +113,7 @@ class TestHttpPosterPost:
         """Failed POST returns False for 500 status."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
@@ -125,7 +127,7 @@ class TestHttpPosterPost:
         """Network exception returns False."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_post.side_effect = Exception("Connection refused")
 
             result = basic_poster.post(vcon)
@@ -136,7 +138,7 @@ class TestHttpPosterPost:
         """Timeout exception returns False."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             from requests.exceptions import Timeout
 
             mock_post.side_effect = Timeout("Request timed out")
@@ -153,7 +155,7 @@ class TestHttpPosterRequestFormat:
         """POST goes to the configured URL."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -167,7 +169,7 @@ class TestHttpPosterRequestFormat:
         """POST includes configured headers."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -184,7 +186,7 @@ class TestHttpPosterRequestFormat:
         """POST body contains vCon JSON."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -192,17 +194,17 @@ class TestHttpPosterRequestFormat:
             basic_poster.post(vcon)
 
             call_kwargs = mock_post.call_args[1]
-            # Data should be JSON string
+            # Data should be encoded JSON
             assert "data" in call_kwargs
-            assert isinstance(call_kwargs["data"], str)
+            assert isinstance(call_kwargs["data"], bytes)
             # Should contain the vcon UUID
-            assert vcon.uuid in call_kwargs["data"]
+            assert vcon.uuid.encode() in call_kwargs["data"]
 
     def test_posts_with_timeout(self, basic_poster):
         """POST includes 30 second timeout."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -220,7 +222,7 @@ class TestHttpPosterIngressLists:
         """No ingress lists means no query params."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -237,7 +239,7 @@ class TestHttpPosterIngressLists:
         )
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -251,7 +253,7 @@ class TestHttpPosterIngressLists:
         """Multiple ingress lists are joined with comma."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -270,7 +272,7 @@ class TestHttpPosterStatusCodes:
         """2xx status codes return True."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = status_code
             mock_post.return_value = mock_response
@@ -284,7 +286,7 @@ class TestHttpPosterStatusCodes:
         """3xx status codes return False."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = status_code
             mock_response.text = "Redirect"
@@ -299,7 +301,7 @@ class TestHttpPosterStatusCodes:
         """4xx status codes return False."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = status_code
             mock_response.text = "Client Error"
@@ -314,7 +316,7 @@ class TestHttpPosterStatusCodes:
         """5xx status codes return False."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = status_code
             mock_response.text = "Server Error"
@@ -332,7 +334,7 @@ class TestHttpPosterErrorHandling:
         """Handles connection errors gracefully."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             from requests.exceptions import ConnectionError
 
             mock_post.side_effect = ConnectionError("Connection refused")
@@ -345,7 +347,7 @@ class TestHttpPosterErrorHandling:
         """Handles SSL errors gracefully."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             from requests.exceptions import SSLError
 
             mock_post.side_effect = SSLError("SSL certificate error")
@@ -358,7 +360,7 @@ class TestHttpPosterErrorHandling:
         """Handles long error response text (truncated in logs)."""
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 400
             mock_response.text = "x" * 1000  # Very long error message
@@ -369,25 +371,41 @@ class TestHttpPosterErrorHandling:
             # Should not raise, just return False
             assert result is False
 
+    def test_logs_bounded_error_preview(self, basic_poster, caplog):
+        """Only the first 200 bytes of an error body are decoded and logged."""
+        vcon = Vcon.build_new()
+
+        with patch("core.poster._SESSION.post") as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 502
+            mock_response.content = b"y" * 199 + "\u00e9".encode() + b"z" * 1000
+            mock_post.return_value = mock_response
+
+            with caplog.at_level("ERROR", logger="core.poster"):
+                assert basic_poster.post(vcon) is False
+
+        message = caplog.records[-1].getMessage()
+        assert "y" * 199 + "\ufffd" in message
+        assert "z" not in message
+
 
 class TestHttpPosterVconSerialization:
     """Tests for vCon serialization."""
 
-    def test_vcon_to_json_called(self, basic_poster):
-        """vCon.to_json() is called for serialization."""
+    def test_serializes_full_vcon(self, basic_poster):
+        """Posted body round-trips to the same dict as vCon.to_dict()."""
         vcon = Vcon.build_new()
+        vcon.add_party(Party(tel="+15551234567", name="Caller"))
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
 
-            # Spy on to_json
-            original_to_json = vcon.to_json
-            with patch.object(vcon, "to_json", wraps=original_to_json) as mock_to_json:
-                basic_poster.post(vcon)
+            basic_poster.post(vcon)
 
-                mock_to_json.assert_called_once()
+            posted = orjson.loads(mock_post.call_args[1]["data"])
+            assert posted == vcon.to_dict()
 
     def test_posts_valid_json(self, basic_poster):
         """Posted data is valid JSON."""
@@ -395,7 +413,7 @@ class TestHttpPosterVconSerialization:
 
         vcon = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -416,7 +434,7 @@ class TestHttpPosterMultiplePosts:
         """Multiple successful posts all return True."""
         vcons = [Vcon.build_new() for _ in range(5)]
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -430,7 +448,7 @@ class TestHttpPosterMultiplePosts:
         """Mixed success and failure posts return correct results."""
         vcons = [Vcon.build_new() for _ in range(3)]
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_post.side_effect = [
                 MagicMock(status_code=200),
                 MagicMock(status_code=500, text="Error"),
@@ -446,7 +464,7 @@ class TestHttpPosterMultiplePosts:
         vcon1 = Vcon.build_new()
         vcon2 = Vcon.build_new()
 
-        with patch("core.poster.requests.post") as mock_post:
+        with patch("core.poster._SESSION.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_post.return_value = mock_response
@@ -456,8 +474,8 @@ class TestHttpPosterMultiplePosts:
 
             # First call should have vcon1 UUID
             first_call_data = mock_post.call_args_list[0][1]["data"]
-            assert vcon1.uuid in first_call_data
+            assert vcon1.uuid.encode() in first_call_data
 
             # Second call should have vcon2 UUID
             second_call_data = mock_post.call_args_list[1][1]["data"]
-            assert vcon2.uuid in second_call_data
+            assert vcon2.uuid.encode() in second_call_data
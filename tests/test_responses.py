@@ -0,0 +1,14 @@
+"""Tests for shared response classes."""
+
+from core.responses import OrjsonResponse
+
+
+class TestOrjsonResponse:
+    """Tests for OrjsonResponse."""
+
+    def test_renders_compact_json(self):
+        """Content is serialized with orjson."""
+        response = OrjsonResponse({"status": "healthy", "results": ["success", None]})
+
+        assert response.body == b'{"status":"healthy","results":["success",null]}'
+        assert response.media_type == "application/json"
@@ -1,12 +1,20 @@
 """Comprehensive tests for state tracker module."""
 
+import asyncio
 import json
 import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
-from core.tracker import StateTracker
+from core.tracker import (
+    COMPACT_THRESHOLD,
+    FLUSH_BACKLOG,
+    SqliteStateTracker,
+    StateTracker,
+    create_tracker,
+)
 
 
 class TestStateTrackerInit:
@@ -19,7 +27,7 @@ class TestStateTrackerInit:
         assert tracker.state == {}
 
     def test_creates_state_file_on_first_write(self):
-        """State file is created on first mark_processed call."""
+        """Journal is created on first mark_processed call, state file on flush."""
         fd, path = tempfile.mkstemp(suffix=".json")
         os.close(fd)
         os.unlink(path)  # Delete it so tracker creates it
@@ -29,10 +37,14 @@ class TestStateTrackerInit:
             assert not Path(path).exists()
 
             tracker.mark_processed("RE123", "vcon-123")
+            assert Path(f"{path}.log").exists()
+
+            tracker.flush()
             assert Path(path).exists()
         finally:
             if Path(path).exists():
                 Path(path).unlink()
+            Path(f"{path}.log").unlink(missing_ok=True)
 
     def test_loads_existing_state(self, temp_state_file):
         """Loads existing state from file."""
@@ -120,6 +132,15 @@ class TestStateTrackerMarkProcessed:
 
         assert before <= timestamp <= after
 
+    def test_timestamp_matches_isoformat(self, tracker):
+        """Timestamp text matches datetime.isoformat for the same instant."""
+        now_ns = 1_705_314_600_123_456_789
+        with patch("core.tracker.time.time_ns", return_value=now_ns):
+            tracker.mark_processed("RE123", "vcon-123")
+
+        expected = datetime.fromtimestamp(1_705_314_600, timezone.utc).replace(microsecond=123456)
+        assert tracker.state["RE123"]["timestamp"] == expected.isoformat()
+
     def test_updates_existing_entry(self, tracker):
         """Can update an existing entry."""
         tracker.mark_processed("RE123", "vcon-123", status="processing")
@@ -130,6 +151,7 @@ class TestStateTrackerMarkProcessed:
     def test_stores_call_sid(self, tracker, temp_state_file):
         """Call SID is stored when provided."""
         tracker.mark_processed("RE123", "vcon-123", call_sid="CA456")
+        tracker.flush()
 
         with open(temp_state_file) as f:
             data = json.load(f)
@@ -141,6 +163,7 @@ class TestStateTrackerMarkProcessed:
         tracker.mark_processed(
             "RE123", "vcon-123", from_number="+15551234567", to_number="+15559876543"
         )
+        tracker.flush()
 
         with open(temp_state_file) as f:
             data = json.load(f)
@@ -219,6 +242,7 @@ class TestStateTrackerPersistence:
     def test_state_file_is_valid_json(self, tracker, temp_state_file):
         """State file contains valid JSON."""
         tracker.mark_processed("RE123", "vcon-123")
+        tracker.flush()
 
         with open(temp_state_file) as f:
             data = json.load(f)
@@ -226,15 +250,16 @@ class TestStateTrackerPersistence:
         assert isinstance(data, dict)
         assert "RE123" in data
 
-    def test_state_file_is_readable_json(self, tracker, temp_state_file):
-        """State file is human-readable (indented)."""
+    def test_state_file_is_compact_json(self, tracker, temp_state_file):
+        """State file is machine-read, so it is written without indentation."""
         tracker.mark_processed("RE123", "vcon-123")
+        tracker.flush()
 
         with open(temp_state_file) as f:
             content = f.read()
 
-        # Should have indentation (newlines after braces)
-        assert "\n" in content
+        assert "\n" not in content
+        assert json.loads(content)["RE123"]["vcon_uuid"] == "vcon-123"
 
 
 class TestStateTrackerErrorHandling:
@@ -260,6 +285,7 @@ class TestStateTrackerErrorHandling:
             assert tracker.is_processed("RE456")
         finally:
             Path(path).unlink()
+            Path(f"{path}.log").unlink(missing_ok=True)
 
     def test_handles_empty_file(self):
         """Handles empty state file."""
@@ -324,6 +350,160 @@ class TestStateTrackerConcurrency:
             assert tracker.get_vcon_uuid(f"RE{i:03d}") == f"vcon-{i:03d}"
 
 
+class TestStateTrackerJournal:
+    """Tests for the append-only journal."""
+
+    def test_mark_appends_without_rewriting_state_file(self, tracker, temp_state_file):
+        """Marks go to the journal, leaving the state file untouched."""
+        before = Path(temp_state_file).read_text()
+        tracker.mark_processed("RE123", "vcon-123", call_sid="CA456")
+
+        assert Path(temp_state_file).read_text() == before
+        lines = Path(f"{temp_state_file}.log").read_bytes().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["id"] == "RE123"
+        assert record["entry"]["call_sid"] == "CA456"
+
+    def test_replay_keeps_latest_entry(self, temp_state_file):
+        """Replaying the journal keeps the last entry per recording."""
+        tracker1 = StateTracker(temp_state_file)
+        tracker1.mark_processed("RE123", "vcon-123", status="post_failed")
+        tracker1.mark_processed("RE123", "vcon-123", status="success")
+
+        tracker2 = StateTracker(temp_state_file)
+        assert tracker2.get_processing_status("RE123") == "success"
+        assert len(tracker2.state) == 1
+
+    def test_replay_skips_torn_line(self, temp_state_file):
+        """A partially written final line is ignored."""
+        tracker1 = StateTracker(temp_state_file)
+        tracker1.mark_processed("RE123", "vcon-123")
+        with open(f"{temp_state_file}.log", "ab") as f:
+            f.write(b'{"id": "RE4')
+
+        tracker2 = StateTracker(temp_state_file)
+        assert tracker2.is_processed("RE123")
+        assert len(tracker2.state) == 1
+
+    def test_flush_compacts_journal(self, tracker, temp_state_file):
+        """flush() folds the journal into the state file and removes it."""
+        tracker.mark_processed("RE123", "vcon-123")
+        tracker.flush()
+
+        assert not Path(f"{temp_state_file}.log").exists()
+        assert StateTracker(temp_state_file).is_processed("RE123")
+
+    def test_snapshot_written_outside_lock(self, tracker, temp_state_file):
+        """Marks can proceed while the snapshot is written."""
+        tracker.mark_processed("RE123", "vcon-123")
+        write_bytes = Path.write_bytes
+        lock_free = []
+
+        def checked_write(path, data):
+            acquired = tracker._lock.acquire(blocking=False)
+            if acquired:
+                tracker._lock.release()
+            lock_free.append(acquired)
+            return write_bytes(path, data)
+
+        with patch.object(Path, "write_bytes", autospec=True, side_effect=checked_write):
+            tracker.flush()
+
+        assert lock_free == [True]
+        assert StateTracker(temp_state_file).is_processed("RE123")
+
+    def test_failed_save_keeps_journal_replayable(self, tracker, temp_state_file):
+        """Marks survive a failed snapshot write via the rotated journal."""
+        tracker.mark_processed("RE123", "vcon-123")
+        with patch("core.tracker.os.replace", side_effect=OSError("disk full")):
+            tracker.flush()
+        tracker.mark_processed("RE456", "vcon-456")
+        with patch("core.tracker.os.replace", side_effect=OSError("disk full")):
+            tracker.flush()
+
+        reloaded = StateTracker(temp_state_file)
+        assert reloaded.is_processed("RE123")
+        assert reloaded.is_processed("RE456")
+
+        reloaded.flush()
+        assert not Path(f"{temp_state_file}.log.1").exists()
+        assert StateTracker(temp_state_file).is_processed("RE456")
+
+    def test_close_releases_journal(self, tracker, temp_state_file):
+        """close() closes the journal handle; a later mark reopens it."""
+        tracker.mark_processed("RE123", "vcon-123")
+        journal = tracker._journal
+
+        tracker.close()
+
+        assert journal.closed
+        tracker.mark_processed("RE456", "vcon-456")
+        assert StateTracker(temp_state_file).is_processed("RE456")
+
+    def test_compacts_at_threshold(self, tracker, temp_state_file):
+        """A long journal is compacted automatically."""
+        for i in range(COMPACT_THRESHOLD):
+            tracker.mark_processed(f"RE{i:04d}", f"vcon-{i:04d}")
+
+        assert not Path(f"{temp_state_file}.log").exists()
+        with open(temp_state_file) as f:
+            assert len(json.load(f)) == COMPACT_THRESHOLD
+
+
+class TestStateTrackerBuffered:
+    """Tests for buffered marks and the background flusher."""
+
+    def test_buffered_mark_is_visible_but_not_written(self, tracker, temp_state_file):
+        """Buffered marks update memory without touching the file."""
+        before = Path(temp_state_file).read_text()
+        tracker.mark_processed_buffered("RE123", "vcon-123", status="success")
+
+        assert tracker.is_processed("RE123")
+        assert Path(temp_state_file).read_text() == before
+
+    def test_flush_writes_buffered_marks(self, tracker, temp_state_file):
+        """flush() persists buffered marks."""
+        tracker.mark_processed_buffered("RE123", "vcon-123", call_sid="CA123")
+        tracker.flush()
+        tracker.flush()
+
+        with open(temp_state_file) as f:
+            data = json.load(f)
+        assert data["RE123"]["vcon_uuid"] == "vcon-123"
+        assert data["RE123"]["call_sid"] == "CA123"
+        assert not Path(f"{temp_state_file}.tmp").exists()
+
+    def test_flusher_writes_on_interval(self, tracker, temp_state_file):
+        """The background flusher persists marks without an explicit flush."""
+
+        async def run():
+            flusher = asyncio.create_task(tracker.run_flusher(interval=0.01))
+            await asyncio.sleep(0)
+            tracker.mark_processed_buffered("RE123", "vcon-123")
+            await asyncio.sleep(0.1)
+            flusher.cancel()
+
+        asyncio.run(run())
+
+        assert StateTracker(temp_state_file).is_processed("RE123")
+
+    def test_flusher_wakes_on_backlog(self, tracker, temp_state_file):
+        """A full backlog is flushed before the interval elapses."""
+
+        async def run():
+            flusher = asyncio.create_task(tracker.run_flusher(interval=60))
+            await asyncio.sleep(0)
+            for i in range(FLUSH_BACKLOG):
+                tracker.mark_processed_buffered(f"RE{i:03d}", f"vcon-{i:03d}")
+            await asyncio.sleep(0.1)
+            flusher.cancel()
+
+        asyncio.run(run())
+
+        assert len(StateTracker(temp_state_file).state) == FLUSH_BACKLOG
+
+
 class TestStateTrackerStateFileFormat:
     """Tests for state file format."""
 
@@ -337,6 +517,7 @@ class TestStateTrackerStateFileFormat:
             from_number="+15551234567",
             to_number="+15559876543",
         )
+        tracker.flush()
 
         with open(temp_state_file) as f:
             data = json.load(f)
@@ -352,6 +533,7 @@ class TestStateTrackerStateFileFormat:
     def test_minimal_entry_format(self, tracker, temp_state_file):
         """Minimal entry has required fields."""
         tracker.mark_processed("RE123", "vcon-123")
+        tracker.flush()
 
         with open(temp_state_file) as f:
             data = json.load(f)
@@ -364,6 +546,7 @@ class TestStateTrackerStateFileFormat:
     def test_timestamp_is_iso_format(self, tracker, temp_state_file):
         """Timestamp is in ISO format."""
         tracker.mark_processed("RE123", "vcon-123")
+        tracker.flush()
 
         with open(temp_state_file) as f:
             data = json.load(f)
@@ -405,3 +588,70 @@ class TestStateTrackerEdgeCases:
         long_sid = "RE" + "x" * 1000
         tracker.mark_processed(long_sid, "vcon-123")
         assert tracker.is_processed(long_sid)
+
+
+class TestSqliteStateTracker:
+    """Tests for the SQLite-backed tracker."""
+
+    def test_mark_and_lookup(self, tmp_path):
+        """Marked recordings are found with their status and metadata."""
+        tracker = SqliteStateTracker(str(tmp_path / "state.db"))
+
+        assert not tracker.is_processed("RE123")
+        assert tracker.get_metadata("RE123") is None
+
+        tracker.mark_processed("RE123", "vcon-123", status="post_failed", call_sid="CA1")
+
+        assert tracker.is_processed("RE123")
+        assert tracker.get_vcon_uuid("RE123") == "vcon-123"
+        assert tracker.get_processing_status("RE123") == "post_failed"
+        assert tracker.get_metadata("RE123")["call_sid"] == "CA1"
+
+    def test_mark_replaces_existing(self, tmp_path):
+        """Marking a recording again replaces its entry."""
+        tracker = SqliteStateTracker(str(tmp_path / "state.db"))
+
+        tracker.mark_processed("RE123", "", status="build_failed")
+        tracker.mark_processed_buffered("RE123", "vcon-123")
+
+        assert tracker.get_processing_status("RE123") == "success"
+        assert tracker.get_vcon_uuid("RE123") == "vcon-123"
+
+    def test_persists_without_flush(self, tmp_path):
+        """Marks are committed immediately and survive a restart."""
+        path = str(tmp_path / "state.db")
+        tracker = SqliteStateTracker(path)
+        tracker.mark_processed_buffered("RE123", "vcon-123")
+        tracker.close()
+
+        assert SqliteStateTracker(path).get_vcon_uuid("RE123") == "vcon-123"
+
+    def test_shared_between_instances(self, tmp_path):
+        """Two trackers on one database see each other's marks."""
+        path = str(tmp_path / "state.db")
+        first = SqliteStateTracker(path)
+        second = SqliteStateTracker(path)
+
+        first.mark_processed("RE123", "vcon-123")
+
+        assert second.is_processed("RE123")
+
+    def test_flusher_returns_immediately(self, tmp_path):
+        """The flusher has nothing to do and exits."""
+        tracker = SqliteStateTracker(str(tmp_path / "state.db"))
+
+        asyncio.run(asyncio.wait_for(tracker.run_flusher(), timeout=1))
+        tracker.flush()
+
+
+class TestCreateTracker:
+    """Tests for create_tracker factory."""
+
+    def test_sqlite_suffixes(self, tmp_path):
+        """Database suffixes select the SQLite tracker."""
+        for name in ("state.db", "state.sqlite", "state.SQLITE3"):
+            assert isinstance(create_tracker(str(tmp_path / name)), SqliteStateTracker)
+
+    def test_json_default(self, tmp_path):
+        """Other paths select the JSON tracker."""
+        assert isinstance(create_tracker(str(tmp_path / "state.json")), StateTracker)
@@ -1,9 +1,11 @@
 """Comprehensive tests for webhook module."""
 
+import asyncio
 import uuid
 from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
+from twilio.request_validator import RequestValidator
 
 from adapters.twilio.config import TwilioConfig as Config
 from adapters.twilio.webhook import create_app
@@ -88,6 +90,12 @@ class TestRecordingWebhookBasic:
 
         assert response.status_code == 200
 
+    def test_rejects_missing_recording_sid(self, test_client):
+        """Returns 422 when RecordingSid is absent."""
+        response = test_client.post("/webhook/recording", data={"RecordingStatus": "completed"})
+
+        assert response.status_code == 422
+
 
 # =============================================================================
 # Recording Webhook - Status Filtering
@@ -343,6 +351,38 @@ class TestRecordingWebhookFullProcessing:
 
         assert data["status"] == "post_failed"
 
+    @patch("adapters.twilio.webhook.TwilioVconBuilder")
+    @patch("adapters.twilio.webhook.HttpPoster")
+    def test_builds_off_event_loop(self, mock_poster_class, mock_builder_class, mock_config):
+        """Builds the vCon (and downloads the recording) in a worker thread."""
+        loops_seen = []
+
+        def build(recording_data):
+            try:
+                loops_seen.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops_seen.append(None)
+            mock_vcon = MagicMock()
+            mock_vcon.uuid = "vcon-uuid-123"
+            return mock_vcon
+
+        mock_builder_class.return_value.build.side_effect = build
+        mock_poster_class.return_value.post.return_value = True
+
+        app = create_app(mock_config)
+        client = TestClient(app)
+
+        response = client.post(
+            "/webhook/recording",
+            data={
+                "RecordingSid": unique_recording_sid("RE_OFF_LOOP"),
+                "RecordingStatus": "completed",
+            },
+        )
+
+        assert response.status_code == 200
+        assert loops_seen == [None]
+
 
 # =============================================================================
 # Recording Webhook - All Parameters
@@ -616,6 +656,46 @@ class TestTwilioSignatureValidation:
 
         assert response.status_code == 403
 
+    def test_validation_enabled_rejects_missing(self, minimal_env):
+        """With validation enabled, a request without a signature is rejected."""
+        minimal_env.setenv("VALIDATE_TWILIO_SIGNATURE", "true")
+        minimal_env.setenv("TWILIO_AUTH_TOKEN", "test_token_12345")
+
+        app = create_app(Config())
+        client = TestClient(app)
+
+        response = client.post(
+            "/webhook/recording",
+            data={
+                "RecordingSid": "RE_MISSING_SIG",
+                "RecordingStatus": "completed",
+            },
+        )
+
+        assert response.status_code == 403
+
+    def test_validation_enabled_accepts_valid(self, minimal_env):
+        """With validation enabled, a correctly signed request is accepted."""
+        minimal_env.setenv("VALIDATE_TWILIO_SIGNATURE", "true")
+        minimal_env.setenv("TWILIO_AUTH_TOKEN", "test_token_12345")
+        minimal_env.setenv("WEBHOOK_URL", "https://example.com/webhook/recording")
+
+        app = create_app(Config())
+        client = TestClient(app)
+
+        params = {"RecordingSid": "RE_VALID_SIG", "RecordingStatus": "in-progress"}
+        signature = RequestValidator("test_token_12345").compute_signature(
+            "https://example.com/webhook/recording", params
+        )
+
+        response = client.post(
+            "/webhook/recording",
+            data=params,
+            headers={"X-Twilio-Signature": signature},
+        )
+
+        assert response.status_code == 200
+
 
 # =============================================================================
 # Error Handling Tests
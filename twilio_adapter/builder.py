@@ -187,7 +187,7 @@ class VconBuilder:
             if self.download_recordings and recording_data.recording_url:
                 audio_data = self._download_recording(recording_data.recording_url)
                 if audio_data:
-                    audio_base64 = base64.b64encode(audio_data).decode("utf-8")
+                    audio_base64 = base64.b64encode(audio_data).decode("ascii")
                     dialog_kwargs["body"] = audio_base64
                     dialog_kwargs["encoding"] = "base64"
                     dialog_kwargs["filename"] = (
@@ -4,6 +4,8 @@ import os
 
 from dotenv import load_dotenv
 
+from core.base_config import env_bool
+
 
 class Config:
     """Manages configuration from environment variables."""
@@ -22,11 +24,7 @@ class Config:
         # Twilio settings (for signature validation)
         self.twilio_account_sid = os.getenv("TWILIO_ACCOUNT_SID")
         self.twilio_auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-        self.validate_twilio_signature = os.getenv("VALIDATE_TWILIO_SIGNATURE", "true").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.validate_twilio_signature = env_bool("VALIDATE_TWILIO_SIGNATURE", True)
 
         if self.validate_twilio_signature and not self.twilio_auth_token:
             raise ValueError("TWILIO_AUTH_TOKEN is required when VALIDATE_TWILIO_SIGNATURE is true")
@@ -51,11 +49,7 @@ class Config:
         self.ingress_lists = [item.strip() for item in ingress_lists_str.split(",") if item.strip()]
 
         # Recording download settings
-        self.download_recordings = os.getenv("DOWNLOAD_RECORDINGS", "true").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.download_recordings = env_bool("DOWNLOAD_RECORDINGS", True)
 
         # Recording format preference (wav or mp3)
         self.recording_format = os.getenv("RECORDING_FORMAT", "wav").lower()